@@ -0,0 +1,325 @@
+"""Offline-Benchmark für API-Clients, Diagramme und Karten
+
+Startet einen lokalen Stub-Server mit den aufgezeichneten Antworten aus fixtures/,
+leitet alle Clients per Umgebungsvariable darauf um und misst jede Client-Methode,
+jede create_*-Funktion der Seiten und jeden Karten-Builder. Ergebnisse werden mit
+bench/baseline.json verglichen; Regressionen führen zu Exit-Code 1.
+
+    python -m bench.run_benchmarks                    # messen und vergleichen
+    python -m bench.run_benchmarks --update-baseline  # Baseline neu schreiben
+    python -m bench.run_benchmarks -k figure -r 20    # nur Diagramme, 20 Wiederholungen
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+from bench.stub_server import StubServer
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+
+# Regression: Median mehr als TOLERANCE langsamer als die Baseline und mindestens MIN_DELTA_MS
+TOLERANCE = 0.25
+MIN_DELTA_MS = 1.0
+
+
+def load_page(filename):
+    """Seiten-Modul importieren (Dateinamen mit Emojis, main() läuft dabei nicht)"""
+    path = os.path.join(BASE_DIR, 'pages', filename)
+    module_name = 'bench_page_' + filename.split('_')[0]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def page_file(prefix):
+    return next(name for name in sorted(os.listdir(os.path.join(BASE_DIR, 'pages'))) if name.startswith(prefix))
+
+
+def build_cases():
+    """Liste (Gruppe, Name, Funktion); Eingabedaten werden einmal vorab erzeugt"""
+    from utils import space_apis
+    from utils.config import HAMBURG_LAT, HAMBURG_LON
+    from utils.data_context import get_data_context
+    from utils.launch_providers import PROVIDERS, merge_launches
+    from utils.launches import Launch, get_decoded_cache
+    from utils.launch_providers import get_launch_aggregator
+    from utils.mars_photos import ManifestIndex, PHOTO_ROVERS, get_sol_photo_cache, latest_photos, manifest_source
+    from utils.mars_time import sol_calendar
+    from utils.space_weather import FEEDS, SWPCSource, SpaceWeatherIngestor
+    from utils.visibility import night_visibility
+
+    iss = load_page(page_file('1_'))
+    launch = load_page(page_file('2_'))
+    mars = load_page(page_file('3_'))
+    lunar = load_page(page_file('4_'))
+    weather = load_page(page_file('5_'))
+    satellites = load_page(page_file('6_'))
+    deep_space = load_page(page_file('7_'))
+
+    cases = []
+
+    def add(group, name, func):
+        cases.append((group, name, func))
+
+    context = get_data_context()
+
+    def uncached(func, *sources, clear=()):
+        # Seiten-Clients lesen über den Daten-Kontext: ohne Verwerfen der Snapshots würde ab dem
+        # zweiten Lauf nur der Cache-Treffer gemessen statt Abruf (Stub) + Dekodieren
+        def run():
+            for name in sources:
+                context.invalidate(name)
+            for reset in clear:
+                reset()
+            return func()
+        return run
+
+    mars_sources = tuple(manifest_source(rover) for rover in PHOTO_ROVERS)
+    mars_clear = (lambda: context.store.delete('mars_photos'), get_sol_photo_cache().clear)
+
+    # API-Clients (über den Stub)
+    add('client', 'space_apis.fetch_apod', space_apis.fetch_apod)
+    add('client', 'space_apis.fetch_neo_feed', lambda: space_apis.fetch_neo_feed('2025-06-01'))
+    add('client', 'space_apis.fetch_mars_photos', lambda: space_apis.fetch_mars_photos('perseverance', 1000))
+    add('client', 'space_apis.fetch_latest_mars_photos', space_apis.fetch_latest_mars_photos)
+    add('client', 'space_apis.fetch_mars_manifest', lambda: space_apis.fetch_mars_manifest('perseverance'))
+    manifest = space_apis.fetch_mars_manifest('perseverance')
+    add('client', 'ManifestIndex', lambda: ManifestIndex('perseverance', manifest))
+    add('client', 'mars_photos.latest_photos', uncached(latest_photos, *mars_sources, clear=mars_clear))
+    add('client', 'space_apis.fetch_iss_position', space_apis.fetch_iss_position)
+    add('client', 'space_apis.fetch_astronauts', space_apis.fetch_astronauts)
+    add('client', 'space_apis.fetch_iss_passes', lambda: space_apis.fetch_iss_passes(HAMBURG_LAT, HAMBURG_LON))
+    add('client', 'space_apis.fetch_upcoming_launches', space_apis.fetch_upcoming_launches)
+
+    swpc = SWPCSource()
+    for feed, (path, parser) in FEEDS.items():
+        add('client', f"swpc.{feed}", lambda path=path, parser=parser: parser(swpc.load(path)))
+    add('client', 'SpaceWeatherIngestor.ingest_all', SpaceWeatherIngestor().ingest_all)
+
+    tracker = launch.LaunchTracker()
+    upcoming = space_apis.fetch_upcoming_launches()
+    launch_sources = get_launch_aggregator().sources
+    add('client', 'LaunchTracker.get_upcoming_launches',
+        uncached(lambda: tracker.get_upcoming_launches(10), *launch_sources))
+    add('client', 'LaunchTracker.get_recent_launches', uncached(lambda: tracker.get_recent_launches(5), *launch_sources))
+    add('client', 'LaunchTracker.get_rocket_info',
+        uncached(lambda: tracker.get_rocket_info(upcoming[0]['rocket']), 'rockets'))
+    add('client', 'LaunchTracker.get_launchpad_info',
+        uncached(lambda: tracker.get_launchpad_info(upcoming[0]['launchpad']), 'launchpads'))
+    add('client', 'Launch.decode_many', lambda: Launch.decode_many(upcoming))
+    provider_launches = [provider.launches(get_decoded_cache()) for provider in PROVIDERS]
+    add('client', 'merge_launches', lambda: merge_launches(provider_launches))
+
+    iss_tracker = iss.ISSTracker()
+    add('client', 'ISSTracker.get_iss_location', uncached(iss_tracker.get_iss_location, 'iss_position'))
+    add('client', 'ISSTracker.get_astronauts', uncached(iss_tracker.get_astronauts, 'astronauts'))
+    add('client', 'ISSTracker.get_iss_pass_times', uncached(iss_tracker.get_iss_pass_times, 'iss_passes'))
+
+    mars_api = mars.MarsExplorationAPI()
+    add('client', 'MarsExplorationAPI.get_mars_photos', uncached(mars_api.get_mars_photos, *mars_sources, clear=mars_clear))
+
+    deep_space_api = deep_space.DeepSpaceAPI()
+    add('client', 'DeepSpaceAPI.get_nasa_picture_of_day', uncached(deep_space_api.get_nasa_picture_of_day, 'apod'))
+    add('client', 'DeepSpaceAPI.get_asteroid_data', uncached(deep_space_api.get_asteroid_data, 'neo_today'))
+
+    station = weather.WeltraumWetterStation()
+    # Liest nur die gespeicherten Zeitreihen: pro Lauf die Feeds neu einspielen, damit der Client-Pfad
+    # (Abruf, Parsen, Ablage, Auslesen) gemessen wird und nicht nur der Speicher-Treffer
+    station_ingestor = SpaceWeatherIngestor(store=station.store)
+    # Die Station lädt selbst nichts mehr (das macht der Prefetcher): für die Diagramm-Fälle einmal einspielen
+    station_ingestor.ingest_all()
+
+    def weltraum_wetter():
+        station_ingestor.ingest_all()
+        return station.get_weltraum_wetter()
+    add('client', 'WeltraumWetterStation.get_weltraum_wetter', weltraum_wetter)
+
+    # Diagramme
+    upcoming_records = Launch.decode_many(upcoming)
+    add('figure', 'create_launch_timeline', lambda: launch.create_launch_timeline(upcoming_records))
+
+    mars_weather = mars_api.get_mars_weather()
+    timeline = mars_api.get_mars_timeline()
+    add('figure', 'create_temperature_chart', lambda: mars.create_temperature_chart(mars_weather))
+    add('figure', 'create_mission_timeline_chart', lambda: mars.create_mission_timeline_chart(timeline))
+    mission_sol = mars_api.get_mars_clock()['curiosity']['sol']
+    # __wrapped__: ungecacht messen (sonst nur der lru_cache-Treffer)
+    add('figure', 'sol_calendar[curiosity]', lambda: sol_calendar.__wrapped__('curiosity', 0, mission_sol))
+    calendar = sol_calendar('curiosity', 0, mission_sol)
+    add('figure', 'create_sol_calendar_chart', lambda: mars.create_sol_calendar_chart(calendar, 'Curiosity'))
+
+    planets = lunar.LunarPlanetaryTracker().calculate_planet_positions()
+    night = night_visibility()
+    add('figure', 'create_solar_system_plot', lambda: lunar.create_solar_system_plot(planets))
+    add('figure', 'create_planet_altitude_chart', lambda: lunar.create_planet_altitude_chart(night))
+    add('figure', 'create_moon_phase_calendar', lunar.create_moon_phase_calendar)
+
+    weltraum_wetter = station.get_weltraum_wetter()
+    for zeitraum, stunden in (('24 Stunden', 24), ('30 Tage', 720)):
+        verlauf = station.get_sonnenwind_verlauf(stunden)
+        add('figure', f"create_sonnenwind_chart[{zeitraum}]",
+            lambda verlauf=verlauf, zeitraum=zeitraum: weather.create_sonnenwind_chart(verlauf, zeitraum))
+    prognose = station.get_magnetfeld_prognose()
+    add('figure', 'create_kp_index_chart', lambda: weather.create_kp_index_chart(prognose))
+
+    sat_system = satellites.SatellitenNetzwerke()
+    starlink = sat_system.get_starlink_data(50)
+    konstellationen = sat_system.get_satelliten_konstellationen()
+    performance = sat_system.get_netzwerk_performance()
+    add('figure', 'create_constellation_comparison_chart',
+        lambda: satellites.create_constellation_comparison_chart(konstellationen))
+    add('figure', 'create_network_performance_chart', lambda: satellites.create_network_performance_chart(performance))
+
+    add('figure', 'create_discovery_timeline', deep_space.create_discovery_timeline)
+    add('figure', 'create_distance_comparison', deep_space.create_distance_comparison)
+
+    # Karten: Aufbau und HTML-Rendering (das macht folium_static)
+    iss_data = iss_tracker.get_iss_location()
+    gitter = station.get_aurora_karte(weltraum_wetter)
+    staedte = station.get_aurora_wahrscheinlichkeit(weltraum_wetter)
+    maps = {
+        'create_iss_map': lambda: iss.create_iss_map(iss_data),
+        'create_aurora_karte': lambda: weather.create_aurora_karte(gitter, staedte),
+        'create_constellation_coverage_map': lambda: satellites.create_constellation_coverage_map(starlink),
+    }
+    for name, builder in maps.items():
+        add('map', name, builder)
+        built = builder()
+        add('map', f"{name}.render", lambda built=built: built.get_root().render())
+
+    return cases
+
+
+def measure(func, repeat, warmup=1):
+    """Laufzeiten in ms (nach warmup Aufwärmläufen)"""
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return timings
+
+
+def summarize(timings):
+    ordered = sorted(timings)
+    return {
+        'median_ms': round(statistics.median(ordered), 3),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))], 3),
+        'min_ms': round(ordered[0], 3),
+    }
+
+
+def load_baseline(path=BASELINE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'results': {}}
+
+
+def write_baseline(results, path=BASELINE_FILE):
+    baseline = {
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(results, baseline, tolerance=TOLERANCE, min_delta_ms=MIN_DELTA_MS):
+    """Pro Messung: (Status, Faktor gegenüber Baseline oder None)"""
+    verdicts = {}
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            verdicts[key] = ('neu', None)
+            continue
+        factor = result['median_ms'] / max(reference['median_ms'], 1e-6)
+        delta = result['median_ms'] - reference['median_ms']
+        if factor > 1 + tolerance and delta > min_delta_ms:
+            verdicts[key] = ('REGRESSION', factor)
+        elif factor < 1 - tolerance and -delta > min_delta_ms:
+            verdicts[key] = ('schneller', factor)
+        else:
+            verdicts[key] = ('ok', factor)
+    return verdicts
+
+
+def format_report(results, verdicts):
+    lines = [f"{'Messung':<58} {'Median':>10} {'p95':>10} {'vs. Baseline':>14}  Status"]
+    lines.append('-' * len(lines[0]))
+    for key in results:
+        result = results[key]
+        status, factor = verdicts[key]
+        versus = '—' if factor is None else f"x{factor:.2f}"
+        lines.append(f"{key:<58} {result['median_ms']:>8.2f}ms {result['p95_ms']:>8.2f}ms {versus:>14}  {status}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-k', '--filter', default='', help="nur Messungen, deren Name den Text enthält")
+    parser.add_argument('-r', '--repeat', type=int, default=10, help="Wiederholungen pro Messung")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help="erlaubte Verlangsamung (0.25 = 25 %%)")
+    parser.add_argument('--update-baseline', action='store_true', help="Ergebnisse als neue Baseline speichern")
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--output', help="Bericht zusätzlich in diese Datei schreiben")
+    args = parser.parse_args(argv)
+
+    with StubServer() as stub, tempfile.TemporaryDirectory(prefix='cosmic-bench-') as workdir:
+        # Vor dem ersten utils-Import: Clients auf den Stub, Caches/Logs in ein Wegwerf-Verzeichnis
+        os.environ.update(stub.environment())
+        os.environ['DATA_DIR'] = os.path.join(workdir, 'data')
+        os.environ['LOG_DIR'] = os.path.join(workdir, 'logs')
+        os.environ['SPACE_WEATHER_FIXTURES'] = ''
+        os.environ['NASA_API_KEY'] = 'BENCHMARK'
+        # Streamlit-Warnungen ohne laufende App (set_page_config etc.) unterdrücken
+        # (Konfiguration vorher laden, ihr Parsen setzt den Log-Level sonst wieder zurück)
+        from streamlit import config
+        from streamlit.logger import set_log_level
+        config.get_config_options()
+        set_log_level('error')
+
+        cases = build_cases()
+        results = {}
+        for group, name, func in cases:
+            key = f"{group}/{name}"
+            if args.filter and args.filter not in key:
+                continue
+            results[key] = summarize(measure(func, args.repeat))
+
+    if args.update_baseline:
+        previous = load_baseline(args.baseline)['results'] if args.filter else {}
+        write_baseline(dict(previous, **results), args.baseline)
+        print(f"Baseline mit {len(results)} Messungen gespeichert: {args.baseline}")
+
+    verdicts = compare(results, load_baseline(args.baseline)['results'], args.tolerance)
+    report = format_report(results, verdicts)
+    print(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + '\n')
+
+    regressions = [key for key, (status, _) in verdicts.items() if status == 'REGRESSION']
+    if regressions:
+        print(f"\n{len(regressions)} Regression(en): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
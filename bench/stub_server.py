@@ -0,0 +1,140 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+# Bewusst ohne utils-Import: der Runner setzt DATA_DIR & API-URLs erst nach dem Start des Stubs
+FIXTURE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures')
+
+
+def _load(*parts):
+    with open(os.path.join(FIXTURE_ROOT, *parts), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _by_id(items):
+    return {item['id']: item for item in items}
+
+
+class FixtureRoutes:
+    """Pfad -> aufgezeichnete JSON-Antwort; jede Antwort wird beim ersten Abruf serialisiert und gecacht"""
+
+    def __init__(self):
+        self.exact = {
+            '/open-notify/iss-now.json': _load('open_notify', 'iss-now.json'),
+            '/open-notify/astros.json': _load('open_notify', 'astros.json'),
+            '/open-notify/iss-pass.json': _load('open_notify', 'iss-pass.json'),
+            '/spacex/launches/upcoming': _load('spacex', 'launches_upcoming.json'),
+            '/spacex/launches/past': _load('spacex', 'launches_past.json'),
+            '/spacex/launches/latest': _load('spacex', 'launches_latest.json'),
+            '/spacex/rockets': _load('spacex', 'rockets.json'),
+            '/spacex/launchpads': _load('spacex', 'launchpads.json'),
+            '/ll2/launch/upcoming/': _load('ll2', 'launch_upcoming.json'),
+            '/ll2/launch/previous/': _load('ll2', 'launch_previous.json'),
+            '/nasa/planetary/apod': _load('nasa', 'apod.json'),
+            '/nasa/neo/rest/v1/feed': _load('nasa', 'neo_feed.json'),
+            '/nasa/mars-photos/api/v1/manifests/perseverance': _load('nasa', 'manifest_perseverance.json'),
+            '/nasa/mars-photos/api/v1/manifests/curiosity': _load('nasa', 'manifest_curiosity.json'),
+        }
+        # Präfix -> {id: Objekt}, z.B. /spacex/rockets/<id>
+        self.by_id = {
+            '/spacex/rockets/': _by_id(_load('spacex', 'rockets.json')),
+            '/spacex/launchpads/': _by_id(_load('spacex', 'launchpads.json')),
+        }
+        self.mars_photos = _load('nasa', 'mars_photos.json')
+        self.swpc_dir = os.path.join(FIXTURE_ROOT, 'swpc')
+
+        self._cache = {}
+
+    def resolve(self, path):
+        """Serialisierte Antwort (bytes) oder None für unbekannte Pfade"""
+        if path in self._cache:
+            return self._cache[path]
+
+        body = None
+        if path in self.exact:
+            body = self.exact[path]
+        elif path.startswith('/nasa/mars-photos/api/v1/rovers/') and path.endswith('/photos'):
+            body = self.mars_photos
+        elif path.startswith('/swpc/'):
+            try:
+                with open(os.path.join(self.swpc_dir, os.path.basename(path)), 'r', encoding='utf-8') as f:
+                    body = json.load(f)
+            except OSError:
+                body = None
+        else:
+            for prefix, items in self.by_id.items():
+                if path.startswith(prefix):
+                    body = items.get(path[len(prefix):])
+
+        payload = None if body is None else json.dumps(body).encode('utf-8')
+        self._cache[path] = payload
+        return payload
+
+
+class _Handler(BaseHTTPRequestHandler):
+    routes = None
+
+    def do_GET(self):
+        payload = self.routes.resolve(urlparse(self.path).path)
+        if payload is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Kein Request-Log auf stderr, das verfälscht nur die Messung
+        pass
+
+
+class StubServer:
+    """Lokaler HTTP-Server, der open-notify, SpaceX, NASA und SWPC aus fixtures/ beantwortet"""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        handler = type('FixtureHandler', (_Handler,), {'routes': FixtureRoutes()})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def environment(self):
+        """Umgebungsvariablen, die alle Clients auf den Stub umleiten"""
+        return {
+            'OPEN_NOTIFY_URL': f"{self.base_url}/open-notify",
+            'SPACEX_API_URL': f"{self.base_url}/spacex",
+            'LL2_API_URL': f"{self.base_url}/ll2",
+            'NASA_API_URL': f"{self.base_url}/nasa",
+            'SWPC_BASE_URL': f"{self.base_url}/swpc",
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='fixture-stub', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    server = StubServer(port=int(os.getenv("STUB_PORT", "8765")))
+    for key, value in server.environment().items():
+        print(f"{key}={value}")
+    server.httpd.serve_forever()
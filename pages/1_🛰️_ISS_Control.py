@@ -1,9 +1,14 @@
 import streamlit as st
-import requests
 import folium
 from streamlit_folium import folium_static
 from datetime import datetime, timedelta
-import time
+
+from utils.config import HAMBURG_LAT, HAMBURG_LON
+from utils.data_context import get_data_context
+from utils.fragments import FRAGMENTS_AVAILABLE, LIVE_MAP_AVAILABLE, fragment, live_folium
+from utils.instrumentation import MAP, RENDER, set_page, span, timed
+from utils.iss_track import get_position_log, observed_speed, split_track
+from utils.space_apis import fetch_iss_passes
 
 # Page Config
 st.set_page_config(
@@ -12,6 +17,11 @@ st.set_page_config(
     layout="wide"
 )
 
+set_page("ISS Control")
+
+# Takt des Live-Trackings in Sekunden (Positionen sind höchstens 10 s alt, siehe data_context)
+LIVE_INTERVAL = 5
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -72,60 +82,46 @@ st.markdown("""
 
 class ISSTracker:
     def __init__(self):
-        self.iss_api_url = "http://api.open-notify.org/iss-now.json"
-        self.astros_api_url = "http://api.open-notify.org/astros.json"
-        self.iss_pass_url = "http://api.open-notify.org/iss-pass.json"
+        # Position, Crew und Hamburg-Überflüge aus dem gemeinsamen Daten-Kontext
+        self.context = get_data_context()
+        # Aufgezeichnete Positionen (jede abgerufene Position landet im Bahnlog)
+        self.track = get_position_log()
         
     def get_iss_location(self):
         """Holt aktuelle ISS Position"""
-        try:
-            response = requests.get(self.iss_api_url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            return {
-                'latitude': float(data['iss_position']['latitude']),
-                'longitude': float(data['iss_position']['longitude']),
-                'timestamp': data['timestamp'],
-                'readable_time': datetime.fromtimestamp(data['timestamp']).strftime('%H:%M:%S UTC')
-            }
-            
-        except Exception as e:
-            st.error(f"❌ ISS API Error: {e}")
+        position = self.context.data('iss_position')
+        if not position:
+            st.error("❌ ISS API Error: Keine Positionsdaten verfügbar")
             return None
+        
+        return dict(position, readable_time=datetime.fromtimestamp(position['timestamp']).strftime('%H:%M:%S UTC'))
     
     def get_astronauts(self):
         """Holt Astronauten im Weltraum"""
-        try:
-            response = requests.get(self.astros_api_url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            return data
-            
-        except Exception as e:
-            st.error(f"❌ Astronauts API Error: {e}")
-            return None
+        astros = self.context.data('astronauts')
+        if not astros:
+            st.error("❌ Astronauts API Error: Keine Crew-Daten verfügbar")
+        return astros
     
-    def get_iss_pass_times(self, lat=53.5511, lon=9.9937):
+    def get_iss_pass_times(self, lat=HAMBURG_LAT, lon=HAMBURG_LON):
         """Holt ISS Überflugzeiten für Hamburg"""
         try:
-            response = requests.get(f"{self.iss_pass_url}?lat={lat}&lon={lon}&alt=6&n=5", timeout=15)
-            response.raise_for_status()
+            if (lat, lon) == (HAMBURG_LAT, HAMBURG_LON):
+                raw_passes = self.context.data('iss_passes')
+            else:
+                raw_passes = fetch_iss_passes(lat, lon)
+            if raw_passes is None:
+                raise ValueError("Keine Überflugdaten")
             
-            data = response.json()
             passes = []
-            
-            if 'response' in data:
-                for pass_data in data['response']:
-                    rise_time = datetime.fromtimestamp(pass_data['risetime'])
-                    duration = pass_data['duration']
-                    passes.append({
-                        'rise_time': rise_time,
-                        'duration': duration,
-                        'readable_time': rise_time.strftime('%d.%m.%Y %H:%M:%S')
-                    })
+            for pass_data in raw_passes:
+                rise_time = datetime.fromtimestamp(pass_data['risetime'])
+                duration = pass_data['duration']
+                passes.append({
+                    'rise_time': rise_time,
+                    'duration': duration,
+                    'readable_time': rise_time.strftime('%d.%m.%Y %H:%M:%S')
+                })
             
             return passes
             
@@ -146,9 +142,19 @@ class ISSTracker:
             
             return passes
     
-    def calculate_iss_speed(self):
-        """Berechnet ISS Geschwindigkeit"""
-        return 7.66  # km/s
+    def get_recorded_track(self, end, minutes=93):
+        """Aufgezeichnete Positionen der letzten Umläufe bis end (Unix-Sekunden)"""
+        return self.track.window(end - minutes * 60, end)
+    
+    def calculate_iss_speed(self, end, minutes=10):
+        """Berechnet ISS Geschwindigkeit aus den Beobachtungen der letzten Minuten
+        
+        Gibt (km/s, gemessen) zurück; ohne genug Aufzeichnung den Nennwert 7.66 km/s.
+        """
+        speed = observed_speed(self.track.window(end - minutes * 60, end))
+        if speed is None:
+            return 7.66, False
+        return speed, True
     
     def get_location_info(self, lat, lon):
         """Gibt Info über die Region zurück"""
@@ -165,24 +171,25 @@ class ISSTracker:
         else:
             return "🌍 Erdorbit"
 
-def create_iss_map(iss_data):
-    """Erstellt ISS Live Map"""
-    if not iss_data:
-        return None
-        
-    # Folium Karte erstellen
-    m = folium.Map(
+def create_iss_base_map(iss_data):
+    """Leere Basiskarte um die ISS-Position (ohne Marker)"""
+    return folium.Map(
         location=[iss_data['latitude'], iss_data['longitude']],
         zoom_start=4,
         tiles='OpenStreetMap'
     )
+
+@timed('iss_layer', MAP)
+def create_iss_layer(iss_data, track=None):
+    """ISS Marker, Sichtbarkeitskreis und aufgezeichnete Bahn als eigene Ebene"""
+    layer = folium.FeatureGroup(name="ISS")
     
     # ISS Marker
     folium.Marker(
         [iss_data['latitude'], iss_data['longitude']],
         popup=f"🛰️ ISS Position<br>📍 {iss_data['latitude']:.4f}°, {iss_data['longitude']:.4f}°<br>🕐 {iss_data['readable_time']}",
         tooltip="🛰️ International Space Station"
-    ).add_to(m)
+    ).add_to(layer)
     
     # Orbit Circle
     folium.Circle(
@@ -192,10 +199,194 @@ def create_iss_map(iss_data):
         color="blue",
         fillColor="lightblue",
         fillOpacity=0.2
-    ).add_to(m)
+    ).add_to(layer)
     
+    # Aufgezeichnete Bahn
+    for segment in track or []:
+        folium.PolyLine(
+            segment,
+            color="#e74c3c",
+            weight=3,
+            opacity=0.8,
+            tooltip="🛰️ Aufgezeichnete ISS-Bahn"
+        ).add_to(layer)
+    
+    return layer
+
+@timed('iss_map', MAP)
+def create_iss_map(iss_data, track=None):
+    """Erstellt ISS Live Map, optional mit aufgezeichneter Bahn (Segmente aus split_track)"""
+    if not iss_data:
+        return None
+    
+    m = create_iss_base_map(iss_data)
+    create_iss_layer(iss_data, track).add_to(m)
     return m
 
+def render_iss_map(iss_tracker, iss_data, follow=False):
+    """Karte mit Bahn; mit streamlit-folium >= 0.15 wird nur die ISS-Ebene neu gesendet"""
+    track = iss_tracker.get_recorded_track(iss_data['timestamp'])
+    segments = split_track(track)
+    
+    if LIVE_MAP_AVAILABLE:
+        # Basiskarte einmal pro Sitzung bauen, damit st_folium sie nicht erneut überträgt
+        if 'iss_basiskarte' not in st.session_state:
+            st.session_state.iss_basiskarte = create_iss_base_map(iss_data)
+        center = (iss_data['latitude'], iss_data['longitude']) if follow else None
+        with span('iss_map', RENDER):
+            live_folium(st.session_state.iss_basiskarte, create_iss_layer(iss_data, segments),
+                        key="iss_live_karte", center=center)
+    else:
+        m = create_iss_map(iss_data, segments)
+        with span('iss_map', RENDER):
+            folium_static(m, width=700, height=400)
+    
+    if len(track) > 1:
+        st.caption(f"🔴 Aufgezeichnete Bahn: {len(track)} Positionen seit "
+                   f"{datetime.fromtimestamp(track['ts'][0]).strftime('%H:%M:%S')}")
+
+def render_iss_live(iss_tracker, live=False):
+    """Kennzahlen, Karte und Status der ISS - im Live-Modus als Fragment alle LIVE_INTERVAL Sekunden"""
+    iss_data = iss_tracker.get_iss_location()
+    astro_data = iss_tracker.get_astronauts()
+    if not iss_data:
+        return
+    
+    # Live Metrics Row
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="iss-metric">
+            <h3>📍 Latitude</h3>
+            <h2>{iss_data['latitude']:.4f}°</h2>
+            <p>Current Position</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="iss-metric">
+            <h3>📍 Longitude</h3>
+            <h2>{iss_data['longitude']:.4f}°</h2>
+            <p>Current Position</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        speed, measured = iss_tracker.calculate_iss_speed(iss_data['timestamp'])
+        st.markdown(f"""
+        <div class="iss-metric">
+            <h3>⚡ Speed</h3>
+            <h2>{speed:.2f} km/s</h2>
+            <p>{speed * 3600:,.0f} km/h {'(gemessen)' if measured else '(Nennwert)'}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        if astro_data:
+            st.markdown(f"""
+            <div class="iss-metric">
+                <h3>👨‍🚀 Crew</h3>
+                <h2>{astro_data['number']}</h2>
+                <p>People in Space</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # ISS Live Map & Info
+    col_map, col_info = st.columns([2, 1])
+    
+    with col_map:
+        st.markdown("### 🗺️ ISS Live Position")
+        st.write(f"🛰️ ISS at {iss_data['latitude']:.4f}°, {iss_data['longitude']:.4f}°")
+        render_iss_map(iss_tracker, iss_data, follow=live)
+    
+    with col_info:
+        location_info = iss_tracker.get_location_info(iss_data['latitude'], iss_data['longitude'])
+        
+        st.markdown(f"""
+        <div class="orbit-info">
+            <h3>🛰️ ISS Status</h3>
+            <p><strong>🕐 Time:</strong> {iss_data['readable_time']}</p>
+            <p><strong>📍 Over:</strong> {location_info}</p>
+            <p><strong>🌍 Altitude:</strong> ~408 km</p>
+            <p><strong>⏱️ Orbit Period:</strong> 92.9 min</p>
+            <p><strong>🌅 Daily Orbits:</strong> ~15.5</p>
+            <p><strong>🌡️ Temperature:</strong> -157°C to +121°C</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_crew(iss_tracker):
+    """Crew auf ISS und Tiangong"""
+    astro_data = iss_tracker.get_astronauts()
+    
+    if astro_data:
+        st.markdown("---")
+        st.markdown("### 👨‍🚀 Current Crew in Space")
+        
+        # Group by spacecraft
+        iss_crew = [p for p in astro_data['people'] if p['craft'] == 'ISS']
+        tiangong_crew = [p for p in astro_data['people'] if p['craft'] == 'Tiangong']
+        
+        col_iss, col_tiangong = st.columns(2)
+        
+        with col_iss:
+            st.markdown("**🚀 International Space Station (ISS)**")
+            for astronaut in iss_crew:
+                st.markdown(f"""
+                <div class="astronaut-card">
+                    👨‍🚀 {astronaut['name']}
+                </div>
+                """, unsafe_allow_html=True)
+            
+            if len(iss_crew) == 0:
+                st.info("No crew data available for ISS")
+        
+        with col_tiangong:
+            st.markdown("**🚀 Tiangong Space Station**")
+            for astronaut in tiangong_crew:
+                st.markdown(f"""
+                <div class="astronaut-card">
+                    👨‍🚀 {astronaut['name']}
+                </div>
+                """, unsafe_allow_html=True)
+            
+            if len(tiangong_crew) == 0:
+                st.info("No crew data available for Tiangong")
+
+def render_iss_passes(iss_tracker):
+    """Nächste Überflüge über Hamburg mit Countdown"""
+    st.markdown("---")
+    st.markdown("### 🌍 ISS Passes Over Hamburg")
+    st.markdown("**When will the ISS be visible from Hamburg? Look up and wave! 👋**")
+    
+    iss_passes = iss_tracker.get_iss_pass_times()
+    if iss_passes:
+        st.markdown("**Next 5 ISS flyovers visible from Hamburg:**")
+        
+        for i, pass_info in enumerate(iss_passes[:5]):
+            duration_min = pass_info['duration'] // 60
+            
+            # Time until pass
+            now = datetime.now()
+            time_until = pass_info['rise_time'] - now
+            
+            if time_until.total_seconds() > 0:
+                hours_until = int(time_until.total_seconds() // 3600)
+                minutes_until = int((time_until.total_seconds() % 3600) // 60)
+                countdown = f"in {hours_until}h {minutes_until}m"
+            else:
+                countdown = "Recently passed"
+            
+            st.markdown(f"""
+            <div class="pass-prediction">
+                🛰️ Pass #{i+1}: {pass_info['readable_time']} ({countdown})<br>
+                ⏱️ Duration: {duration_min} minutes | 👀 Look up and spot the ISS!
+            </div>
+            """, unsafe_allow_html=True)
+
 def main():
     # Header
     st.markdown('<h1 class="iss-header">🛰️ ISS MISSION CONTROL</h1>', unsafe_allow_html=True)
@@ -215,10 +406,13 @@ def main():
     # Sidebar Controls
     st.sidebar.markdown("## 🎛️ ISS Mission Controls")
     
-    auto_refresh = st.sidebar.checkbox("🔄 Auto-Refresh (30s)", value=False)
-    if auto_refresh:
-        time.sleep(30)
-        st.rerun()
+    # Live-Modus aktualisiert nur Kennzahlen & Karte (Fragment), nicht die ganze Seite
+    live = st.sidebar.checkbox(
+        f"📡 Live-Tracking ({LIVE_INTERVAL}s)",
+        value=False,
+        disabled=not FRAGMENTS_AVAILABLE,
+        help=None if FRAGMENTS_AVAILABLE else "Benötigt Streamlit >= 1.37"
+    )
     
     if st.sidebar.button("🚀 Update ISS Data", type="primary"):
         st.rerun()
@@ -235,165 +429,16 @@ def main():
     - **Mass:** ~420,000 kg
     """)
     
-    # Get Live Data
+    # Position & Karte im Live-Takt, Crew und Überflüge in ihrem eigenen (nur im Live-Modus)
+    def every(seconds):
+        return seconds if live else None
+    
     with st.spinner("📡 Contacting International Space Station..."):
-        iss_data = iss_tracker.get_iss_location()
-        astro_data = iss_tracker.get_astronauts()
+        fragment(run_every=every(LIVE_INTERVAL))(render_iss_live)(iss_tracker, live)
         
-        if iss_data:
-            # Live Metrics Row
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(f"""
-                <div class="iss-metric">
-                    <h3>📍 Latitude</h3>
-                    <h2>{iss_data['latitude']:.4f}°</h2>
-                    <p>Current Position</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div class="iss-metric">
-                    <h3>📍 Longitude</h3>
-                    <h2>{iss_data['longitude']:.4f}°</h2>
-                    <p>Current Position</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                speed = iss_tracker.calculate_iss_speed()
-                st.markdown(f"""
-                <div class="iss-metric">
-                    <h3>⚡ Speed</h3>
-                    <h2>{speed:.2f} km/s</h2>
-                    <p>27,600 km/h</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                if astro_data:
-                    st.markdown(f"""
-                    <div class="iss-metric">
-                        <h3>👨‍🚀 Crew</h3>
-                        <h2>{astro_data['number']}</h2>
-                        <p>People in Space</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            st.markdown("---")
-            
-            # ISS Live Map & Info
-            col_map, col_info = st.columns([2, 1])
-            
-            with col_map:
-                st.markdown("### 🗺️ ISS Live Position")
-                st.write(f"🛰️ ISS at {iss_data['latitude']:.4f}°, {iss_data['longitude']:.4f}°")
-                
-                # Create ISS Map
-                m = folium.Map(
-                    location=[iss_data['latitude'], iss_data['longitude']],
-                    zoom_start=4,
-                    tiles='OpenStreetMap'
-                )
-                
-                folium.Marker(
-                    [iss_data['latitude'], iss_data['longitude']],
-                    popup=f"🛰️ ISS Position<br>📍 {iss_data['latitude']:.4f}°, {iss_data['longitude']:.4f}°<br>🕐 {iss_data['readable_time']}",
-                    tooltip="🛰️ International Space Station"
-                ).add_to(m)
-                
-                folium.Circle(
-                    [iss_data['latitude'], iss_data['longitude']],
-                    radius=500000,
-                    popup="ISS Sichtbarkeitsbereich (500km)",
-                    color="blue",
-                    fillColor="lightblue",
-                    fillOpacity=0.2
-                ).add_to(m)
-                
-                folium_static(m, width=700, height=400)
-            
-            with col_info:
-                location_info = iss_tracker.get_location_info(iss_data['latitude'], iss_data['longitude'])
-                
-                st.markdown(f"""
-                <div class="orbit-info">
-                    <h3>🛰️ ISS Status</h3>
-                    <p><strong>🕐 Time:</strong> {iss_data['readable_time']}</p>
-                    <p><strong>📍 Over:</strong> {location_info}</p>
-                    <p><strong>🌍 Altitude:</strong> ~408 km</p>
-                    <p><strong>⏱️ Orbit Period:</strong> 92.9 min</p>
-                    <p><strong>🌅 Daily Orbits:</strong> ~15.5</p>
-                    <p><strong>🌡️ Temperature:</strong> -157°C to +121°C</p>
-                </div>
-                """, unsafe_allow_html=True)
+        fragment(run_every=every(3600))(render_crew)(iss_tracker)
         
-        # Astronauts Section
-        if astro_data:
-            st.markdown("---")
-            st.markdown("### 👨‍🚀 Current Crew in Space")
-            
-            # Group by spacecraft
-            iss_crew = [p for p in astro_data['people'] if p['craft'] == 'ISS']
-            tiangong_crew = [p for p in astro_data['people'] if p['craft'] == 'Tiangong']
-            
-            col_iss, col_tiangong = st.columns(2)
-            
-            with col_iss:
-                st.markdown("**🚀 International Space Station (ISS)**")
-                for astronaut in iss_crew:
-                    st.markdown(f"""
-                    <div class="astronaut-card">
-                        👨‍🚀 {astronaut['name']}
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                if len(iss_crew) == 0:
-                    st.info("No crew data available for ISS")
-            
-            with col_tiangong:
-                st.markdown("**🚀 Tiangong Space Station**")
-                for astronaut in tiangong_crew:
-                    st.markdown(f"""
-                    <div class="astronaut-card">
-                        👨‍🚀 {astronaut['name']}
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                if len(tiangong_crew) == 0:
-                    st.info("No crew data available for Tiangong")
-        
-        # ISS Pass Times for Hamburg
-        st.markdown("---")
-        st.markdown("### 🌍 ISS Passes Over Hamburg")
-        st.markdown("**When will the ISS be visible from Hamburg? Look up and wave! 👋**")
-        
-        iss_passes = iss_tracker.get_iss_pass_times()
-        if iss_passes:
-            st.markdown("**Next 5 ISS flyovers visible from Hamburg:**")
-            
-            for i, pass_info in enumerate(iss_passes[:5]):
-                duration_min = pass_info['duration'] // 60
-                
-                # Time until pass
-                now = datetime.now()
-                time_until = pass_info['rise_time'] - now
-                
-                if time_until.total_seconds() > 0:
-                    hours_until = int(time_until.total_seconds() // 3600)
-                    minutes_until = int((time_until.total_seconds() % 3600) // 60)
-                    countdown = f"in {hours_until}h {minutes_until}m"
-                else:
-                    countdown = "Recently passed"
-                
-                st.markdown(f"""
-                <div class="pass-prediction">
-                    🛰️ Pass #{i+1}: {pass_info['readable_time']} ({countdown})<br>
-                    ⏱️ Duration: {duration_min} minutes | 👀 Look up and spot the ISS!
-                </div>
-                """, unsafe_allow_html=True)
+        fragment(run_every=every(60))(render_iss_passes)(iss_tracker)
     
     # Footer
     st.markdown("---")
@@ -1,11 +1,16 @@
 import streamlit as st
-import requests
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
 import time
 
+from utils.countdown import countdown_span, render_countdown
+from utils.data_context import get_data_context
+from utils.fragments import auto_refresh_toggle, fragment
+from utils.instrumentation import FIGURE, get_logger, set_page, timed
+from utils.launch_providers import get_launch_index
+from utils.launches import Launch, get_launchpads, get_rockets
+
 # Page Config
 st.set_page_config(
     page_title="🚀 Rocket Launch Center",
@@ -13,6 +18,9 @@ st.set_page_config(
     layout="wide"
 )
 
+set_page("Launch Center")
+logger = get_logger('launch_center')
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -35,15 +43,6 @@ st.markdown("""
         border-radius: 15px;
         border-left: 5px solid #e74c3c;
     }
-    .countdown-card {
-        background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
-        padding: 2rem;
-        border-radius: 20px;
-        color: white;
-        text-align: center;
-        margin: 1rem 0;
-        box-shadow: 0 12px 40px rgba(231, 76, 60, 0.3);
-    }
     .mission-card {
         background: linear-gradient(135deg, #3498db 0%, #2980b9 100%);
         padding: 1.5rem;
@@ -81,82 +80,66 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Karten im Countdown-iframe (tickt im Browser, siehe utils.countdown)
+COUNTDOWN_CSS = """
+    .countdown-card {
+        background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
+        padding: 2rem;
+        border-radius: 20px;
+        color: white;
+        text-align: center;
+        margin: 1rem 0;
+        box-shadow: 0 12px 40px rgba(231, 76, 60, 0.3);
+    }
+    .rocket-card {
+        background: linear-gradient(135deg, #9b59b6 0%, #8e44ad 100%);
+        padding: 1.2rem;
+        border-radius: 12px;
+        color: white;
+        margin: 0.8rem 0;
+        text-align: center;
+    }
+"""
+SCHEDULE_CARD_HEIGHT = 135
+
 class LaunchTracker:
     def __init__(self):
-        self.spacex_upcoming_url = "https://api.spacexdata.com/v4/launches/upcoming"
-        self.spacex_past_url = "https://api.spacexdata.com/v4/launches/past"
-        self.spacex_rockets_url = "https://api.spacexdata.com/v4/rockets"
-        self.spacex_launchpads_url = "https://api.spacexdata.com/v4/launchpads"
+        # Kommende & vergangene Starts aus dem gemeinsamen Daten-Kontext (einmal abrufen, von allen Bereichen gelesen)
+        self.context = get_data_context()
         
     def get_upcoming_launches(self, limit=10):
-        """Holt kommende SpaceX Starts"""
-        try:
-            response = requests.get(f"{self.spacex_upcoming_url}?limit={limit}", timeout=15)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Nur zukünftige Launches filtern
-            now = datetime.now()
-            future_launches = []
-            
-            for launch in data:
-                if launch.get('date_utc'):
-                    try:
-                        launch_date = datetime.fromisoformat(launch['date_utc'].replace('Z', '+00:00'))
-                        if launch_date.replace(tzinfo=None) > now:
-                            future_launches.append(launch)
-                    except:
-                        continue
-            
-            return sorted(future_launches, key=lambda x: x.get('date_utc', ''))[:limit]
-            
-        except Exception as e:
-            st.warning(f"⚠️ SpaceX API temporarily unavailable")
+        """Kommende Starts aller Provider (Launch-Datensätze, nächster zuerst)"""
+        index = get_launch_index()
+        if index is None:
+            logger.warning("Keine Start-Quelle erreichbar")
             return self._get_simulated_launches()
+        return index.upcoming(limit=limit)
     
     def get_recent_launches(self, limit=5):
-        """Holt kürzliche SpaceX Starts"""
-        try:
-            response = requests.get(f"{self.spacex_past_url}?limit={limit}", timeout=15)
-            response.raise_for_status()
-            
-            data = response.json()
-            return sorted(data, key=lambda x: x.get('date_utc', ''), reverse=True)[:limit]
-            
-        except Exception as e:
-            return []
+        """Kürzliche Starts aller Provider, neueste zuerst"""
+        index = get_launch_index()
+        return index.recent(limit=limit) if index is not None else []
+    
+    def is_live(self):
+        """False, wenn die kommenden Starts simuliert sind (keine Start-Quelle erreichbar)"""
+        return get_launch_index() is not None
     
     def get_rocket_info(self, rocket_id):
-        """Holt Raketen-Informationen"""
-        try:
-            response = requests.get(f"{self.spacex_rockets_url}/{rocket_id}", timeout=10)
-            response.raise_for_status()
-            
-            return response.json()
-            
-        except Exception as e:
-            return None
+        """Raketen-Informationen (Rocket-Datensatz oder None)"""
+        return get_rockets().get(rocket_id)
     
     def get_launchpad_info(self, launchpad_id):
-        """Holt Startplatz-Informationen"""
-        try:
-            response = requests.get(f"{self.spacex_launchpads_url}/{launchpad_id}", timeout=10)
-            response.raise_for_status()
-            
-            return response.json()
-            
-        except Exception as e:
-            return None
+        """Startplatz-Informationen (Launchpad-Datensatz oder None)"""
+        return get_launchpads().get(launchpad_id)
     
     def calculate_launch_stats(self, launches):
         """Berechnet Launch-Statistiken"""
         if not launches:
             return {}
         
-        successful = len([l for l in launches if l.get('success') == True])
-        failed = len([l for l in launches if l.get('success') == False])
-        pending = len([l for l in launches if l.get('success') is None])
+        successful = len([l for l in launches if l.success is True])
+        failed = len([l for l in launches if l.success is False])
+        pending = len([l for l in launches if l.success is None])
         
         return {
             'total': len(launches),
@@ -167,64 +150,32 @@ class LaunchTracker:
         }
     
     def _get_simulated_launches(self):
-        """Fallback für simulierte Launches"""
-        base_time = datetime.now()
+        """Fallback für simulierte Launches (gleiche Datensätze wie von der API)"""
+        base_time = time.time()
         
-        return [
+        launches = Launch.decode_many([
             {
+                'id': 'simulated-1',
                 'name': 'Starlink Group 8-7',
-                'date_utc': (base_time + timedelta(days=3)).isoformat() + 'Z',
+                'date_unix': base_time + 3 * 86400,
                 'details': 'Deployment of 23 Starlink satellites to low Earth orbit.',
-                'rocket': 'falcon9',
-                'launchpad': 'ksc_lc_39a',
-                'success': None
+                'upcoming': True
             },
             {
+                'id': 'simulated-2',
                 'name': 'Crew-9 Mission',
-                'date_utc': (base_time + timedelta(days=12)).isoformat() + 'Z',
+                'date_unix': base_time + 12 * 86400,
                 'details': 'NASA Commercial Crew mission to the International Space Station.',
-                'rocket': 'falcon9',
-                'launchpad': 'ksc_lc_39a',
-                'success': None
+                'upcoming': True
             }
-        ]
-
-def format_countdown(launch_date_str):
-    """Formatiert Countdown bis zum Launch"""
-    try:
-        launch_date = datetime.fromisoformat(launch_date_str.replace('Z', '+00:00'))
-        now = datetime.now(launch_date.tzinfo)
-        
-        if launch_date > now:
-            delta = launch_date - now
-            days = delta.days
-            hours, remainder = divmod(delta.seconds, 3600)
-            minutes, _ = divmod(remainder, 60)
-            
-            return {
-                'countdown': f"{days}d {hours}h {minutes}m",
-                'days': days,
-                'hours': hours,
-                'minutes': minutes,
-                'status': 'upcoming'
-            }
-        else:
-            return {
-                'countdown': 'Recently Launched',
-                'days': 0,
-                'hours': 0,
-                'minutes': 0,
-                'status': 'past'
-            }
-    except:
-        return {
-            'countdown': 'TBD',
-            'days': 0,
-            'hours': 0,
-            'minutes': 0,
-            'status': 'unknown'
-        }
+        ])
+        for launch in launches:
+            launch.vehicle = 'Falcon 9'
+            launch.pad = 'KSC LC 39A'
+            launch.agency = 'SpaceX'
+        return launches
 
+@timed('launch_timeline', FIGURE)
 def create_launch_timeline(launches):
     """Erstellt Launch Timeline Visualization"""
     if not launches:
@@ -234,19 +185,14 @@ def create_launch_timeline(launches):
     timeline_data = []
     
     for launch in launches[:10]:  # Top 10 launches
-        launch_date = launch.get('date_utc', '')
-        if launch_date:
-            try:
-                dt = datetime.fromisoformat(launch_date.replace('Z', '+00:00'))
-                timeline_data.append({
-                    'Mission': launch.get('name', 'Unknown'),
-                    'Date': dt,
-                    'Agency': 'SpaceX',
-                    'Status': 'Upcoming' if launch.get('success') is None else ('Success' if launch.get('success') else 'Failed'),
-                    'Rocket': launch.get('rocket', 'Unknown')
-                })
-            except:
-                continue
+        if launch.date:
+            timeline_data.append({
+                'Mission': launch.name,
+                'Date': launch.date,
+                'Agency': launch.agency or 'Unknown',
+                'Status': 'Upcoming' if launch.success is None else launch.status,
+                'Rocket': launch.vehicle or 'Unknown'
+            })
     
     if not timeline_data:
         return None
@@ -260,7 +206,8 @@ def create_launch_timeline(launches):
         y='Mission',
         color='Status',
         size_max=15,
-        title='🚀 Upcoming SpaceX Launch Timeline',
+        hover_data=['Agency', 'Rocket'],
+        title='🚀 Upcoming Launch Timeline',
         color_discrete_map={
             'Upcoming': '#3498db',
             'Success': '#27ae60',
@@ -278,6 +225,160 @@ def create_launch_timeline(launches):
     
     return fig
 
+def format_launch_date(launch, fmt='%d.%m.%Y %H:%M UTC', default='TBD'):
+    """Startzeit eines Launch-Datensatzes lesbar formatieren"""
+    return launch.date.strftime(fmt) if launch.date else default
+
+def render_next_launch(launcher):
+    """Countdown & Details des nächsten Starts"""
+    upcoming_launches = launcher.get_upcoming_launches(10)
+    if not launcher.is_live():
+        st.warning("⚠️ Launch APIs temporarily unavailable")
+    if not upcoming_launches:
+        return
+    
+    next_launch = upcoming_launches[0]
+    st.markdown("### 🎯 Next Launch")
+    
+    col_countdown, col_details = st.columns([1, 1])
+    
+    with col_countdown:
+        render_countdown(f"""
+        <div class="countdown-card">
+            <h2>🚀 {next_launch.name}</h2>
+            <h1 style="font-size: 3rem; margin: 1rem 0;">{countdown_span(next_launch.timestamp, "{d}d {h}h {m}m {s}s")}</h1>
+            <p style="font-size: 1.2rem;">T-minus countdown</p>
+        </div>
+        """, css=COUNTDOWN_CSS, height=260)
+    
+    with col_details:
+        formatted_date = format_launch_date(next_launch)
+        
+        details = next_launch.details or 'Mission details coming soon'
+        details_text = str(details)[:150] + ('...' if len(str(details)) > 150 else '')
+        
+        st.markdown(f"""
+        <div class="mission-card">
+            <h3>🛸 Mission Details</h3>
+            <p><strong>📅 Launch Date:</strong> {formatted_date}</p>
+            <p><strong>🏢 Provider:</strong> {next_launch.agency or 'Unknown'}</p>
+            <p><strong>🚀 Vehicle:</strong> {next_launch.vehicle or 'TBD'}</p>
+            <p><strong>📍 Location:</strong> {next_launch.pad or 'TBD'}</p>
+            <p><strong>📊 Details:</strong> {details_text}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_launch_analytics(launcher):
+    """Kennzahlen und Timeline"""
+    upcoming_launches = launcher.get_upcoming_launches(10)
+    recent_launches = launcher.get_recent_launches(5)
+    
+    st.markdown("---")
+    st.markdown("### 📊 Launch Performance Analytics")
+    
+    stats = launcher.calculate_launch_stats(recent_launches)  # Only calculate from recent launches
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="launch-stat">
+            <h3>🚀 Upcoming</h3>
+            <h2>{len(upcoming_launches)}</h2>
+            <p>Scheduled Launches</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="launch-stat">
+            <h3>✅ Successful</h3>
+            <h2>{stats.get('successful', 0)}</h2>
+            <p>Recent Missions</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="launch-stat">
+            <h3>📈 Success Rate</h3>
+            <h2>{stats.get('success_rate', 0):.1f}%</h2>
+            <p>Mission Success</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="launch-stat">
+            <h3>🎯 Total</h3>
+            <h2>{stats.get('total', 0)}</h2>
+            <p>Recent Launches</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Launch Timeline Visualization
+    if upcoming_launches:
+        st.markdown("---")
+        st.markdown("### 📅 Launch Timeline")
+        
+        timeline_fig = create_launch_timeline(upcoming_launches)
+        if timeline_fig:
+            st.plotly_chart(timeline_fig, use_container_width=True)
+
+def render_launch_schedule(launcher):
+    """Liste der nächsten Starts mit Countdown"""
+    upcoming_launches = launcher.get_upcoming_launches(10)
+    
+    st.markdown("---")
+    st.markdown("### 🗓️ Upcoming Launch Schedule")
+    
+    if upcoming_launches:
+        cards = []
+        for i, launch in enumerate(upcoming_launches[:5]):
+            formatted_date = format_launch_date(launch)
+            
+            details = launch.details or 'Mission details to be announced'
+            details_text = str(details)[:100] + ('...' if len(str(details)) > 100 else '')
+            
+            cards.append(f"""
+            <div class="rocket-card">
+                <h4>🚀 {launch.name} | {countdown_span(launch.timestamp)}</h4>
+                <p><strong>📅 Date:</strong> {formatted_date} | <strong>🏢</strong> {launch.agency or 'Unknown'} | <strong>🚀</strong> {launch.vehicle or 'TBD'}</p>
+                <p>{details_text}</p>
+            </div>
+            """)
+        
+        # Alle Countdowns in einem iframe
+        render_countdown("".join(cards), css=COUNTDOWN_CSS, height=SCHEDULE_CARD_HEIGHT * len(cards))
+    else:
+        st.info("🚀 No upcoming launches currently scheduled. Check back soon!")
+
+def render_recent_launches(launcher):
+    """Letzte Starts mit Ergebnis"""
+    recent_launches = launcher.get_recent_launches(5)
+    if not recent_launches:
+        return
+    
+    st.markdown("---")
+    st.markdown("### 📈 Recent Launch History")
+    
+    for launch in recent_launches[:3]:
+        success_icon = "✅" if launch.success is True else "❌" if launch.success is False else "⏳"
+        success_text = launch.status
+        
+        formatted_date = format_launch_date(launch, '%d.%m.%Y', 'Unknown')
+        
+        details = launch.details or 'Successful mission completion'
+        details_text = str(details)[:100] + ('...' if len(str(details)) > 100 else '')
+        
+        st.markdown(f"""
+        <div class="rocket-card" style="background: linear-gradient(135deg, {'#27ae60' if launch.success else '#34495e'} 0%, {'#2ecc71' if launch.success else '#2c3e50'} 100%);">
+            <h4>{success_icon} {launch.name} | {success_text}</h4>
+            <p><strong>📅 Date:</strong> {formatted_date} | <strong>🚀 Vehicle:</strong> {launch.vehicle or 'Unknown'}</p>
+            <p>{details_text}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
 def main():
     # Header
     st.markdown('<h1 class="launch-header">🚀 ROCKET LAUNCH CENTER</h1>', unsafe_allow_html=True)
@@ -285,7 +386,8 @@ def main():
     st.markdown("""
     <div class="page-intro">
         <strong>🌍 Global Space Launch Tracking & Analysis</strong><br><br>
-        Monitor upcoming rocket launches from SpaceX and track mission success rates. 
+        Monitor upcoming rocket launches from SpaceX, Rocket Lab, ULA, Arianespace, CASC and more - 
+        merged from several launch data providers - and track mission success rates. 
         From Starlink deployments to crew missions - never miss a launch! 
         SpaceX has revolutionized space access with reusable rockets! 🔥
     </div>
@@ -297,10 +399,7 @@ def main():
     # Sidebar Controls
     st.sidebar.markdown("## 🎛️ Launch Control Center")
     
-    auto_refresh = st.sidebar.checkbox("🔄 Auto-Refresh (60s)", value=False)
-    if auto_refresh:
-        time.sleep(60)
-        st.rerun()
+    every = auto_refresh_toggle()
     
     if st.sidebar.button("🚀 Update Launch Data", type="primary"):
         st.rerun()
@@ -317,164 +416,12 @@ def main():
     - **Turnaround:** As fast as 2 weeks
     """)
     
-    # Get Launch Data
+    # Bereiche aktualisieren sich unabhängig; Countdowns ticken im Browser, neu geladen wird nur mit den Startdaten
     with st.spinner("🚀 Contacting Launch Control..."):
-        upcoming_launches = launcher.get_upcoming_launches(10)
-        recent_launches = launcher.get_recent_launches(5)
-        
-        # Next Launch Countdown (Featured)
-        if upcoming_launches:
-            next_launch = upcoming_launches[0]
-            countdown_info = format_countdown(next_launch.get('date_utc', ''))
-            
-            st.markdown("### 🎯 Next SpaceX Launch")
-            
-            col_countdown, col_details = st.columns([1, 1])
-            
-            with col_countdown:
-                st.markdown(f"""
-                <div class="countdown-card">
-                    <h2>🚀 {next_launch.get('name', 'Mission')}</h2>
-                    <h1 style="font-size: 3rem; margin: 1rem 0;">{countdown_info['countdown']}</h1>
-                    <p style="font-size: 1.2rem;">T-minus countdown</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col_details:
-                launch_date = next_launch.get('date_utc', '')
-                formatted_date = 'TBD'
-                if launch_date:
-                    try:
-                        dt = datetime.fromisoformat(launch_date.replace('Z', '+00:00'))
-                        formatted_date = dt.strftime('%d.%m.%Y %H:%M UTC')
-                    except:
-                        pass
-                
-                details = next_launch.get('details') or 'Mission details coming soon'
-                details_text = str(details)[:150] + ('...' if len(str(details)) > 150 else '')
-                
-                st.markdown(f"""
-                <div class="mission-card">
-                    <h3>🛸 Mission Details</h3>
-                    <p><strong>📅 Launch Date:</strong> {formatted_date}</p>
-                    <p><strong>🚀 Vehicle:</strong> Falcon 9</p>
-                    <p><strong>📍 Location:</strong> Kennedy Space Center</p>
-                    <p><strong>📊 Details:</strong> {details_text}</p>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Launch Statistics
-        st.markdown("---")
-        st.markdown("### 📊 Launch Performance Analytics")
-        
-        all_launches = upcoming_launches + recent_launches
-        stats = launcher.calculate_launch_stats(recent_launches)  # Only calculate from recent launches
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="launch-stat">
-                <h3>🚀 Upcoming</h3>
-                <h2>{len(upcoming_launches)}</h2>
-                <p>Scheduled Launches</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="launch-stat">
-                <h3>✅ Successful</h3>
-                <h2>{stats.get('successful', 0)}</h2>
-                <p>Recent Missions</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="launch-stat">
-                <h3>📈 Success Rate</h3>
-                <h2>{stats.get('success_rate', 0):.1f}%</h2>
-                <p>Mission Success</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div class="launch-stat">
-                <h3>🎯 Total</h3>
-                <h2>{stats.get('total', 0)}</h2>
-                <p>Recent Launches</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Launch Timeline Visualization
-        if upcoming_launches:
-            st.markdown("---")
-            st.markdown("### 📅 Launch Timeline")
-            
-            timeline_fig = create_launch_timeline(upcoming_launches)
-            if timeline_fig:
-                st.plotly_chart(timeline_fig, use_container_width=True)
-        
-        # Upcoming Launches List
-        st.markdown("---")
-        st.markdown("### 🗓️ Upcoming Launch Schedule")
-        
-        if upcoming_launches:
-            for i, launch in enumerate(upcoming_launches[:5]):
-                countdown_info = format_countdown(launch.get('date_utc', ''))
-                
-                launch_date = launch.get('date_utc', '')
-                formatted_date = 'TBD'
-                if launch_date:
-                    try:
-                        dt = datetime.fromisoformat(launch_date.replace('Z', '+00:00'))
-                        formatted_date = dt.strftime('%d.%m.%Y %H:%M UTC')
-                    except:
-                        pass
-                
-                details = launch.get('details') or 'Mission details to be announced'
-                details_text = str(details)[:100] + ('...' if len(str(details)) > 100 else '')
-                
-                st.markdown(f"""
-                <div class="rocket-card">
-                    <h4>🚀 {launch.get('name', 'Mission')} | {countdown_info['countdown']}</h4>
-                    <p><strong>📅 Date:</strong> {formatted_date} | <strong>🎯 Status:</strong> Scheduled</p>
-                    <p>{details_text}</p>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.info("🚀 No upcoming launches currently scheduled. Check back soon!")
-        
-        # Recent Launches
-        if recent_launches:
-            st.markdown("---")
-            st.markdown("### 📈 Recent Launch History")
-            
-            for launch in recent_launches[:3]:
-                success_icon = "✅" if launch.get('success') == True else "❌" if launch.get('success') == False else "⏳"
-                success_text = "Success" if launch.get('success') == True else "Failed" if launch.get('success') == False else "Pending"
-                
-                launch_date = launch.get('date_utc', '')
-                formatted_date = 'Unknown'
-                if launch_date:
-                    try:
-                        dt = datetime.fromisoformat(launch_date.replace('Z', '+00:00'))
-                        formatted_date = dt.strftime('%d.%m.%Y')
-                    except:
-                        pass
-                
-                details = launch.get('details') or 'Successful mission completion'
-                details_text = str(details)[:100] + ('...' if len(str(details)) > 100 else '')
-                
-                st.markdown(f"""
-                <div class="rocket-card" style="background: linear-gradient(135deg, {'#27ae60' if launch.get('success') else '#34495e'} 0%, {'#2ecc71' if launch.get('success') else '#2c3e50'} 100%);">
-                    <h4>{success_icon} {launch.get('name', 'Mission')} | {success_text}</h4>
-                    <p><strong>📅 Date:</strong> {formatted_date} | <strong>🚀 Vehicle:</strong> Falcon 9</p>
-                    <p>{details_text}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        fragment(run_every=every(1800))(render_next_launch)(launcher)
+        fragment(run_every=every(1800))(render_launch_analytics)(launcher)
+        fragment(run_every=every(1800))(render_launch_schedule)(launcher)
+        fragment(run_every=every(3600))(render_recent_launches)(launcher)
     
     # Footer
     st.markdown("---")
@@ -487,4 +434,4 @@ def main():
     """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
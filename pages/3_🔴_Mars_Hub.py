@@ -1,13 +1,20 @@
 import streamlit as st
-import requests
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import time
-import random
+import numpy as np
+from datetime import datetime, timedelta, timezone
 import os
 from dotenv import load_dotenv
 
+from utils.fragments import auto_refresh_toggle, fragment
+from utils.image_cache import cached_image
+from utils.instrumentation import FIGURE, get_logger, set_page, timed
+from utils.mars_photos import NAVCAM, PHOTO_ROVERS, get_manifest_index, get_sol_photos, latest_photos, paginate
+from utils.mars_time import ROVERS, SEASONS, rover_clock, season_name, sol_calendar, sol_to_datetime64
+from utils.prefetch import start_prefetcher
+from utils.simulation import DAY, daily_sample, simulation_rng
+from utils.snapshots import get_snapshot_store
+
 # Load environment variables
 load_dotenv()
 
@@ -19,6 +26,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+set_page("Mars Hub")
+logger = get_logger('mars_hub')
+
+# Foto-Raster: 3 Spalten x 2 Zeilen pro Seite
+PHOTO_PAGE_SIZE = 6
+
 # Custom CSS für Mars Theme
 st.markdown("""
 <style>
@@ -79,63 +92,32 @@ class MarsExplorationAPI:
         # NASA API Key aus Environment Variable laden
         self.nasa_api_key = os.getenv("NASA_API_KEY", "DEMO_KEY")
         
-        # Mars Rover APIs
-        self.nasa_mars_url = f"https://api.nasa.gov/mars-photos/api/v1/rovers/perseverance/photos?api_key={self.nasa_api_key}"
-        self.curiosity_url = f"https://api.nasa.gov/mars-photos/api/v1/rovers/curiosity/photos?api_key={self.nasa_api_key}"
-        
         # Mars Weather (falls verfügbar)
         self.mars_weather_url = f"https://api.nasa.gov/insight_weather/?api_key={self.nasa_api_key}"
     
     def get_mars_photos(self):
-        """Holt Mars Rover Fotos mit Debug und funktionierenden Fallbacks"""
-        try:
-            print(f"🔍 NASA API Key: {self.nasa_api_key[:10]}...")
-            
-            # Versuche verschiedene Sols für echte NASA Fotos
-            sol_attempts = [3000, 2500, 2000, 1500, 1000]
-            
-            for sol in sol_attempts:
-                try:
-                    # Perseverance NavCam Photos
-                    url = f"{self.nasa_mars_url}&sol={sol}&camera=navcam"
-                    print(f"🚀 Trying Perseverance API: sol={sol}")
-                    
-                    response = requests.get(url, timeout=10)
-                    print(f"📡 Perseverance Response: {response.status_code}")
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('photos') and len(data['photos']) > 0:
-                            print(f"✅ Found {len(data['photos'])} Perseverance photos for sol {sol}")
-                            return data['photos'][:6]
-                    
-                    # Fallback zu Curiosity für diesen Sol
-                    curiosity_url = f"https://api.nasa.gov/mars-photos/api/v1/rovers/curiosity/photos?api_key={self.nasa_api_key}&sol={sol}&camera=navcam"
-                    print(f"🤖 Trying Curiosity API: sol={sol}")
-                    
-                    response = requests.get(curiosity_url, timeout=10)
-                    print(f"📡 Curiosity Response: {response.status_code}")
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('photos') and len(data['photos']) > 0:
-                            print(f"✅ Found {len(data['photos'])} Curiosity photos for sol {sol}")
-                            return data['photos'][:6]
-                            
-                except Exception as e:
-                    print(f"❌ Error for sol {sol}: {e}")
-                    continue
-            
-            print("🔄 All sols failed, using placeholder images")
-            return self._get_mars_placeholders()
-            
-        except Exception as e:
-            print(f"🔥 Mars API Error: {e}")
-            return self._get_mars_placeholders()
+        """Holt Mars Rover Fotos (Prefetch-Snapshot, sonst NASA API, sonst Placeholder)"""
+        # Vom Prefetcher vorgeladenes Fotoset
+        photos = get_snapshot_store().get_data('mars_photos')
+        if photos:
+            return photos
+        
+        # NavCam vom letzten Sol laut Missions-Manifest (Fehler landen im Log)
+        photos = latest_photos(api_key=self.nasa_api_key)
+        if photos:
+            return photos
+        
+        logger.info("Keine Mars Fotos von der NASA API, zeige Placeholder")
+        return self._get_mars_placeholders()
+    
+    def get_mars_clock(self):
+        """Aktueller Sol, Ortszeit (LMST) und Jahreszeit je Rover"""
+        now = datetime.now(timezone.utc)
+        return {rover: rover_clock(rover, now) for rover in ROVERS}
     
     def _get_mars_placeholders(self):
         """Mars-themed funktionsfähige Placeholder Bilder"""
-        base_sol = 1000 + (datetime.now().day % 100)
+        clock = self.get_mars_clock()
         
         # Verwende Mars-farbige Placeholders die garantiert funktionieren
         placeholder_data = [
@@ -149,24 +131,27 @@ class MarsExplorationAPI:
         
         mars_photos = []
         for i, placeholder in enumerate(placeholder_data):
+            rover = 'perseverance' if i % 2 == 0 else 'curiosity'
             mars_photos.append({
                 'id': f'mars_placeholder_{i}',
-                'sol': base_sol + i,
+                'sol': clock[rover]['sol'] - i // 2,
                 'img_src': f"https://via.placeholder.com/400x300/{placeholder['color']}/FFFFFF?text={placeholder['title']}",
                 'camera': {
                     'full_name': ['Navigation Camera - Left', 'Navigation Camera - Right', 'Front Hazard Camera', 'Rear Hazard Camera', 'Chemistry Camera', 'Panoramic Camera'][i]
                 },
-                'rover': {'name': 'Perseverance' if i % 2 == 0 else 'Curiosity'}
+                'rover': {'name': clock[rover]['rover']}
             })
         
         return mars_photos
     
     def get_rover_status(self):
-        """Simulierte Rover Status Daten"""
+        """Rover Status: Sol und Ortszeit berechnet, übrige Werte simuliert"""
+        clock = self.get_mars_clock()
         return {
             'perseverance': {
                 'status': 'Active',
-                'sol': 1000 + (datetime.now().day % 100),
+                'sol': clock['perseverance']['sol'],
+                'lmst': clock['perseverance']['lmst'],
                 'total_photos': 275000 + (datetime.now().day * 50),
                 'distance_driven': f"{28.5 + (datetime.now().day * 0.1):.1f}",
                 'samples_collected': 24 + (datetime.now().day % 5),
@@ -174,7 +159,8 @@ class MarsExplorationAPI:
             },
             'curiosity': {
                 'status': 'Active', 
-                'sol': 4000 + (datetime.now().day % 50),
+                'sol': clock['curiosity']['sol'],
+                'lmst': clock['curiosity']['lmst'],
                 'total_photos': 850000 + (datetime.now().day * 100),
                 'distance_driven': f"{29.9 + (datetime.now().day * 0.05):.1f}",
                 'samples_collected': 39 + (datetime.now().day % 3),
@@ -183,11 +169,14 @@ class MarsExplorationAPI:
         }
     
     def get_mars_weather(self):
-        """Simulierte Mars Wetter Daten"""
+        """Simulierte Mars Wetter Daten (Sol und Jahreszeit am Standort von Perseverance)"""
+        clock = self.get_mars_clock()['perseverance']
         # Basierend auf echten Mars-Wetterdaten
         base_temp = -70 + (datetime.now().day % 40) - 20
         return {
-            'sol': 1000 + (datetime.now().day % 100),
+            'rover': 'perseverance',
+            'sol': clock['sol'],
+            'ls': clock['ls'],
             'temperature': {
                 'high': base_temp + 15,
                 'low': base_temp - 25
@@ -195,7 +184,7 @@ class MarsExplorationAPI:
             'pressure': 750 + (datetime.now().day % 100),
             'wind_speed': 5 + (datetime.now().day % 15),
             'wind_direction': ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW'][datetime.now().day % 8],
-            'season': 'Northern Winter' if datetime.now().month in [12, 1, 2, 3, 4] else 'Northern Summer',
+            'season': clock['season'],
             'weather_conditions': ['Clear', 'Dusty', 'Partly Cloudy'][datetime.now().day % 3]
         }
     
@@ -212,12 +201,16 @@ class MarsExplorationAPI:
             {'year': 2030, 'mission': 'Human Mission', 'type': 'Crewed', 'status': 'Planned'}
         ]
 
+@timed('temperature_chart', FIGURE)
 def create_temperature_chart(weather_data):
     """Erstellt Mars Temperatur Chart"""
-    # 7-Sol Temperatur Simulation
+    # 7-Sol Temperatur Simulation (pro Sol reproduzierbar): fester Zeit-Bucket (now=0), der Seed
+    # hängt nur am Sol, damit ein Sol nach dem Tageswechsel nicht plötzlich andere Werte zeigt
     sols = list(range(weather_data['sol'] - 6, weather_data['sol'] + 1))
-    highs = [weather_data['temperature']['high'] + random.randint(-10, 10) for _ in sols]
-    lows = [weather_data['temperature']['low'] + random.randint(-5, 5) for _ in sols]
+    earth_dates = [str(start)[:10] for start in sol_to_datetime64(weather_data['rover'], sols)]
+    rngs = [simulation_rng(f"mars_temperature:{sol}", DAY, now=0) for sol in sols]
+    highs = [weather_data['temperature']['high'] + rng.randint(-10, 10) for rng in rngs]
+    lows = [weather_data['temperature']['low'] + rng.randint(-5, 5) for rng in rngs]
     
     fig = go.Figure()
     
@@ -225,6 +218,8 @@ def create_temperature_chart(weather_data):
         x=sols, y=highs,
         mode='lines+markers',
         name='Tagesmaximum',
+        customdata=earth_dates,
+        hovertemplate='Sol %{x} (%{customdata})<br>%{y}°C',
         line=dict(color='#ff6b6b'),
         marker=dict(size=8)
     ))
@@ -233,6 +228,8 @@ def create_temperature_chart(weather_data):
         x=sols, y=lows,
         mode='lines+markers',
         name='Tagesminimum', 
+        customdata=earth_dates,
+        hovertemplate='Sol %{x} (%{customdata})<br>%{y}°C',
         line=dict(color='#4dabf7'),
         marker=dict(size=8)
     ))
@@ -249,6 +246,43 @@ def create_temperature_chart(weather_data):
     
     return fig
 
+@timed('sol_calendar_chart', FIGURE)
+def create_sol_calendar_chart(calendar, rover_name):
+    """Sonnenlänge Ls über die ganze Mission (ein Punkt pro Sol)"""
+    # Lücke beim Jahreswechsel (Ls 360 -> 0), sonst verbindet die Linie quer über das Diagramm
+    wraps = np.flatnonzero(np.diff(calendar['ls']) < 0) + 1
+    ls = np.insert(calendar['ls'], wraps, np.nan)
+    dates = np.insert(calendar['start'], wraps, calendar['start'][wraps])
+    sols = np.insert(calendar['sol'], wraps, calendar['sol'][wraps])
+    
+    fig = go.Figure(go.Scatter(
+        x=dates, y=ls,
+        mode='lines',
+        customdata=sols,
+        hovertemplate='Sol %{customdata}<br>%{x|%Y-%m-%d}<br>Ls %{y:.1f}°<extra></extra>',
+        line=dict(color='#ff6347'),
+        connectgaps=False
+    ))
+    
+    # Jahreszeiten der Nordhalbkugel
+    for ls_start, season in zip(range(0, 360, 90), SEASONS):
+        fig.add_hline(y=ls_start, line_dash='dot', line_color='rgba(255,255,255,0.3)',
+                      annotation_text=season, annotation_position='top left')
+    
+    fig.update_layout(
+        title=f'🗓️ {rover_name} - Sol {calendar["sol"][0]} bis {calendar["sol"][-1]}',
+        xaxis_title='Erddatum (Beginn des Sols, UTC)',
+        yaxis_title='Sonnenlänge Ls (°)',
+        yaxis=dict(range=[0, 360], dtick=90),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        showlegend=False
+    )
+    
+    return fig
+
+@timed('mission_timeline_chart', FIGURE)
 def create_mission_timeline_chart(timeline_data):
     """Erstellt Mission Timeline Chart"""
     df_timeline = []
@@ -280,24 +314,9 @@ def create_mission_timeline_chart(timeline_data):
     
     return fig
 
-def main():
-    # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>🔴 MARS EXPLORATION HUB</h1>
-        <p>Red Planet Discovery Center</p>
-        <p>🤖 Perseverance • 🔬 Curiosity • 🚁 Ingenuity • 🌡️ Weather Station</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Initialize API
-    mars_api = MarsExplorationAPI()
-    
-    # Get Mars data
+def render_rover_metrics(mars_api):
+    """Kennzahlen von Perseverance"""
     rover_status = mars_api.get_rover_status()
-    mars_weather = mars_api.get_mars_weather()
-    mars_photos = mars_api.get_mars_photos()
-    timeline_data = mars_api.get_mars_timeline()
     
     # Active Rover Status
     col1, col2, col3, col4 = st.columns(4)
@@ -307,7 +326,7 @@ def main():
         <div class="metric-card">
             <h3>🤖 Perseverance</h3>
             <h2>Sol {rover_status['perseverance']['sol']}</h2>
-            <p>{rover_status['perseverance']['status']}</p>
+            <p>{rover_status['perseverance']['status']} • {rover_status['perseverance']['lmst']} LMST</p>
         </div>
         """, unsafe_allow_html=True)
     
@@ -337,6 +356,10 @@ def main():
             <p>Battery Level</p>
         </div>
         """, unsafe_allow_html=True)
+
+def render_mars_weather(mars_api):
+    """Wetterstation mit Temperaturverlauf"""
+    mars_weather = mars_api.get_mars_weather()
     
     # Mars Weather Station
     st.markdown("---")
@@ -361,35 +384,131 @@ def main():
     with col_weather2:
         temp_chart = create_temperature_chart(mars_weather)
         st.plotly_chart(temp_chart, use_container_width=True)
-    
-    # Mars Rover Photos
+
+def render_photo_grid(photos):
+    """Fotos als Raster mit 3 Spalten"""
+    for start in range(0, len(photos), 3):
+        cols = st.columns(3)
+        for col, photo in zip(cols, photos[start:start + 3]):
+            with col:
+                try:
+                    # Versuche Bild zu laden
+                    st.image(
+                        cached_image(photo['img_src'], variant='thumb'),
+                        caption=f"📅 Sol {photo.get('sol', 'Unknown')} | 📷 {photo.get('camera', {}).get('full_name', 'Mars Camera')}",
+                        use_container_width=True
+                    )
+                except Exception:
+                    # Fallback wenn Bild nicht lädt
+                    logger.warning("Mars Foto nicht darstellbar: %s", photo.get('img_src'), exc_info=True)
+                    st.markdown(f"""
+                    <div class="photo-placeholder">
+                        <h4>📷 Mars Photo</h4>
+                        <p>Sol {photo.get('sol', 'Unknown')}</p>
+                        <p>{photo.get('camera', {}).get('full_name', 'Camera')}</p>
+                        <p>Rover: {photo.get('rover', {}).get('name', 'Unknown')}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+def _show_photo_sol(rover, sol, camera):
+    """Button-Callback: Sol und Kamera des Foto-Browsers setzen"""
+    if sol is not None:
+        st.session_state[f'photo_sol_{rover}'] = sol
+        st.session_state[f'photo_camera_{rover}'] = camera
+
+def _turn_photo_page(rover, offset):
+    """Button-Callback: Seite des Foto-Rasters wechseln"""
+    key = f'photo_page_{rover}'
+    st.session_state[key] = st.session_state.get(key, 0) + offset
+
+def render_mars_photos(mars_api):
+    """Foto-Browser: Sols und Kameras aus dem Missions-Manifest, Raster seitenweise"""
     st.markdown("---")
     st.markdown("### 📷 Latest Mars Rover Photos")
     
-    if mars_photos:
-        # Display photos in 3x2 grid
-        for row in [mars_photos[:3], mars_photos[3:6]]:
-            cols = st.columns(3)
-            for col, photo in zip(cols, row):
-                if photo:
-                    with col:
-                        try:
-                            # Versuche Bild zu laden
-                            st.image(
-                                photo['img_src'], 
-                                caption=f"📅 Sol {photo.get('sol', 'Unknown')} | 📷 {photo.get('camera', {}).get('full_name', 'Mars Camera')}",
-                                use_container_width=True
-                            )
-                        except:
-                            # Fallback wenn Bild nicht lädt
-                            st.markdown(f"""
-                            <div class="photo-placeholder">
-                                <h4>📷 Mars Photo</h4>
-                                <p>Sol {photo.get('sol', 'Unknown')}</p>
-                                <p>{photo.get('camera', {}).get('full_name', 'Camera')}</p>
-                                <p>Rover: {photo.get('rover', {}).get('name', 'Unknown')}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+    rover = st.radio(
+        "Rover",
+        PHOTO_ROVERS,
+        format_func=lambda name: ROVERS[name]['name'],
+        horizontal=True,
+        key='photo_rover'
+    )
+    index = get_manifest_index(rover)
+    if not index:
+        # Ohne Manifest: neueste NavCam-Fotos (Prefetch-Snapshot bzw. Sol-Suche)
+        render_photo_grid(mars_api.get_mars_photos()[:PHOTO_PAGE_SIZE])
+        return
+    
+    # Start: letzter Sol mit NavCam-Bildern
+    state = st.session_state
+    sol_key, camera_key, page_key = f'photo_sol_{rover}', f'photo_camera_{rover}', f'photo_page_{rover}'
+    if sol_key not in state:
+        latest_navcam = index.latest_sol(NAVCAM)
+        state[sol_key] = latest_navcam if latest_navcam is not None else index.latest_sol()
+        state[camera_key] = NAVCAM if latest_navcam is not None else None
+    sol = state[sol_key]
+    info = index.sol_info(sol)
+    cameras = (None,) + (info['cameras'] if info else ())
+    if state.get(camera_key) not in cameras:
+        state[camera_key] = None
+    camera = state[camera_key]
+    
+    # Vor/Zurück springt direkt zum nächsten Sol mit Fotos der gewählten Kamera
+    previous_sol, next_sol = index.step(sol, -1, camera), index.step(sol, 1, camera)
+    latest_navcam = index.latest_sol(NAVCAM)
+    col_prev, col_sol, col_next, col_camera, col_latest = st.columns([1, 2, 1, 2, 2])
+    with col_prev:
+        st.button("◀ Sol", key=f'photo_prev_{rover}', disabled=previous_sol is None,
+                  on_click=_show_photo_sol, args=(rover, previous_sol, camera))
+    with col_sol:
+        st.number_input("Sol", min_value=int(index.sols[0]), max_value=int(index.sols[-1]), step=1,
+                        key=sol_key, label_visibility='collapsed')
+    with col_next:
+        st.button("Sol ▶", key=f'photo_next_{rover}', disabled=next_sol is None,
+                  on_click=_show_photo_sol, args=(rover, next_sol, camera))
+    with col_camera:
+        st.selectbox("Kamera", cameras, format_func=lambda name: name or "Alle Kameras",
+                     key=camera_key, label_visibility='collapsed')
+    with col_latest:
+        st.button("🆕 Latest NavCam", key=f'photo_latest_{rover}', disabled=latest_navcam is None,
+                  on_click=_show_photo_sol, args=(rover, latest_navcam, NAVCAM))
+    
+    if info is None:
+        st.info(f"Keine Fotos von Sol {sol} im Manifest von {index.name}")
+        return
+    st.caption(f"Sol {sol} • 📅 {info['earth_date']} • {info['total_photos']} Fotos • "
+               f"📷 {', '.join(info['cameras'])}")
+    
+    try:
+        photos = get_sol_photos(rover, sol, camera, api_key=mars_api.nasa_api_key)
+    except Exception:
+        logger.warning("Mars Fotos nicht verfügbar: %s Sol %s", rover, sol, exc_info=True)
+        st.warning(f"Fotos von Sol {sol} konnten nicht geladen werden")
+        return
+    
+    # Neue Auswahl beginnt auf Seite 1; Seitenwechsel schneiden nur die geladene Liste
+    view_key = f'photo_view_{rover}'
+    if state.get(view_key) != (sol, camera):
+        state[view_key] = (sol, camera)
+        state[page_key] = 0
+    page_photos, page, pages = paginate(photos, state.get(page_key, 0), PHOTO_PAGE_SIZE)
+    render_photo_grid(page_photos)
+    
+    if pages > 1:
+        col_back, col_page, col_forward = st.columns([1, 2, 1])
+        with col_back:
+            st.button("◀", key=f'photo_page_back_{rover}', disabled=page == 0,
+                      on_click=_turn_photo_page, args=(rover, -1))
+        with col_page:
+            st.markdown(f"<p style='text-align:center'>Seite {page + 1} / {pages} ({len(photos)} Fotos)</p>",
+                        unsafe_allow_html=True)
+        with col_forward:
+            st.button("▶", key=f'photo_page_forward_{rover}', disabled=page == pages - 1,
+                      on_click=_turn_photo_page, args=(rover, 1))
+
+def render_rover_comparison(mars_api):
+    """Perseverance und Curiosity im Vergleich"""
+    rover_status = mars_api.get_rover_status()
     
     # Rover Comparison
     st.markdown("---")
@@ -403,6 +522,7 @@ def main():
         <div class="rover-card">
             <h3>🤖 Perseverance</h3>
             <p><strong>🗓️ Sol:</strong> {pers['sol']}</p>
+            <p><strong>🕒 Local Time:</strong> {pers['lmst']} LMST</p>
             <p><strong>📷 Photos:</strong> {pers['total_photos']:,}</p>
             <p><strong>🚗 Distance:</strong> {pers['distance_driven']} km</p>
             <p><strong>🔬 Samples:</strong> {pers['samples_collected']}</p>
@@ -417,6 +537,7 @@ def main():
         <div class="rover-card">
             <h3>🔬 Curiosity</h3>
             <p><strong>🗓️ Sol:</strong> {cur['sol']}</p>
+            <p><strong>🕒 Local Time:</strong> {cur['lmst']} LMST</p>
             <p><strong>📷 Photos:</strong> {cur['total_photos']:,}</p>
             <p><strong>🚗 Distance:</strong> {cur['distance_driven']} km</p>
             <p><strong>🔬 Samples:</strong> {cur['samples_collected']}</p>
@@ -424,12 +545,76 @@ def main():
             <p><strong>📍 Status:</strong> {cur['status']}</p>
         </div>
         """, unsafe_allow_html=True)
+
+def render_sol_calendar(mars_api):
+    """Sol-Kalender: Missions-Sol <-> Erddatum und Jahreszeiten über die ganze Mission"""
+    clock = mars_api.get_mars_clock()
+    
+    st.markdown("---")
+    st.markdown("### 🗓️ Sol-based Mars Calendar")
+    
+    col_rover, col_sol = st.columns(2)
+    with col_rover:
+        rover = st.radio(
+            "Rover",
+            list(ROVERS),
+            format_func=lambda name: ROVERS[name]['name'],
+            horizontal=True,
+            key='sol_calendar_rover'
+        )
+    current_sol = clock[rover]['sol']
+    with col_sol:
+        sol = st.number_input("Sol", min_value=0, max_value=current_sol, value=current_sol, step=1,
+                              key=f'sol_calendar_sol_{rover}')
+    
+    # Ganze Mission bis heute, gecacht bis zum nächsten Sol (reicht auch für den Sol danach)
+    calendar = sol_calendar(rover, 0, current_sol + 1)
+    start, end = calendar['start'][sol], calendar['start'][sol + 1]
+    ls = calendar['ls'][sol]
+    st.markdown(
+        f"**Sol {sol}** ({ROVERS[rover]['site']}): "
+        f"{str(start).replace('T', ' ')} bis {str(end).replace('T', ' ')} UTC • "
+        f"Ls {ls:.1f}° ({season_name(ls)})"
+    )
+    
+    st.plotly_chart(create_sol_calendar_chart(calendar, ROVERS[rover]['name']), use_container_width=True)
+
+def main():
+    # Header
+    st.markdown("""
+    <div class="main-header">
+        <h1>🔴 MARS EXPLORATION HUB</h1>
+        <p>Red Planet Discovery Center</p>
+        <p>🤖 Perseverance • 🔬 Curiosity • 🚁 Ingenuity • 🌡️ Weather Station</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Hintergrund-Prefetch für APOD & Mars Fotos
+    start_prefetcher()
+    
+    # Initialize API
+    mars_api = MarsExplorationAPI()
+    
+    every = auto_refresh_toggle()
+    
+    # Bereiche mit eigenen Daten aktualisieren sich getrennt (Fotos nur, wenn der Prefetcher neue hat)
+    # Sol und Ortszeit werden nur berechnet: die Kennzahlen dürfen minütlich mitlaufen
+    fragment(run_every=every(60))(render_rover_metrics)(mars_api)
+    
+    fragment(run_every=every(3600))(render_mars_weather)(mars_api)
+    
+    fragment(run_every=every(1800))(render_mars_photos)(mars_api)
+    
+    fragment(run_every=every(3600))(render_rover_comparison)(mars_api)
+    
+    # Eigenes Fragment, damit Rover-/Sol-Auswahl nicht die ganze Seite neu ausführt
+    fragment()(render_sol_calendar)(mars_api)
     
     # Mission Timeline
     st.markdown("---")
     st.markdown("### 🚀 Mars Exploration Timeline")
     
-    timeline_chart = create_mission_timeline_chart(timeline_data)
+    timeline_chart = create_mission_timeline_chart(mars_api.get_mars_timeline())
     st.plotly_chart(timeline_chart, use_container_width=True)
     
     # Future Mars Missions
@@ -477,22 +662,25 @@ def main():
         "🚀 Eine Reise zum Mars dauert etwa 7-9 Monate"
     ]
     
-    # Zeige 3 zufällige Fakten
-    selected_facts = random.sample(mars_facts, 3)
+    # Zeige 3 Fakten des Tages
+    selected_facts = daily_sample('mars_facts', mars_facts, 3)
     for fact in selected_facts:
         st.info(fact)
     
     # Sidebar Information
+    mars_weather = mars_api.get_mars_weather()
+    mars_clock = mars_api.get_mars_clock()
     with st.sidebar:
         st.markdown("### 🔴 Mars Mission Info")
         st.markdown(f"""
-        **Current Sol:** {mars_weather['sol']}
+        **Current Sol:** {mars_weather['sol']} (Perseverance)
         **Earth Date:** {datetime.now().strftime('%Y-%m-%d')}
-        **Season:** {mars_weather['season']}
+        **Mars Time (MTC):** {mars_clock['perseverance']['mtc']}
+        **Season:** {mars_weather['season']} (Ls {mars_weather['ls']:.0f}°)
         
         **Active Rovers:**
-        - 🤖 Perseverance (2021-)
-        - 🔬 Curiosity (2012-)
+        - 🤖 Perseverance (2021-): Sol {mars_clock['perseverance']['sol']}, {mars_clock['perseverance']['lmst']} LMST
+        - 🔬 Curiosity (2012-): Sol {mars_clock['curiosity']['sol']}, {mars_clock['curiosity']['lmst']} LMST
         
         **Mars Facts:**
         - Distance from Sun: 227M km
@@ -516,9 +704,6 @@ def main():
         
         st.markdown("---")
         st.markdown(f"*🔄 Last updated: Sol {mars_weather['sol']}*")
-    
-    # Auto-refresh
-    time.sleep(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
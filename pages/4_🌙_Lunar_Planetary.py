@@ -1,10 +1,20 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import math
-import time
-import random
+from datetime import datetime, timedelta, timezone
+
+from utils.almanac import get_almanac
+from utils.astro import julian_day
+from utils.fragments import auto_refresh_toggle, fragment
+from utils.instrumentation import FIGURE, set_page, timed
+from utils.lunar import (
+    FULL_MOON, NEW_MOON, moon_elongation, moon_illumination, next_phase, phase_name,
+    to_local_datetime, today_local
+)
+from utils.planets import PLANETS, PLANET_INFO, orbit_path, orbital_period_days, planet_positions
+from utils.simulation import daily_sample
+from utils.sky_events import get_event_catalog
+from utils.visibility import compass_direction, format_time, format_window, night_visibility
 
 # Page Config
 st.set_page_config(
@@ -13,6 +23,8 @@ st.set_page_config(
     layout="wide"
 )
 
+set_page("Lunar & Planetary")
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -90,98 +102,65 @@ class LunarPlanetaryTracker:
         pass
     
     def get_moon_phase(self):
-        """Berechnet aktuelle Mondphase"""
-        # Referenzdatum: Neumond am 13. Januar 2025
-        reference_new_moon = datetime(2025, 1, 13)
-        now = datetime.now()
-        
-        # Mondphase-Zyklus: 29.53 Tage
-        lunar_cycle = 29.53
-        
-        # Tage seit Referenz-Neumond
-        days_since = (now - reference_new_moon).total_seconds() / (24 * 3600)
-        
-        # Position im Zyklus (0-1)
-        cycle_position = (days_since % lunar_cycle) / lunar_cycle
-        
-        # Mondphase bestimmen
-        if cycle_position < 0.0625:  # Neumond
-            phase_name = "🌑 Neumond"
-            illumination = 0
-        elif cycle_position < 0.1875:  # Zunehmende Sichel
-            phase_name = "🌒 Zunehmende Sichel"
-            illumination = 25
-        elif cycle_position < 0.3125:  # Erstes Viertel
-            phase_name = "🌓 Erstes Viertel"
-            illumination = 50
-        elif cycle_position < 0.4375:  # Zunehmender Mond
-            phase_name = "🌔 Zunehmender Mond"
-            illumination = 75
-        elif cycle_position < 0.5625:  # Vollmond
-            phase_name = "🌕 Vollmond"
-            illumination = 100
-        elif cycle_position < 0.6875:  # Abnehmender Mond
-            phase_name = "🌖 Abnehmender Mond"
-            illumination = 75
-        elif cycle_position < 0.8125:  # Letztes Viertel
-            phase_name = "🌗 Letztes Viertel"
-            illumination = 50
-        else:  # Abnehmende Sichel
-            phase_name = "🌘 Abnehmende Sichel"
-            illumination = 25
-        
-        # Nächste Mondphasen berechnen
-        days_to_next_new = (lunar_cycle - (days_since % lunar_cycle)) % lunar_cycle
-        days_to_next_full = (lunar_cycle/2 - (days_since % lunar_cycle)) % lunar_cycle
-        if days_to_next_full < 0:
-            days_to_next_full += lunar_cycle
+        """Berechnet aktuelle Mondphase (Meeus-Ephemeride)"""
+        now = datetime.now(timezone.utc)
+        jd = float(julian_day(now)[0])
+        
+        elongation = float(moon_elongation(jd)[0])
+        illumination = float(moon_illumination(jd)[0]) * 100
+        
+        # Exakte Zeitpunkte der nächsten Hauptphasen
+        next_new_jd = next_phase(jd, NEW_MOON)
+        next_full_jd = next_phase(jd, FULL_MOON)
+        
+        # Mondauf-/untergang heute in Hamburg (aus dem Jahres-Almanach)
+        today = get_almanac().day(today_local())
         
         return {
-            'phase_name': phase_name,
-            'illumination': illumination,
-            'cycle_position': cycle_position,
-            'days_to_next_new': int(days_to_next_new),
-            'days_to_next_full': int(days_to_next_full),
-            'next_new_moon': now + timedelta(days=days_to_next_new),
-            'next_full_moon': now + timedelta(days=days_to_next_full)
+            'phase_name': phase_name(elongation),
+            'illumination': round(illumination),
+            'cycle_position': elongation / 360,
+            'days_to_next_new': int(next_new_jd - jd),
+            'days_to_next_full': int(next_full_jd - jd),
+            'next_new_moon': to_local_datetime(next_new_jd),
+            'next_full_moon': to_local_datetime(next_full_jd),
+            'moonrise': to_local_datetime(today['moonrise']),
+            'moonset': to_local_datetime(today['moonset'])
         }
     
     def calculate_planet_positions(self):
-        """Berechnet aktuelle Planetenpositionen"""
+        """Berechnet aktuelle Planetenpositionen (Kepler-Bahnelemente)"""
         try:
-            day_of_year = datetime.now().timetuple().tm_yday
+            jd = julian_day(datetime.now(timezone.utc))
+            ephemeris = planet_positions(jd, PLANETS)
+            night = night_visibility()
+            today = get_almanac().day(today_local())
             
-            planets = {
-                'Mercury': {
-                    'distance': 0.39, 'period': 88, 'color': '#8C7853',
-                    'description': 'Sonnennächster Planet'
-                },
-                'Venus': {
-                    'distance': 0.72, 'period': 225, 'color': '#FFC649',
-                    'description': 'Morgen-/Abendstern'
-                },
-                'Mars': {
-                    'distance': 1.52, 'period': 687, 'color': '#CD5C5C',
-                    'description': 'Der Rote Planet'
-                },
-                'Jupiter': {
-                    'distance': 5.2, 'period': 4333, 'color': '#D2691E',
-                    'description': 'Größter Planet'
-                },
-                'Saturn': {
-                    'distance': 9.5, 'period': 10759, 'color': '#FAD5A5',
-                    'description': 'Planet mit Ringen'
+            planets = {}
+            for i, planet in enumerate(ephemeris['names']):
+                x, y, _ = ephemeris['helio_xyz'][i, 0]
+                planets[planet] = {
+                    'distance': round(float(ephemeris['helio_distance'][i, 0]), 2),
+                    'period': round(orbital_period_days(planet)),
+                    'color': PLANET_INFO[planet]['color'],
+                    'description': PLANET_INFO[planet]['description'],
+                    'angle': float(ephemeris['helio_longitude'][i, 0]),
+                    'x': float(x),
+                    'y': float(y),
+                    'elongation': float(ephemeris['elongation'][i, 0]),
+                    'orbit': orbit_path(planet, jd)
                 }
-            }
-            
-            for planet in planets:
-                angle = (day_of_year / planets[planet]['period']) * 360
-                planets[planet]['angle'] = angle % 360
-                planets[planet]['x'] = planets[planet]['distance'] * math.cos(math.radians(angle))
-                planets[planet]['y'] = planets[planet]['distance'] * math.sin(math.radians(angle))
                 
-                # Sichtbarkeit berechnen (vereinfacht)
-                planets[planet]['visible'] = self._calculate_visibility(planets[planet]['angle'])
+                # Topozentrische Sichtbarkeit in der kommenden Nacht (nicht für die Erde)
+                if planet != 'Earth':
+                    sky = night['planets'][planet]
+                    events = today['planets'][planet]
+                    planets[planet].update({
+                        'visible': self._calculate_visibility(sky),
+                        'rise': format_time(events['rise']),
+                        'transit': format_time(events['transit']),
+                        'set': format_time(events['set'])
+                    })
             
             return planets
             
@@ -189,47 +168,38 @@ class LunarPlanetaryTracker:
             st.error(f"Planet calculation error: {e}")
             return None
     
-    def _calculate_visibility(self, angle):
-        """Berechnet ob Planet sichtbar ist (vereinfacht)"""
-        # Vereinfachte Sichtbarkeitsberechnung
-        if 90 <= angle <= 270:
-            return "Abendhimmel"
-        else:
-            return "Morgenhimmel"
+    def _calculate_visibility(self, sky):
+        """Sichtbarkeits-Text aus dem Beobachtungsfenster der Nacht"""
+        if sky['window'] is None:
+            if abs(sky['elongation']) < 15:
+                return "Nicht sichtbar (Sonnennähe)"
+            return "Nicht sichtbar"
+        return f"{sky['sky']} {format_window(sky['window'])}"
     
     def get_lunar_eclipses(self):
         """Vorhersage zukünftiger Mondfinsternisse"""
-        # Bekannte Mondfinsternis-Daten für 2025-2026
-        eclipses = [
-            {
-                'date': datetime(2025, 9, 7),
-                'type': 'Partielle Mondfinsternis',
-                'visibility': 'Europa, Afrika, Asien',
-                'duration': '3h 28m'
-            },
-            {
-                'date': datetime(2026, 3, 3),
-                'type': 'Totale Mondfinsternis',
-                'visibility': 'Pazifik, Australien, Asien',
-                'duration': '3h 20m'
-            },
-            {
-                'date': datetime(2026, 8, 28),
-                'type': 'Partielle Mondfinsternis',
-                'visibility': 'Amerika, Europa',
-                'duration': '2h 56m'
-            }
-        ]
-        
-        # Nur zukünftige Finsternisse
-        now = datetime.now()
-        future_eclipses = [e for e in eclipses if e['date'] > now]
-        
-        return future_eclipses[:2]  # Nächste 2 Finsternisse
+        return self._get_eclipses('lunar_eclipse')
     
-    def get_stargazing_conditions(self):
+    def get_solar_eclipses(self):
+        """Vorhersage zukünftiger Sonnenfinsternisse"""
+        return self._get_eclipses('solar_eclipse')
+    
+    def _get_eclipses(self, kind, limit=2):
+        """Nächste Finsternisse aus dem Ereignis-Katalog (Jahres-Cache in data/)"""
+        eclipses = []
+        for event in get_event_catalog().upcoming(kinds=(kind,), limit=limit):
+            eclipses.append({
+                'date': to_local_datetime(event['jd']),
+                'type': event['type'],
+                'visibility': event['visibility'],
+                'duration': event['duration']
+            })
+        
+        return eclipses
+    
+    def get_stargazing_conditions(self, moon_phase=None):
         """Sternbeobachtungs-Bedingungen für Hamburg"""
-        moon_phase = self.get_moon_phase()
+        moon_phase = moon_phase or self.get_moon_phase()
         
         # Mondschein-Einfluss
         if moon_phase['illumination'] < 25:
@@ -242,20 +212,37 @@ class LunarPlanetaryTracker:
             moon_interference = "Schwierig"
             moon_color = "#e74c3c"
         
-        # Beste Beobachtungszeiten
-        best_times = [
-            "22:00 - 24:00 Uhr (Abend)",
-            "02:00 - 05:00 Uhr (Früh)",
-            "Mondschein berücksichtigen"
+        # Beste Beobachtungszeiten: astronomische Dunkelheit von heute Abend bis morgen früh
+        almanac = get_almanac()
+        today = almanac.day(today_local())
+        tomorrow = almanac.day(today_local() + timedelta(days=1))
+        dusk, dawn = today['astronomical_dusk'], tomorrow['astronomical_dawn']
+        sun_times = f"Sonnenuntergang {format_time(today['sunset'])} Uhr, Sonnenaufgang {format_time(tomorrow['sunrise'])} Uhr"
+        if dusk == dusk and dawn == dawn:
+            best_times = [
+                f"{format_time(dusk)} - {format_time(dawn)} Uhr (astronomische Nacht)",
+                sun_times,
+                "Mondschein berücksichtigen"
+            ]
+        else:
+            # Im Hochsommer wird es in Hamburg nicht astronomisch dunkel
+            best_times = [
+                f"{format_time(today['civil_dusk'])} - {format_time(tomorrow['civil_dawn'])} Uhr (keine volle Dunkelheit)",
+                sun_times,
+                "Mondschein berücksichtigen"
+            ]
+        
+        night = night_visibility()
+        
+        # Mit bloßem Auge sichtbare Planeten, höchster zuerst
+        candidates = [
+            (name, sky) for name, sky in night['planets'].items()
+            if sky['naked_eye'] and sky['window'] is not None
+        ]
+        candidates.sort(key=lambda item: item[1]['best_altitude'], reverse=True)
+        visible_planets = [
+            f"{name} ({sky['sky']} {format_window(sky['window'])})" for name, sky in candidates
         ]
-        
-        # Planetensichtbarkeit
-        planets = self.calculate_planet_positions()
-        visible_planets = []
-        if planets:
-            for name, data in planets.items():
-                if data.get('visible'):
-                    visible_planets.append(f"{name} ({data['visible']})")
         
         return {
             'moon_interference': moon_interference,
@@ -265,25 +252,30 @@ class LunarPlanetaryTracker:
             'moon_phase': moon_phase['phase_name']
         }
     
-    def get_planetary_conjunctions(self):
-        """Vorhersage Planetenkonjunktionen"""
-        # Simulierte/vereinfachte Konjunktionen
-        conjunctions = [
-            {
-                'date': datetime.now() + timedelta(days=15),
-                'planets': 'Venus & Jupiter',
-                'description': 'Sehr enge Konjunktion am Abendhimmel',
-                'separation': '0.5°'
-            },
-            {
-                'date': datetime.now() + timedelta(days=45),
-                'planets': 'Mars & Saturn',
-                'description': 'Morgendliche Konjunktion',
-                'separation': '2.1°'
-            }
-        ]
-        
-        return conjunctions
+    def get_planetary_conjunctions(self, limit=4):
+        """Vorhersage Planetenkonjunktionen und Oppositionen"""
+        conjunctions = []
+        
+        for event in get_event_catalog().upcoming(kinds=('conjunction', 'opposition'), horizon_years=1):
+            if event['kind'] == 'opposition':
+                conjunctions.append({
+                    'date': to_local_datetime(event['jd']),
+                    'planets': f"{event['bodies'][0]} in Opposition",
+                    'description': f"Ganze Nacht sichtbar, {event['distance_au']:.2f} AE Entfernung",
+                    'separation': '180° zur Sonne'
+                })
+            elif abs(event['elongation']) >= 15:
+                # Konjunktionen in Sonnennähe sind nicht beobachtbar
+                sky = 'am Abendhimmel' if event['elongation'] > 0 else 'am Morgenhimmel'
+                closeness = 'Sehr enge Konjunktion' if event['separation'] < 1 else 'Konjunktion'
+                conjunctions.append({
+                    'date': to_local_datetime(event['jd']),
+                    'planets': ' & '.join(event['bodies']),
+                    'description': f"{closeness} {sky}",
+                    'separation': f"{event['separation']:.1f}°"
+                })
+        
+        return conjunctions[:limit]
     
     def get_lunar_facts(self):
         """Interessante Mond-Fakten"""
@@ -299,8 +291,9 @@ class LunarPlanetaryTracker:
             "📡 China, USA und Indien haben Rover auf dem Mond",
             "🌙 Der Mond entstand wahrscheinlich durch eine Kollision vor 4,5 Mrd Jahren"
         ]
-        return random.sample(facts, 3)
+        return daily_sample('lunar_facts', facts, 3)
 
+@timed('solar_system_plot', FIGURE)
 def create_solar_system_plot(planets):
     """Erstellt interaktives Sonnensystem-Diagramm"""
     if not planets:
@@ -327,10 +320,8 @@ def create_solar_system_plot(planets):
             hovertemplate=f'🪐 {planet_name}<br>Entfernung: {data["distance"]:.1f} AE<br>Winkel: {data["angle"]:.1f}°<br>Sichtbar: {data.get("visible", "Unbekannt")}<extra></extra>'
         ))
         
-        # Orbit-Kreise
-        theta = [i * 2 * math.pi / 100 for i in range(101)]
-        orbit_x = [data['distance'] * math.cos(t) for t in theta]
-        orbit_y = [data['distance'] * math.sin(t) for t in theta]
+        # Orbit-Ellipsen
+        orbit_x, orbit_y = data['orbit']
         
         fig.add_trace(go.Scatter(
             x=orbit_x, y=orbit_y,
@@ -354,37 +345,63 @@ def create_solar_system_plot(planets):
     
     return fig
 
+@timed('planet_altitude_chart', FIGURE)
+def create_planet_altitude_chart(night):
+    """Erstellt Höhenverlauf der Planeten über Hamburg für die kommende Nacht"""
+    times = [to_local_datetime(jd) for jd in night['times']]
+    
+    fig = go.Figure()
+    
+    # Sonne als Referenz für die Dämmerung
+    fig.add_trace(go.Scatter(
+        x=times, y=night['sun_altitude'],
+        mode='lines',
+        line=dict(color='gold', width=1, dash='dash'),
+        name='Sonne',
+        hovertemplate='☀️ Sonne<br>%{x|%H:%M} Uhr<br>Höhe: %{y:.1f}°<extra></extra>'
+    ))
+    
+    for name, sky in night['planets'].items():
+        fig.add_trace(go.Scatter(
+            x=times, y=sky['altitude'],
+            mode='lines',
+            line=dict(color=PLANET_INFO[name]['color'], width=2 if sky['naked_eye'] else 1),
+            name=name,
+            customdata=[compass_direction(az) for az in sky['azimuth']],
+            hovertemplate=f'🪐 {name}<br>%{{x|%H:%M}} Uhr<br>Höhe: %{{y:.1f}}°<br>Richtung: %{{customdata}}<extra></extra>'
+        ))
+    
+    fig.add_hline(y=0, line_color='gray', line_width=1)
+    fig.update_layout(
+        title='🔭 Planetenhöhen über Hamburg (heute Nacht)',
+        xaxis_title='Uhrzeit',
+        yaxis_title='Höhe (°)',
+        yaxis=dict(range=[-20, 90]),
+        template='plotly_dark',
+        height=450
+    )
+    
+    return fig
+
+@timed('moon_phase_calendar', FIGURE)
 def create_moon_phase_calendar():
     """Erstellt Mondphasen-Kalender für nächste 4 Wochen"""
-    lunar_tracker = LunarPlanetaryTracker()
-    moon_data = lunar_tracker.get_moon_phase()
+    # 28 Tage direkt aus dem Jahres-Almanach
+    calendar = get_almanac().days(today_local(), 28)
     
-    # Simuliere Mondphasen für nächste 28 Tage
-    dates = []
+    dates = [to_local_datetime(jd).strftime('%d.%m') for jd in calendar['midnight']]
+    illuminations = [int(round(i * 100)) for i in calendar['moon_illumination']]
     phases = []
-    illuminations = []
-    
-    for i in range(28):
-        date = datetime.now() + timedelta(days=i)
-        # Vereinfachte Mondphasen-Berechnung
-        cycle_day = (i + moon_data['cycle_position'] * 29.53) % 29.53
-        
-        if cycle_day < 7.4:
-            phase = 'Zunehmend'
-            illum = int(cycle_day / 7.4 * 50)
-        elif cycle_day < 14.8:
-            phase = 'Vollmond'
-            illum = int(50 + (cycle_day - 7.4) / 7.4 * 50)
-        elif cycle_day < 22.1:
-            phase = 'Abnehmend'
-            illum = int(100 - (cycle_day - 14.8) / 7.3 * 50)
+    
+    for elongation in calendar['moon_elongation']:
+        if elongation < 45 or elongation >= 315:
+            phases.append('Neumond')
+        elif elongation < 135:
+            phases.append('Zunehmend')
+        elif elongation < 225:
+            phases.append('Vollmond')
         else:
-            phase = 'Neumond'
-            illum = int(50 - (cycle_day - 22.1) / 7.4 * 50)
-        
-        dates.append(date.strftime('%d.%m'))
-        phases.append(phase)
-        illuminations.append(max(0, illum))
+            phases.append('Abnehmend')
     
     fig = go.Figure(data=go.Bar(
         x=dates,
@@ -410,6 +427,130 @@ def create_moon_phase_calendar():
     
     return fig
 
+def render_moon_phase(tracker):
+    """Aktuelle Mondphase, nächste Phasen und Beobachtungsbedingungen
+
+    Gibt (moon_data, stargazing) zurück, damit main() sie beim kompletten Lauf nicht
+    ein zweites Mal berechnet; Fragment-Läufe rechnen selbst neu.
+    """
+    moon_data = tracker.get_moon_phase()
+    stargazing = tracker.get_stargazing_conditions(moon_data)
+    
+    # Current Moon Phase (Featured)
+    st.markdown("### 🌙 Current Moon Phase")
+    
+    col_moon, col_info = st.columns([1, 2])
+    
+    with col_moon:
+        st.markdown(f"""
+        <div class="moon-phase-card">
+            <h2>{moon_data['phase_name']}</h2>
+            <h1 style="font-size: 4rem; margin: 1rem 0;">{moon_data['illumination']}%</h1>
+            <p style="font-size: 1.2rem;">Beleuchtung</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_info:
+        next_new = moon_data['next_new_moon'].strftime('%d.%m.%Y %H:%M')
+        next_full = moon_data['next_full_moon'].strftime('%d.%m.%Y %H:%M')
+        moonrise = moon_data['moonrise'].strftime('%H:%M') if moon_data['moonrise'] else '—'
+        moonset = moon_data['moonset'].strftime('%H:%M') if moon_data['moonset'] else '—'
+        
+        st.markdown(f"""
+        <div class="lunar-stat">
+            <h3>📅 Nächste Mondphasen</h3>
+            <p><strong>🌑 Neumond:</strong> {next_new} (in {moon_data['days_to_next_new']} Tagen)</p>
+            <p><strong>🌕 Vollmond:</strong> {next_full} (in {moon_data['days_to_next_full']} Tagen)</p>
+            <p><strong>🌅 Mondaufgang:</strong> {moonrise} | <strong>🌄 Monduntergang:</strong> {moonset}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div class="lunar-stat">
+            <h3>🔭 Stargazing Conditions</h3>
+            <p><strong>Mondschein:</strong> <span style="color: {stargazing['moon_color']}">{stargazing['moon_interference']}</span></p>
+            <p><strong>Beste Zeit:</strong> {stargazing['best_times'][0]}</p>
+            <p><strong>Mondphase:</strong> {stargazing['moon_phase']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    return moon_data, stargazing
+
+def render_planets(tracker):
+    """Sonnensystem, Planetensichtbarkeit und Höhenverlauf der Nacht"""
+    planets = tracker.calculate_planet_positions()
+    
+    # Solar System Visualization
+    if planets:
+        st.markdown("---")
+        st.markdown("### 🌌 Sonnensystem - Live Planetenpositionen")
+        
+        solar_system_fig = create_solar_system_plot(planets)
+        if solar_system_fig:
+            st.plotly_chart(solar_system_fig, use_container_width=True)
+        
+        # Planet Visibility
+        st.markdown("### 🪐 Planetensichtbarkeit von Hamburg")
+        
+        observable = {name: data for name, data in planets.items() if data.get('visible')}
+        planet_cols = st.columns(len(observable))
+        
+        for i, (name, data) in enumerate(observable.items()):
+            col = planet_cols[i]
+            
+            col.markdown(f"""
+            <div class="planet-card" style="background: linear-gradient(135deg, {data['color']} 0%, {data['color']}aa 100%);">
+                <h4>🪐 {name}</h4>
+                <p><strong>Entfernung:</strong> {data['distance']} AE</p>
+                <p><strong>Position:</strong> {data['angle']:.0f}°</p>
+                <p><strong>Sichtbar:</strong> {data.get('visible', 'Berechnung...')}</p>
+                <p><strong>Auf/Kulm./Unter:</strong> {data['rise']} / {data['transit']} / {data['set']}</p>
+                <p style="font-size: 0.9rem;"><em>{data['description']}</em></p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.plotly_chart(create_planet_altitude_chart(night_visibility()), use_container_width=True)
+
+def render_almanac():
+    """Almanach für ein wählbares Datum"""
+    # Almanac lookup for any date
+    st.markdown("---")
+    st.markdown("### 📖 Himmels-Almanach Hamburg")
+    
+    almanac_date = st.date_input("Datum", value=today_local(), key="almanac_date")
+    almanac_day = get_almanac().day(almanac_date)
+    
+    col_sun, col_moon_day = st.columns(2)
+    with col_sun:
+        st.markdown(f"""
+        <div class="lunar-stat">
+            <h3>☀️ Sonne</h3>
+            <p><strong>Aufgang:</strong> {format_time(almanac_day['sunrise'])} | <strong>Untergang:</strong> {format_time(almanac_day['sunset'])}</p>
+            <p><strong>Bürgerliche Dämmerung:</strong> {format_time(almanac_day['civil_dawn'])} / {format_time(almanac_day['civil_dusk'])}</p>
+            <p><strong>Astronomische Dämmerung:</strong> {format_time(almanac_day['astronomical_dawn'])} / {format_time(almanac_day['astronomical_dusk'])}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col_moon_day:
+        st.markdown(f"""
+        <div class="lunar-stat">
+            <h3>🌙 Mond</h3>
+            <p><strong>Phase:</strong> {phase_name(almanac_day['moon_elongation'])} ({almanac_day['moon_illumination'] * 100:.0f}%)</p>
+            <p><strong>Aufgang:</strong> {format_time(almanac_day['moonrise'])} | <strong>Untergang:</strong> {format_time(almanac_day['moonset'])}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.dataframe([
+        {
+            'Planet': name,
+            'Aufgang': format_time(events['rise']),
+            'Kulmination': format_time(events['transit']),
+            'Höhe': f"{events['transit_altitude']:.0f}°",
+            'Untergang': format_time(events['set']),
+            'Elongation': f"{events['elongation']:+.0f}°"
+        }
+        for name, events in almanac_day['planets'].items()
+    ], hide_index=True, use_container_width=True)
+
 def main():
     # Header
     st.markdown('<h1 class="lunar-header">🌙 LUNAR & PLANETARY DASHBOARD</h1>', unsafe_allow_html=True)
@@ -429,10 +570,7 @@ def main():
     # Sidebar Controls
     st.sidebar.markdown("## 🎛️ Lunar Observatory")
     
-    auto_refresh = st.sidebar.checkbox("🔄 Auto-Refresh (5 min)", value=False)
-    if auto_refresh:
-        time.sleep(300)
-        st.rerun()
+    every = auto_refresh_toggle()
     
     if st.sidebar.button("🌙 Update Lunar Data", type="primary"):
         st.rerun()
@@ -452,47 +590,13 @@ def main():
     
     # Get data
     with st.spinner("🌙 Calculating celestial positions..."):
-        moon_data = tracker.get_moon_phase()
-        planets = tracker.calculate_planet_positions()
-        stargazing = tracker.get_stargazing_conditions()
         lunar_eclipses = tracker.get_lunar_eclipses()
+        solar_eclipses = tracker.get_solar_eclipses()
         conjunctions = tracker.get_planetary_conjunctions()
         lunar_facts = tracker.get_lunar_facts()
         
-        # Current Moon Phase (Featured)
-        st.markdown("### 🌙 Current Moon Phase")
-        
-        col_moon, col_info = st.columns([1, 2])
-        
-        with col_moon:
-            st.markdown(f"""
-            <div class="moon-phase-card">
-                <h2>{moon_data['phase_name']}</h2>
-                <h1 style="font-size: 4rem; margin: 1rem 0;">{moon_data['illumination']}%</h1>
-                <p style="font-size: 1.2rem;">Beleuchtung</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col_info:
-            next_new = moon_data['next_new_moon'].strftime('%d.%m.%Y')
-            next_full = moon_data['next_full_moon'].strftime('%d.%m.%Y')
-            
-            st.markdown(f"""
-            <div class="lunar-stat">
-                <h3>📅 Nächste Mondphasen</h3>
-                <p><strong>🌑 Neumond:</strong> {next_new} (in {moon_data['days_to_next_new']} Tagen)</p>
-                <p><strong>🌕 Vollmond:</strong> {next_full} (in {moon_data['days_to_next_full']} Tagen)</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class="lunar-stat">
-                <h3>🔭 Stargazing Conditions</h3>
-                <p><strong>Mondschein:</strong> <span style="color: {stargazing['moon_color']}">{stargazing['moon_interference']}</span></p>
-                <p><strong>Beste Zeit:</strong> {stargazing['best_times'][0]}</p>
-                <p><strong>Mondphase:</strong> {stargazing['moon_phase']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        # Mondphase & Planeten laufen im eigenen Takt, der Almanach nur bei Datumswechsel
+        moon_data, stargazing = fragment(run_every=every(300))(render_moon_phase)(tracker)
         
         # Moon Phase Calendar
         st.markdown("---")
@@ -501,46 +605,23 @@ def main():
         moon_calendar = create_moon_phase_calendar()
         st.plotly_chart(moon_calendar, use_container_width=True)
         
-        # Solar System Visualization
-        if planets:
-            st.markdown("---")
-            st.markdown("### 🌌 Sonnensystem - Live Planetenpositionen")
-            
-            solar_system_fig = create_solar_system_plot(planets)
-            if solar_system_fig:
-                st.plotly_chart(solar_system_fig, use_container_width=True)
-            
-            # Planet Visibility
-            st.markdown("### 🪐 Planetensichtbarkeit von Hamburg")
-            
-            planet_cols = st.columns(len(planets))
-            
-            for i, (name, data) in enumerate(planets.items()):
-                col = planet_cols[i]
-                
-                visibility_color = "#27ae60" if "Abend" in data.get('visible', '') else "#3498db"
-                
-                col.markdown(f"""
-                <div class="planet-card" style="background: linear-gradient(135deg, {data['color']} 0%, {data['color']}aa 100%);">
-                    <h4>🪐 {name}</h4>
-                    <p><strong>Entfernung:</strong> {data['distance']} AE</p>
-                    <p><strong>Position:</strong> {data['angle']:.0f}°</p>
-                    <p><strong>Sichtbar:</strong> {data.get('visible', 'Berechnung...')}</p>
-                    <p style="font-size: 0.9rem;"><em>{data['description']}</em></p>
-                </div>
-                """, unsafe_allow_html=True)
+        fragment(run_every=every(300))(render_planets)(tracker)
         
-        # Lunar Eclipses
-        if lunar_eclipses:
+        fragment()(render_almanac)()
+        
+        # Lunar & Solar Eclipses
+        if lunar_eclipses or solar_eclipses:
             st.markdown("---")
-            st.markdown("### 🌙 Kommende Mondfinsternisse")
+            st.markdown("### 🌙 Kommende Finsternisse")
+            
+            eclipses = [('🌙', e) for e in lunar_eclipses] + [('☀️', e) for e in solar_eclipses]
             
-            for eclipse in lunar_eclipses:
-                days_until = (eclipse['date'] - datetime.now()).days
+            for icon, eclipse in sorted(eclipses, key=lambda item: item[1]['date']):
+                days_until = (eclipse['date'] - datetime.now(timezone.utc)).days
                 
                 st.markdown(f"""
                 <div class="eclipse-card">
-                    <h4>🌙 {eclipse['type']}</h4>
+                    <h4>{icon} {eclipse['type']}</h4>
                     <p><strong>📅 Datum:</strong> {eclipse['date'].strftime('%d.%m.%Y')} (in {days_until} Tagen)</p>
                     <p><strong>🌍 Sichtbar in:</strong> {eclipse['visibility']}</p>
                     <p><strong>⏱️ Dauer:</strong> {eclipse['duration']}</p>
@@ -553,7 +634,7 @@ def main():
             st.markdown("### ✨ Planetenkonjunktionen")
             
             for conj in conjunctions:
-                days_until = (conj['date'] - datetime.now()).days
+                days_until = (conj['date'] - datetime.now(timezone.utc)).days
                 
                 st.markdown(f"""
                 <div class="conjunction-alert">
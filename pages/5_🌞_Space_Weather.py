@@ -1,9 +1,19 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import random
-import time
+import folium
+from streamlit_folium import folium_static
+from datetime import datetime, timezone
+
+import numpy as np
+
+from utils.aurora import aurora_grid, city_probabilities, probability_rgba
+from utils.config import HAMBURG_LAT, HAMBURG_LON
+from utils.fragments import auto_refresh_toggle, fragment
+from utils.instrumentation import FIGURE, MAP, RENDER, set_page, span, timed
+from utils.prefetch import start_prefetcher
+from utils.simulation import daily_sample
+from utils.space_weather import get_space_weather_store, to_datetime
 
 # Page Config
 st.set_page_config(
@@ -12,6 +22,8 @@ st.set_page_config(
     layout="wide"
 )
 
+set_page("Space Weather")
+
 # CSS auf Deutsch
 st.markdown("""
 <style>
@@ -83,74 +95,80 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Kachelfarbe für Messwerte, deren Feed (noch) fehlt
+KEINE_DATEN_FARBE = "#95a5a6"
+
+def _wert(wert, format_spec=''):
+    """Messwert formatiert, '—' wenn der Feed fehlt"""
+    return '—' if wert is None else format(wert, format_spec)
+
 class WeltraumWetterStation:
     def __init__(self):
-        pass
+        # Die Feeds lädt der Prefetcher im Hintergrund, die Seite liest nur den Store
+        self.store = get_space_weather_store()
     
     def get_weltraum_wetter(self):
-        """Holt aktuelle Weltraum-Wetter-Bedingungen"""
-        # Simuliere realistische Weltraum-Wetter-Daten
-        
-        # Sonnenwind-Geschwindigkeit (normalerweise 300-800 km/s)
-        sonnenwind_geschwindigkeit = 350 + random.randint(0, 450)
-        
-        # Magnetfeld-Stärke (normalerweise 1-20 nT)
-        magnetfeld_staerke = 2.5 + random.random() * 15
-        
-        # Protonenfluss (Teilchen/cm²/s)
-        protonen_fluss = random.randint(1, 50)
-        
-        # Geomagnetischer Index Kp (0-9)
-        kp_index = random.randint(0, 8)
+        """Aktuelle Weltraum-Wetter-Bedingungen aus den gespeicherten SWPC-Zeitreihen
+
+        Fehlt ein Feed, bleiben nur dessen Werte leer (None); None nur, wenn noch gar nichts vorliegt.
+        """
+        plasma = self.store.latest('plasma')
+        mag = self.store.latest('mag')
+        kp = self.store.latest('kp')
+        protonen = self.store.latest('protons')
+        messungen = [messung for messung in (plasma, mag, kp, protonen) if messung]
+        if not messungen:
+            return None
+        
+        weltraum_wetter = {
+            'sonnenwind_geschwindigkeit': round(plasma['speed']) if plasma else None,
+            'dichte': plasma['density'] if plasma else None,
+            'magnetfeld_staerke': mag['bt'] if mag else None,
+            'bz': mag['bz'] if mag else None,
+            'protonen_fluss': protonen['flux'] if protonen else None,
+            'kp_index': kp['kp'] if kp else None,
+            'kp_zeit': kp['time'] if kp else None,
+            'aurora_aktivitaet': None,
+            'aurora_farbe': KEINE_DATEN_FARBE,
+            'strahlungsrisiko': None,
+            'strahlung_farbe': KEINE_DATEN_FARBE,
+            'zeitpunkt': to_datetime(max(messung['time'] for messung in messungen))
+        }
         
         # Aurora-Aktivität basierend auf Kp-Index
-        if kp_index < 3:
-            aurora_aktivitaet = "Gering"
-            aurora_farbe = "#27ae60"
-        elif kp_index < 6:
-            aurora_aktivitaet = "Mäßig"
-            aurora_farbe = "#f39c12"
-        else:
-            aurora_aktivitaet = "Hoch"
-            aurora_farbe = "#e74c3c"
-        
-        # Strahlungsrisiko
-        if protonen_fluss < 10:
-            strahlungsrisiko = "Normal"
-            strahlung_farbe = "#27ae60"
-        elif protonen_fluss < 30:
-            strahlungsrisiko = "Erhöht"
-            strahlung_farbe = "#f39c12"
-        else:
-            strahlungsrisiko = "Hoch"
-            strahlung_farbe = "#e74c3c"
+        if kp:
+            if kp['kp'] < 3:
+                weltraum_wetter.update(aurora_aktivitaet="Gering", aurora_farbe="#27ae60")
+            elif kp['kp'] < 6:
+                weltraum_wetter.update(aurora_aktivitaet="Mäßig", aurora_farbe="#f39c12")
+            else:
+                weltraum_wetter.update(aurora_aktivitaet="Hoch", aurora_farbe="#e74c3c")
+        
+        # Strahlungsrisiko (NOAA S-Skala: S1 ab 10 pfu, S2 ab 100 pfu)
+        if protonen:
+            if protonen['flux'] < 10:
+                weltraum_wetter.update(strahlungsrisiko="Normal", strahlung_farbe="#27ae60")
+            elif protonen['flux'] < 100:
+                weltraum_wetter.update(strahlungsrisiko="Erhöht", strahlung_farbe="#f39c12")
+            else:
+                weltraum_wetter.update(strahlungsrisiko="Hoch", strahlung_farbe="#e74c3c")
         
-        return {
-            'sonnenwind_geschwindigkeit': sonnenwind_geschwindigkeit,
-            'magnetfeld_staerke': magnetfeld_staerke,
-            'protonen_fluss': protonen_fluss,
-            'kp_index': kp_index,
-            'aurora_aktivitaet': aurora_aktivitaet,
-            'aurora_farbe': aurora_farbe,
-            'strahlungsrisiko': strahlungsrisiko,
-            'strahlung_farbe': strahlung_farbe
-        }
+        return weltraum_wetter
+    
+    def get_sonnenwind_verlauf(self, stunden=24):
+        """Sonnenwind-Verlauf (Mittel/Min/Max) der letzten Stunden, auf max. 600 Punkte reduziert"""
+        return self.store.history('plasma', 'speed', stunden * 3600)
     
     def get_sonnen_eruptionen(self):
-        """Holt aktuelle Sonnen-Eruptionen"""
+        """GOES Röntgen-Flares der letzten 7 Tage"""
         eruptionen = []
         
-        # Simuliere 3-5 kürzliche Eruptionen
-        for i in range(random.randint(3, 5)):
-            klasse = random.choice(['A', 'B', 'C', 'M', 'X'])
-            staerke = random.randint(1, 9)
-            zeit = datetime.now() - timedelta(hours=random.randint(1, 72))
-            
+        for flare in self.store.series('xray_flares'):
             eruptionen.append({
-                'klasse': f"{klasse}{staerke}",
-                'zeit': zeit,
-                'quelle': f"AR{3000 + random.randint(100, 999)}",
-                'auswirkung': self._get_eruption_auswirkung(klasse)
+                'klasse': flare['klasse'],
+                'zeit': to_datetime(flare['time']),
+                'quelle': f"GOES-{flare['satellite']}" if flare.get('satellite') else "GOES",
+                'auswirkung': self._get_eruption_auswirkung(flare['klasse'][0])
             })
         
         return sorted(eruptionen, key=lambda x: x['zeit'], reverse=True)
@@ -167,13 +185,16 @@ class WeltraumWetterStation:
         return auswirkungen.get(klasse, 'Unbekannt')
     
     def get_magnetfeld_prognose(self):
-        """Erstellt 7-Tage Magnetfeld-Prognose"""
-        prognose = []
+        """Kp-Prognose (Tagesmaximum) aus der SWPC 3-Tage-Vorhersage"""
+        tage = {}
+        for eintrag in self.store.series('kp_forecast'):
+            if eintrag['observed'] != 'predicted':
+                continue
+            datum = to_datetime(eintrag['time']).replace(hour=0, minute=0, second=0)
+            tage[datum] = max(tage.get(datum, 0), eintrag['kp'])
         
-        for i in range(7):
-            datum = datetime.now() + timedelta(days=i)
-            kp_wert = max(0, min(9, 3 + random.randint(-2, 5)))
-            
+        prognose = []
+        for datum, kp_wert in sorted(tage.items()):
             if kp_wert < 3:
                 bedingung = "Ruhig"
                 farbe = "#27ae60"
@@ -196,26 +217,16 @@ class WeltraumWetterStation:
         
         return prognose
     
-    def get_aurora_wahrscheinlichkeit(self):
-        """Berechnet Aurora-Wahrscheinlichkeit für verschiedene Städte"""
-        staedte = {
-            'Hamburg': {'breitengrad': 53.5, 'grundwahrscheinlichkeit': 5},
-            'Berlin': {'breitengrad': 52.5, 'grundwahrscheinlichkeit': 3},
-            'München': {'breitengrad': 48.1, 'grundwahrscheinlichkeit': 1},
-            'Tromsø': {'breitengrad': 69.6, 'grundwahrscheinlichkeit': 80},
-            'Reykjavik': {'breitengrad': 64.1, 'grundwahrscheinlichkeit': 60},
-            'Oslo': {'breitengrad': 59.9, 'grundwahrscheinlichkeit': 30}
-        }
-        
-        weltraum_wetter = self.get_weltraum_wetter()
-        kp_bonus = weltraum_wetter['kp_index'] * 10
-        
-        for stadt in staedte:
-            base_chance = staedte[stadt]['grundwahrscheinlichkeit']
-            final_chance = min(95, base_chance + kp_bonus)
-            staedte[stadt]['wahrscheinlichkeit'] = final_chance
-        
-        return staedte
+    def get_aurora_wahrscheinlichkeit(self, weltraum_wetter):
+        """Polarlicht-Chance pro Stadt aus dem Auroral-Oval-Modell (gleicher Kp wie angezeigt)"""
+        kp_index = weltraum_wetter['kp_index'] if weltraum_wetter else None
+        return city_probabilities(kp_index if kp_index is not None else 0.0)
+    
+    def get_aurora_karte(self, weltraum_wetter):
+        """Globales Polarlicht-Gitter für das aktuelle Kp-Intervall (einmal pro Kp-Update berechnet)"""
+        if not weltraum_wetter or weltraum_wetter['kp_index'] is None:
+            return None
+        return aurora_grid(weltraum_wetter['kp_index'], weltraum_wetter['kp_zeit'])
     
     def get_weltraum_fakten(self):
         """Interessante Weltraum-Wetter-Fakten"""
@@ -231,45 +242,52 @@ class WeltraumWetterStation:
             "🔥 Sonnen-Eruptionen können Temperaturen von 100 Millionen Grad erreichen",
             "🌐 Das Erdmagnetfeld reicht bis zu 65.000 km ins All"
         ]
-        return random.sample(fakten, 3)
+        return daily_sample('space_weather_facts', fakten, 3)
 
-def create_sonnenwind_chart(weltraum_wetter):
-    """Erstellt Sonnenwind-Verlauf-Chart"""
-    # Simuliere 24-Stunden Sonnenwind-Daten
-    stunden = []
-    geschwindigkeiten = []
-    
-    base_speed = weltraum_wetter['sonnenwind_geschwindigkeit']
-    
-    for i in range(24):
-        zeit = datetime.now() - timedelta(hours=23-i)
-        variation = random.randint(-100, 100)
-        geschwindigkeit = max(250, base_speed + variation)
-        
-        stunden.append(zeit.strftime('%H:%M'))
-        geschwindigkeiten.append(geschwindigkeit)
-    
+@timed('sonnenwind_chart', FIGURE)
+def create_sonnenwind_chart(verlauf, zeitraum='24 Stunden'):
+    """Erstellt Sonnenwind-Verlauf-Chart (Mittelwert mit Min/Max-Band)"""
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
-        x=stunden,
-        y=geschwindigkeiten,
-        mode='lines+markers',
-        name='Sonnenwind-Geschwindigkeit',
-        line=dict(color='#f39c12', width=3),
-        marker=dict(size=6),
-        fill='tonexty',
-        fillcolor='rgba(243, 156, 18, 0.2)'
-    ))
-    
-    # Durchschnittslinie
-    avg_speed = sum(geschwindigkeiten) / len(geschwindigkeiten)
-    fig.add_hline(y=avg_speed, line_dash="dash", line_color="red", 
-                  annotation_text=f"Durchschnitt: {avg_speed:.0f} km/s")
+    if verlauf is not None and len(verlauf['time']):
+        zeiten = [to_datetime(int(t)) for t in verlauf['time']]
+        
+        # Min/Max-Band, damit kurze Spitzen trotz Downsampling sichtbar bleiben
+        fig.add_trace(go.Scatter(
+            x=zeiten,
+            y=verlauf['max'],
+            mode='lines',
+            line=dict(width=0),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=zeiten,
+            y=verlauf['min'],
+            mode='lines',
+            name='Min/Max',
+            line=dict(width=0),
+            fill='tonexty',
+            fillcolor='rgba(243, 156, 18, 0.25)',
+            hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=zeiten,
+            y=verlauf['mean'],
+            mode='lines',
+            name='Sonnenwind-Geschwindigkeit',
+            line=dict(color='#f39c12', width=2),
+            hovertemplate='%{x|%d.%m. %H:%M} UTC<br>%{y:.0f} km/s<extra></extra>'
+        ))
+        
+        # Durchschnittslinie
+        avg_speed = float(np.nanmean(verlauf['mean']))
+        fig.add_hline(y=avg_speed, line_dash="dash", line_color="red", 
+                      annotation_text=f"Durchschnitt: {avg_speed:.0f} km/s")
     
     fig.update_layout(
-        title='🌬️ Sonnenwind-Geschwindigkeit (Letzte 24 Stunden)',
-        xaxis_title='Uhrzeit (UTC)',
+        title=f'🌬️ Sonnenwind-Geschwindigkeit (Letzte {zeitraum})',
+        xaxis_title='Zeit (UTC)',
         yaxis_title='Geschwindigkeit (km/s)',
         template='plotly_white',
         height=400
@@ -277,6 +295,31 @@ def create_sonnenwind_chart(weltraum_wetter):
     
     return fig
 
+@timed('aurora_karte', MAP)
+def create_aurora_karte(gitter, staedte):
+    """Erstellt Weltkarte mit Polarlicht-Wahrscheinlichkeit als Heatmap-Ebene"""
+    m = folium.Map(location=[HAMBURG_LAT, HAMBURG_LON], zoom_start=2, tiles='CartoDB dark_matter')
+    
+    folium.raster_layers.ImageOverlay(
+        image=probability_rgba(gitter['probability']),
+        bounds=[[float(gitter['lat'][-1]), -180.0], [float(gitter['lat'][0]), 180.0]],
+        mercator_project=True,
+        name='Polarlicht-Wahrscheinlichkeit'
+    ).add_to(m)
+    
+    for stadt, daten in staedte.items():
+        folium.CircleMarker(
+            [daten['breitengrad'], daten['laengengrad']],
+            radius=5,
+            popup=f"📍 {stadt}<br>Polarlicht-Chance: {daten['wahrscheinlichkeit']}%",
+            color='white',
+            fill=True,
+            fillOpacity=0.9
+        ).add_to(m)
+    
+    return m
+
+@timed('kp_index_chart', FIGURE)
 def create_kp_index_chart(prognose):
     """Erstellt Kp-Index Prognose-Chart"""
     dates = [p['datum'].strftime('%d.%m') for p in prognose]
@@ -304,6 +347,184 @@ def create_kp_index_chart(prognose):
     
     return fig
 
+def render_aktuelle_bedingungen(station):
+    """Aktuelle Sonnenwind-, Magnetfeld-, Aurora- und Strahlungswerte"""
+    weltraum_wetter = station.get_weltraum_wetter()
+    
+    # Aktuelle Bedingungen
+    if weltraum_wetter is None:
+        st.warning("⚠️ Noch keine Weltraum-Wetter-Daten - die SWPC-Feeds werden im Hintergrund geladen.")
+    else:
+        st.markdown("### ⚡ Aktuelle Weltraum-Wetter-Bedingungen")
+        st.caption(f"NOAA SWPC · Messung vom {weltraum_wetter['zeitpunkt'].strftime('%d.%m.%Y %H:%M')} UTC")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown(f"""
+            <div class="solar-metric">
+                <h3>🌬️ Sonnenwind</h3>
+                <h2>{_wert(weltraum_wetter['sonnenwind_geschwindigkeit'])}</h2>
+                <p>km/s · {_wert(weltraum_wetter['dichte'], '.1f')} p/cm³</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown(f"""
+            <div class="solar-metric">
+                <h3>🧲 Magnetfeld</h3>
+                <h2>{_wert(weltraum_wetter['magnetfeld_staerke'], '.1f')}</h2>
+                <p>nT · Bz {_wert(weltraum_wetter['bz'], '+.1f')}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown(f"""
+            <div class="solar-metric" style="background: linear-gradient(135deg, {weltraum_wetter['aurora_farbe']} 0%, {weltraum_wetter['aurora_farbe']}aa 100%);">
+                <h3>🌌 Aurora</h3>
+                <h2>{_wert(weltraum_wetter['aurora_aktivitaet'])}</h2>
+                <p>Kp: {_wert(weltraum_wetter['kp_index'], '.1f')}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown(f"""
+            <div class="solar-metric" style="background: linear-gradient(135deg, {weltraum_wetter['strahlung_farbe']} 0%, {weltraum_wetter['strahlung_farbe']}aa 100%);">
+                <h3>☢️ Strahlung</h3>
+                <h2>{_wert(weltraum_wetter['strahlungsrisiko'])}</h2>
+                <p>{_wert(weltraum_wetter['protonen_fluss'], '.2f')} pfu</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+def render_sonnenwind(station):
+    """Sonnenwind-Verlauf; der Zeitraum-Wechsel läuft nur in diesem Fragment neu"""
+    weltraum_wetter = station.get_weltraum_wetter()
+    if not weltraum_wetter or weltraum_wetter['sonnenwind_geschwindigkeit'] is None:
+        return
+    
+    # Sonnenwind-Chart
+    st.markdown("---")
+    st.markdown("### 🌬️ Sonnenwind-Aktivität")
+    
+    zeitraeume = {'24 Stunden': 24, '7 Tage': 7 * 24, '30 Tage': 30 * 24}
+    zeitraum = st.radio("Zeitraum", list(zeitraeume), horizontal=True, key="sonnenwind_zeitraum")
+    
+    sonnenwind_chart = create_sonnenwind_chart(station.get_sonnenwind_verlauf(zeitraeume[zeitraum]), zeitraum)
+    st.plotly_chart(sonnenwind_chart, use_container_width=True)
+
+def render_magnetfeld_prognose(station):
+    """Kp-Prognose mit Erklärung"""
+    magnetfeld_prognose = station.get_magnetfeld_prognose()
+    
+    # Magnetfeld-Prognose
+    st.markdown("---")
+    st.markdown("### 📊 Geomagnetische Aktivitäts-Prognose")
+    
+    col_chart, col_info = st.columns([2, 1])
+    
+    with col_chart:
+        kp_chart = create_kp_index_chart(magnetfeld_prognose)
+        st.plotly_chart(kp_chart, use_container_width=True)
+    
+    with col_info:
+        st.markdown(f"""
+        <div class="magnetic-info">
+            <h3>🧲 Magnetfeld-Info</h3>
+            <p><strong>Kp-Index Bedeutung:</strong></p>
+            <p>🟢 0-2: Ruhig</p>
+            <p>🟡 3-4: Unruhig</p>
+            <p>🟠 5-6: Sturm</p>
+            <p>🔴 7+: Schwerer Sturm</p>
+            <br>
+            <p><strong>Auswirkungen:</strong></p>
+            <p>• Funkstörungen</p>
+            <p>• GPS-Ungenauigkeiten</p>
+            <p>• Polarlichter</p>
+            <p>• Satelliten-Störungen</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_eruptionen(station):
+    """Letzte Röntgen-Flares"""
+    eruptionen = station.get_sonnen_eruptionen()
+    
+    # Sonnen-Eruptionen
+    st.markdown("---")
+    st.markdown("### ☀️ Kürzliche Sonnen-Eruptionen")
+    
+    if eruptionen:
+        for eruption in eruptionen[:5]:
+            zeit_seit = datetime.now(timezone.utc) - eruption['zeit']
+            stunden_seit = int(zeit_seit.total_seconds() / 3600)
+            
+            klasse_farbe = {
+                'A': '#27ae60', 'B': '#27ae60', 'C': '#f39c12', 
+                'M': '#e67e22', 'X': '#e74c3c'
+            }.get(eruption['klasse'][0], '#34495e')
+            
+            st.markdown(f"""
+            <div class="flare-alert" style="background: linear-gradient(135deg, {klasse_farbe} 0%, {klasse_farbe}aa 100%);">
+                ☀️ Klasse {eruption['klasse']} Eruption | vor {stunden_seit}h | Quelle: {eruption['quelle']}<br>
+                💥 Auswirkung: {eruption['auswirkung']}
+            </div>
+            """, unsafe_allow_html=True)
+
+def render_aurora(station):
+    """Polarlicht-Chancen der Städte und Oval-Karte"""
+    weltraum_wetter = station.get_weltraum_wetter()
+    aurora_wahrscheinlichkeit = station.get_aurora_wahrscheinlichkeit(weltraum_wetter)
+    aurora_karte = station.get_aurora_karte(weltraum_wetter)
+    
+    # Aurora-Wahrscheinlichkeiten
+    st.markdown("---")
+    st.markdown("### 🌌 Polarlicht-Wahrscheinlichkeiten")
+    
+    aurora_cols = st.columns(3)
+    
+    for i, (stadt, daten) in enumerate(aurora_wahrscheinlichkeit.items()):
+        col = aurora_cols[i % 3]
+        
+        if daten['wahrscheinlichkeit'] < 20:
+            farbe = "#95a5a6"
+        elif daten['wahrscheinlichkeit'] < 50:
+            farbe = "#f39c12"
+        else:
+            farbe = "#27ae60"
+        
+        col.markdown(f"""
+        <div class="aurora-card" style="background: linear-gradient(135deg, {farbe} 0%, {farbe}aa 100%);">
+            <h4>📍 {stadt}</h4>
+            <h2>{daten['wahrscheinlichkeit']}%</h2>
+            <p>Polarlicht-Chance</p>
+            <p><small>Breitengrad: {daten['breitengrad']}°N · geomagnetisch: {daten['geomagnetische_breite']}°</small></p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    if aurora_karte is not None:
+        st.markdown(f"#### 🗺️ Polarlicht-Oval (Kp {aurora_karte['kp']:.1f}, {to_datetime(aurora_karte['kp_time']).strftime('%d.%m. %H:%M')} UTC)")
+        karte = create_aurora_karte(aurora_karte, aurora_wahrscheinlichkeit)
+        with span('aurora_karte', RENDER):
+            folium_static(karte, width=900, height=450)
+
+def render_strahlungswarnung(station):
+    """Warnung bei erhöhtem Protonenfluss"""
+    weltraum_wetter = station.get_weltraum_wetter()
+    
+    # Strahlungs-Warnung
+    if weltraum_wetter and weltraum_wetter['strahlungsrisiko'] not in (None, "Normal"):
+        st.markdown("---")
+        st.markdown("### ⚠️ Strahlungs-Warnung")
+        
+        st.markdown(f"""
+        <div class="radiation-warning">
+            <h4>☢️ Erhöhte Strahlungswerte Detected</h4>
+            <p><strong>Risiko-Level:</strong> {weltraum_wetter['strahlungsrisiko']}</p>
+            <p><strong>Protonen-Fluss:</strong> {weltraum_wetter['protonen_fluss']:.1f} pfu (Teilchen/cm²/s/sr, ≥10 MeV)</p>
+            <p><strong>Betroffene Bereiche:</strong> Luftfahrt, Satelliten, Polarregionen</p>
+            <p><strong>Empfehlung:</strong> Erhöhte Vorsicht bei Polar-Flügen</p>
+        </div>
+        """, unsafe_allow_html=True)
+
 def main():
     # Header
     st.markdown('<h1 class="weather-header">🌞 WELTRAUM-WETTER STATION</h1>', unsafe_allow_html=True)
@@ -317,16 +538,16 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
+    # Hintergrund-Aktualisierung der SWPC-Feeds
+    start_prefetcher()
+    
     # Initialize Station
     station = WeltraumWetterStation()
     
     # Sidebar auf Deutsch
     st.sidebar.markdown("## 🎛️ Weltraum-Wetter Kontrolle")
     
-    auto_refresh = st.sidebar.checkbox("🔄 Auto-Aktualisierung (3 Min)", value=False)
-    if auto_refresh:
-        time.sleep(180)
-        st.rerun()
+    every = auto_refresh_toggle("🔄 Auto-Aktualisierung")
     
     if st.sidebar.button("🌞 Daten Aktualisieren", type="primary"):
         st.rerun()
@@ -346,148 +567,19 @@ def main():
     
     # Daten laden
     with st.spinner("☀️ Verbinde mit Sonnen-Observatorien..."):
-        weltraum_wetter = station.get_weltraum_wetter()
-        eruptionen = station.get_sonnen_eruptionen()
-        magnetfeld_prognose = station.get_magnetfeld_prognose()
-        aurora_wahrscheinlichkeit = station.get_aurora_wahrscheinlichkeit()
         weltraum_fakten = station.get_weltraum_fakten()
         
-        # Aktuelle Bedingungen
-        st.markdown("### ⚡ Aktuelle Weltraum-Wetter-Bedingungen")
+        # Jeder Bereich läuft im Takt seiner Quelle (Sonnenwind minütlich, Kp dreistündlich)
+        fragment(run_every=every(180))(render_aktuelle_bedingungen)(station)
+        fragment(run_every=every(300))(render_sonnenwind)(station)
         
-        col1, col2, col3, col4 = st.columns(4)
+        fragment(run_every=every(900))(render_magnetfeld_prognose)(station)
         
-        with col1:
-            st.markdown(f"""
-            <div class="solar-metric">
-                <h3>🌬️ Sonnenwind</h3>
-                <h2>{weltraum_wetter['sonnenwind_geschwindigkeit']}</h2>
-                <p>km/s</p>
-            </div>
-            """, unsafe_allow_html=True)
+        fragment(run_every=every(300))(render_eruptionen)(station)
         
-        with col2:
-            st.markdown(f"""
-            <div class="solar-metric">
-                <h3>🧲 Magnetfeld</h3>
-                <h2>{weltraum_wetter['magnetfeld_staerke']:.1f}</h2>
-                <p>nT</p>
-            </div>
-            """, unsafe_allow_html=True)
+        fragment(run_every=every(900))(render_aurora)(station)
         
-        with col3:
-            st.markdown(f"""
-            <div class="solar-metric" style="background: linear-gradient(135deg, {weltraum_wetter['aurora_farbe']} 0%, {weltraum_wetter['aurora_farbe']}aa 100%);">
-                <h3>🌌 Aurora</h3>
-                <h2>{weltraum_wetter['aurora_aktivitaet']}</h2>
-                <p>Kp: {weltraum_wetter['kp_index']}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div class="solar-metric" style="background: linear-gradient(135deg, {weltraum_wetter['strahlung_farbe']} 0%, {weltraum_wetter['strahlung_farbe']}aa 100%);">
-                <h3>☢️ Strahlung</h3>
-                <h2>{weltraum_wetter['strahlungsrisiko']}</h2>
-                <p>{weltraum_wetter['protonen_fluss']} p/cm²/s</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Sonnenwind-Chart
-        st.markdown("---")
-        st.markdown("### 🌬️ Sonnenwind-Aktivität")
-        
-        sonnenwind_chart = create_sonnenwind_chart(weltraum_wetter)
-        st.plotly_chart(sonnenwind_chart, use_container_width=True)
-        
-        # Magnetfeld-Prognose
-        st.markdown("---")
-        st.markdown("### 📊 Geomagnetische Aktivitäts-Prognose")
-        
-        col_chart, col_info = st.columns([2, 1])
-        
-        with col_chart:
-            kp_chart = create_kp_index_chart(magnetfeld_prognose)
-            st.plotly_chart(kp_chart, use_container_width=True)
-        
-        with col_info:
-            st.markdown(f"""
-            <div class="magnetic-info">
-                <h3>🧲 Magnetfeld-Info</h3>
-                <p><strong>Kp-Index Bedeutung:</strong></p>
-                <p>🟢 0-2: Ruhig</p>
-                <p>🟡 3-4: Unruhig</p>
-                <p>🟠 5-6: Sturm</p>
-                <p>🔴 7+: Schwerer Sturm</p>
-                <br>
-                <p><strong>Auswirkungen:</strong></p>
-                <p>• Funkstörungen</p>
-                <p>• GPS-Ungenauigkeiten</p>
-                <p>• Polarlichter</p>
-                <p>• Satelliten-Störungen</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Sonnen-Eruptionen
-        st.markdown("---")
-        st.markdown("### ☀️ Kürzliche Sonnen-Eruptionen")
-        
-        if eruptionen:
-            for eruption in eruptionen[:5]:
-                zeit_seit = datetime.now() - eruption['zeit']
-                stunden_seit = int(zeit_seit.total_seconds() / 3600)
-                
-                klasse_farbe = {
-                    'A': '#27ae60', 'B': '#27ae60', 'C': '#f39c12', 
-                    'M': '#e67e22', 'X': '#e74c3c'
-                }.get(eruption['klasse'][0], '#34495e')
-                
-                st.markdown(f"""
-                <div class="flare-alert" style="background: linear-gradient(135deg, {klasse_farbe} 0%, {klasse_farbe}aa 100%);">
-                    ☀️ Klasse {eruption['klasse']} Eruption | vor {stunden_seit}h | Quelle: {eruption['quelle']}<br>
-                    💥 Auswirkung: {eruption['auswirkung']}
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Aurora-Wahrscheinlichkeiten
-        st.markdown("---")
-        st.markdown("### 🌌 Polarlicht-Wahrscheinlichkeiten")
-        
-        aurora_cols = st.columns(3)
-        
-        for i, (stadt, daten) in enumerate(aurora_wahrscheinlichkeit.items()):
-            col = aurora_cols[i % 3]
-            
-            if daten['wahrscheinlichkeit'] < 20:
-                farbe = "#95a5a6"
-            elif daten['wahrscheinlichkeit'] < 50:
-                farbe = "#f39c12"
-            else:
-                farbe = "#27ae60"
-            
-            col.markdown(f"""
-            <div class="aurora-card" style="background: linear-gradient(135deg, {farbe} 0%, {farbe}aa 100%);">
-                <h4>📍 {stadt}</h4>
-                <h2>{daten['wahrscheinlichkeit']}%</h2>
-                <p>Polarlicht-Chance</p>
-                <p><small>Breitengrad: {daten['breitengrad']}°N</small></p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Strahlungs-Warnung
-        if weltraum_wetter['strahlungsrisiko'] != "Normal":
-            st.markdown("---")
-            st.markdown("### ⚠️ Strahlungs-Warnung")
-            
-            st.markdown(f"""
-            <div class="radiation-warning">
-                <h4>☢️ Erhöhte Strahlungswerte Detected</h4>
-                <p><strong>Risiko-Level:</strong> {weltraum_wetter['strahlungsrisiko']}</p>
-                <p><strong>Protonen-Fluss:</strong> {weltraum_wetter['protonen_fluss']} Teilchen/cm²/s</p>
-                <p><strong>Betroffene Bereiche:</strong> Luftfahrt, Satelliten, Polarregionen</p>
-                <p><strong>Empfehlung:</strong> Erhöhte Vorsicht bei Polar-Flügen</p>
-            </div>
-            """, unsafe_allow_html=True)
+        fragment(run_every=every(300))(render_strahlungswarnung)(station)
         
         # Weltraum-Fakten
         st.markdown("---")
@@ -4,10 +4,12 @@ import plotly.graph_objects as go
 import folium
 from streamlit_folium import folium_static
 from datetime import datetime, timedelta
-import random
-import time
 import requests
 
+from utils.fragments import auto_refresh_toggle, fragment
+from utils.instrumentation import FIGURE, MAP, RENDER, set_page, span, timed
+from utils.simulation import HOUR, MINUTE, daily_sample, simulation_rng, time_bucket
+
 # Page Config
 st.set_page_config(
     page_title="🛰️ Satelliten-Netzwerke",
@@ -15,6 +17,8 @@ st.set_page_config(
     layout="wide"
 )
 
+set_page("Satellite Networks")
+
 # CSS auf Deutsch
 st.markdown("""
 <style>
@@ -91,20 +95,21 @@ class SatellitenNetzwerke:
         pass
     
     def get_starlink_data(self, limit=50):
-        """Simulierte Starlink-Daten"""
+        """Simulierte Starlink-Daten (stabil innerhalb eines 10-Minuten-Fensters)"""
+        rng = simulation_rng('starlink_positions', 10 * MINUTE)
         satellites = []
         
         for i in range(limit):
             # Zufällige aber realistische Koordinaten
-            lat = random.uniform(-70, 70)  # Starlink-Abdeckung
-            lon = random.uniform(-180, 180)
+            lat = rng.uniform(-70, 70)  # Starlink-Abdeckung
+            lon = rng.uniform(-180, 180)
             
             satellites.append({
                 'id': f'starlink-{i}',
                 'latitude': lat,
                 'longitude': lon,
-                'height_km': 540 + random.randint(-50, 50),
-                'velocity_kms': 7.5 + random.random(),
+                'height_km': 540 + rng.randint(-50, 50),
+                'velocity_kms': 7.5 + rng.random(),
                 'spaceTrack': {
                     'OBJECT_NAME': f'STARLINK-{1000 + i}',
                     'LAUNCH_DATE': '2023-01-01'
@@ -165,17 +170,20 @@ class SatellitenNetzwerke:
         return konstellationen
     
     def get_satelliten_ueberflugzeiten(self):
-        """Simuliert Satelliten-Überflugzeiten für Hamburg"""
+        """Simuliert Satelliten-Überflugzeiten für Hamburg (stabil innerhalb einer Stunde)"""
+        rng = simulation_rng('satellite_passes', HOUR)
+        _, bucket_start = time_bucket(HOUR)
+        basis = datetime.fromtimestamp(bucket_start)
         ueberflugzeiten = []
         
         satelliten_typen = ['Starlink', 'ISS', 'Hubble', 'GPS-Satellit', 'Wettersatellit']
         
         for i in range(10):
-            sat_typ = random.choice(satelliten_typen)
-            ueberflug_zeit = datetime.now() + timedelta(hours=random.randint(1, 48))
-            dauer = random.randint(2, 8)
-            hoehe = random.randint(15, 85)
-            helligkeit = random.uniform(-2.0, 4.0)
+            sat_typ = rng.choice(satelliten_typen)
+            ueberflug_zeit = basis + timedelta(hours=rng.randint(1, 48))
+            dauer = rng.randint(2, 8)
+            hoehe = rng.randint(15, 85)
+            helligkeit = rng.uniform(-2.0, 4.0)
             
             ueberflugzeiten.append({
                 'satellit': sat_typ,
@@ -183,26 +191,27 @@ class SatellitenNetzwerke:
                 'dauer': dauer,
                 'max_hoehe': hoehe,
                 'helligkeit': helligkeit,
-                'richtung': random.choice(['N→S', 'S→N', 'W→O', 'O→W', 'NW→SO', 'NO→SW'])
+                'richtung': rng.choice(['N→S', 'S→N', 'W→O', 'O→W', 'NW→SO', 'NO→SW'])
             })
         
         return sorted(ueberflugzeiten, key=lambda x: x['zeit'])[:5]
     
     def get_netzwerk_performance(self):
-        """Simuliert Netzwerk-Performance-Daten"""
+        """Simuliert Netzwerk-Performance-Daten (stabil innerhalb von 5 Minuten)"""
+        rng = simulation_rng('network_performance', 5 * MINUTE)
         return {
             'starlink': {
-                'aktive_verbindungen': random.randint(800000, 1200000),
-                'durchschnittliche_geschwindigkeit': random.randint(80, 150),
-                'latenz': random.randint(20, 45),
-                'verfuegbarkeit': random.uniform(99.5, 99.9),
+                'aktive_verbindungen': rng.randint(800000, 1200000),
+                'durchschnittliche_geschwindigkeit': rng.randint(80, 150),
+                'latenz': rng.randint(20, 45),
+                'verfuegbarkeit': rng.uniform(99.5, 99.9),
                 'abgedeckte_laender': 60
             },
             'oneweb': {
-                'aktive_verbindungen': random.randint(50000, 100000),
-                'durchschnittliche_geschwindigkeit': random.randint(100, 200),
-                'latenz': random.randint(30, 60),
-                'verfuegbarkeit': random.uniform(99.0, 99.7),
+                'aktive_verbindungen': rng.randint(50000, 100000),
+                'durchschnittliche_geschwindigkeit': rng.randint(100, 200),
+                'latenz': rng.randint(30, 60),
+                'verfuegbarkeit': rng.uniform(99.0, 99.7),
                 'abgedeckte_laender': 40
             }
         }
@@ -221,8 +230,9 @@ class SatellitenNetzwerke:
             "💰 Die Starlink-Konstellation kostet über 10 Milliarden Dollar",
             "🛡️ Kessler-Syndrom: Kollidierende Satelliten könnten Weltraummüll verursachen"
         ]
-        return random.sample(fakten, 3)
+        return daily_sample('satellite_facts', fakten, 3)
 
+@timed('constellation_coverage_map', MAP)
 def create_constellation_coverage_map(starlink_data):
     """Erstellt Starlink-Abdeckungskarte"""
     # Hamburg als Zentrum
@@ -253,6 +263,7 @@ def create_constellation_coverage_map(starlink_data):
     
     return m
 
+@timed('constellation_comparison_chart', FIGURE)
 def create_constellation_comparison_chart(konstellationen):
     """Erstellt Vergleichs-Chart der Konstellationen"""
     names = list(konstellationen.keys())
@@ -291,6 +302,7 @@ def create_constellation_comparison_chart(konstellationen):
     
     return fig
 
+@timed('network_performance_chart', FIGURE)
 def create_network_performance_chart(performance):
     """Erstellt Netzwerk-Performance-Chart"""
     providers = list(performance.keys())
@@ -330,6 +342,153 @@ def create_network_performance_chart(performance):
     
     return fig
 
+def render_netzwerk_statistik(sat_system):
+    """Starlink-Kennzahlen"""
+    performance = sat_system.get_netzwerk_performance()
+    
+    # Statistiken
+    st.markdown("---")
+    st.markdown("### 📊 Netzwerk-Statistiken")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    starlink_perf = performance['starlink']
+    
+    with col1:
+        st.markdown(f"""
+        <div class="sat-metric">
+            <h3>👥 Aktive Nutzer</h3>
+            <h2>{starlink_perf['aktive_verbindungen']:,}</h2>
+            <p>Starlink Verbindungen</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="sat-metric">
+            <h3>⚡ Geschwindigkeit</h3>
+            <h2>{starlink_perf['durchschnittliche_geschwindigkeit']} Mbps</h2>
+            <p>Durchschnitt</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="sat-metric">
+            <h3>⏱️ Latenz</h3>
+            <h2>{starlink_perf['latenz']} ms</h2>
+            <p>Ping-Zeit</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="sat-metric">
+            <h3>🌍 Abdeckung</h3>
+            <h2>{starlink_perf['abgedeckte_laender']}</h2>
+            <p>Länder</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_starlink_karte(sat_system):
+    """Karte der (simulierten) Starlink-Positionen"""
+    starlink_data = sat_system.get_starlink_data(50)
+    
+    # Starlink-Abdeckungskarte
+    st.markdown("---")
+    st.markdown("### 🗺️ Live Starlink-Satelliten-Positionen")
+    
+    col_map, col_info = st.columns([2, 1])
+    
+    with col_map:
+        try:
+            coverage_map = create_constellation_coverage_map(starlink_data)
+            with span('constellation_coverage_map', RENDER):
+                folium_static(coverage_map, width=700, height=400)
+        except Exception as e:
+            st.error(f"Karte konnte nicht geladen werden: {e}")
+            st.info("🛰️ Starlink-Satelliten sind aktiv, Karte wird geladen...")
+    
+    with col_info:
+        active_starlink = len([s for s in starlink_data if s.get('latitude')])
+        
+        st.markdown(f"""
+        <div class="coverage-info">
+            <h3>🛰️ Starlink-Status</h3>
+            <p><strong>📍 Simulierte Satelliten:</strong> {min(30, active_starlink)}</p>
+            <p><strong>🌐 Gesamte Konstellation:</strong> ~5.000 aktiv</p>
+            <p><strong>📏 Durchschnittliche Höhe:</strong> 550 km</p>
+            <p><strong>⚡ Orbital-Geschwindigkeit:</strong> 7.5 km/s</p>
+            <p><strong>🔄 Orbital-Periode:</strong> ~95 Minuten</p>
+            <p><strong>📡 Hamburg-Abdeckung:</strong> 24/7</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_ueberfluege(sat_system):
+    """Nächste sichtbare Satelliten über Hamburg"""
+    ueberflugzeiten = sat_system.get_satelliten_ueberflugzeiten()
+    
+    # Satelliten-Überflüge
+    st.markdown("---")
+    st.markdown("### 🔭 Satelliten-Überflüge über Hamburg")
+    st.markdown("**Nächste sichtbare Satelliten-Durchgänge:**")
+    
+    for ueberflug in ueberflugzeiten:
+        zeit_bis = ueberflug['zeit'] - datetime.now()
+        stunden_bis = int(zeit_bis.total_seconds() / 3600)
+        
+        helligkeit_text = "Sehr hell" if ueberflug['helligkeit'] < 0 else "Hell" if ueberflug['helligkeit'] < 2 else "Schwach"
+        
+        st.markdown(f"""
+        <div class="pass-prediction">
+            🛰️ {ueberflug['satellit']} | {ueberflug['zeit'].strftime('%d.%m %H:%M')} (in {stunden_bis}h)<br>
+            ⏱️ Dauer: {ueberflug['dauer']} Min | 📐 Max. Höhe: {ueberflug['max_hoehe']}° | 
+            💫 Helligkeit: {helligkeit_text} | 🧭 Richtung: {ueberflug['richtung']}
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_netzwerk_status(sat_system):
+    """Verfügbarkeit der Netzwerke"""
+    performance = sat_system.get_netzwerk_performance()
+    starlink_perf = performance['starlink']
+    
+    # Netzwerk-Status
+    st.markdown("---")
+    st.markdown("### 📡 Netzwerk-Status & Verfügbarkeit")
+    
+    col_net1, col_net2, col_net3 = st.columns(3)
+    
+    with col_net1:
+        st.markdown(f"""
+        <div class="network-status">
+            <h4>🛰️ Starlink</h4>
+            <h3>{starlink_perf['verfuegbarkeit']:.1f}%</h3>
+            <p>Verfügbarkeit</p>
+            <p>{starlink_perf['abgedeckte_laender']} Länder</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_net2:
+        oneweb_perf = performance['oneweb']
+        st.markdown(f"""
+        <div class="network-status">
+            <h4>🌐 OneWeb</h4>
+            <h3>{oneweb_perf['verfuegbarkeit']:.1f}%</h3>
+            <p>Verfügbarkeit</p>
+            <p>{oneweb_perf['abgedeckte_laender']} Länder</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_net3:
+        st.markdown(f"""
+        <div class="network-status">
+            <h4>🗺️ GPS</h4>
+            <h3>99.9%</h3>
+            <p>Verfügbarkeit</p>
+            <p>Global abgedeckt</p>
+        </div>
+        """, unsafe_allow_html=True)
+
 def main():
     # Header
     st.markdown('<h1 class="sat-header">🛰️ SATELLITEN-NETZWERKE</h1>', unsafe_allow_html=True)
@@ -349,10 +508,7 @@ def main():
     # Sidebar auf Deutsch
     st.sidebar.markdown("## 🎛️ Satelliten-Kontrolle")
     
-    auto_refresh = st.sidebar.checkbox("🔄 Auto-Aktualisierung (2 Min)", value=False)
-    if auto_refresh:
-        time.sleep(120)
-        st.rerun()
+    every = auto_refresh_toggle("🔄 Auto-Aktualisierung")
     
     if st.sidebar.button("🛰️ Daten Aktualisieren", type="primary"):
         st.rerun()
@@ -373,9 +529,7 @@ def main():
     # Daten laden
     with st.spinner("🛰️ Verbinde mit Satelliten-Netzwerken..."):
         try:
-            starlink_data = sat_system.get_starlink_data(50)
             konstellationen = sat_system.get_satelliten_konstellationen()
-            ueberflugzeiten = sat_system.get_satelliten_ueberflugzeiten()
             performance = sat_system.get_netzwerk_performance()
             satelliten_fakten = sat_system.get_satelliten_fakten()
             
@@ -413,78 +567,10 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
             
-            # Statistiken
-            st.markdown("---")
-            st.markdown("### 📊 Netzwerk-Statistiken")
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            starlink_perf = performance['starlink']
-            
-            with col1:
-                st.markdown(f"""
-                <div class="sat-metric">
-                    <h3>👥 Aktive Nutzer</h3>
-                    <h2>{starlink_perf['aktive_verbindungen']:,}</h2>
-                    <p>Starlink Verbindungen</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div class="sat-metric">
-                    <h3>⚡ Geschwindigkeit</h3>
-                    <h2>{starlink_perf['durchschnittliche_geschwindigkeit']} Mbps</h2>
-                    <p>Durchschnitt</p>
-                </div>
-                """, unsafe_allow_html=True)
+            # Karte, Kennzahlen und Überflüge aktualisieren sich getrennt; der Rest ist statisch
+            fragment(run_every=every(600))(render_netzwerk_statistik)(sat_system)
             
-            with col3:
-                st.markdown(f"""
-                <div class="sat-metric">
-                    <h3>⏱️ Latenz</h3>
-                    <h2>{starlink_perf['latenz']} ms</h2>
-                    <p>Ping-Zeit</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                st.markdown(f"""
-                <div class="sat-metric">
-                    <h3>🌍 Abdeckung</h3>
-                    <h2>{starlink_perf['abgedeckte_laender']}</h2>
-                    <p>Länder</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Starlink-Abdeckungskarte
-            st.markdown("---")
-            st.markdown("### 🗺️ Live Starlink-Satelliten-Positionen")
-            
-            col_map, col_info = st.columns([2, 1])
-            
-            with col_map:
-                try:
-                    coverage_map = create_constellation_coverage_map(starlink_data)
-                    folium_static(coverage_map, width=700, height=400)
-                except Exception as e:
-                    st.error(f"Karte konnte nicht geladen werden: {e}")
-                    st.info("🛰️ Starlink-Satelliten sind aktiv, Karte wird geladen...")
-            
-            with col_info:
-                active_starlink = len([s for s in starlink_data if s.get('latitude')])
-                
-                st.markdown(f"""
-                <div class="coverage-info">
-                    <h3>🛰️ Starlink-Status</h3>
-                    <p><strong>📍 Simulierte Satelliten:</strong> {min(30, active_starlink)}</p>
-                    <p><strong>🌐 Gesamte Konstellation:</strong> ~5.000 aktiv</p>
-                    <p><strong>📏 Durchschnittliche Höhe:</strong> 550 km</p>
-                    <p><strong>⚡ Orbital-Geschwindigkeit:</strong> 7.5 km/s</p>
-                    <p><strong>🔄 Orbital-Periode:</strong> ~95 Minuten</p>
-                    <p><strong>📡 Hamburg-Abdeckung:</strong> 24/7</p>
-                </div>
-                """, unsafe_allow_html=True)
+            fragment(run_every=every(120))(render_starlink_karte)(sat_system)
             
             # Konstellations-Vergleich  
             st.markdown("---")
@@ -500,61 +586,9 @@ def main():
             performance_chart = create_network_performance_chart(performance)
             st.plotly_chart(performance_chart, use_container_width=True)
             
-            # Satelliten-Überflüge
-            st.markdown("---")
-            st.markdown("### 🔭 Satelliten-Überflüge über Hamburg")
-            st.markdown("**Nächste sichtbare Satelliten-Durchgänge:**")
+            fragment(run_every=every(600))(render_ueberfluege)(sat_system)
             
-            for ueberflug in ueberflugzeiten:
-                zeit_bis = ueberflug['zeit'] - datetime.now()
-                stunden_bis = int(zeit_bis.total_seconds() / 3600)
-                
-                helligkeit_text = "Sehr hell" if ueberflug['helligkeit'] < 0 else "Hell" if ueberflug['helligkeit'] < 2 else "Schwach"
-                
-                st.markdown(f"""
-                <div class="pass-prediction">
-                    🛰️ {ueberflug['satellit']} | {ueberflug['zeit'].strftime('%d.%m %H:%M')} (in {stunden_bis}h)<br>
-                    ⏱️ Dauer: {ueberflug['dauer']} Min | 📐 Max. Höhe: {ueberflug['max_hoehe']}° | 
-                    💫 Helligkeit: {helligkeit_text} | 🧭 Richtung: {ueberflug['richtung']}
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Netzwerk-Status
-            st.markdown("---")
-            st.markdown("### 📡 Netzwerk-Status & Verfügbarkeit")
-            
-            col_net1, col_net2, col_net3 = st.columns(3)
-            
-            with col_net1:
-                st.markdown(f"""
-                <div class="network-status">
-                    <h4>🛰️ Starlink</h4>
-                    <h3>{starlink_perf['verfuegbarkeit']:.1f}%</h3>
-                    <p>Verfügbarkeit</p>
-                    <p>{starlink_perf['abgedeckte_laender']} Länder</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col_net2:
-                oneweb_perf = performance['oneweb']
-                st.markdown(f"""
-                <div class="network-status">
-                    <h4>🌐 OneWeb</h4>
-                    <h3>{oneweb_perf['verfuegbarkeit']:.1f}%</h3>
-                    <p>Verfügbarkeit</p>
-                    <p>{oneweb_perf['abgedeckte_laender']} Länder</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col_net3:
-                st.markdown(f"""
-                <div class="network-status">
-                    <h4>🗺️ GPS</h4>
-                    <h3>99.9%</h3>
-                    <p>Verfügbarkeit</p>
-                    <p>Global abgedeckt</p>
-                </div>
-                """, unsafe_allow_html=True)
+            fragment(run_every=every(600))(render_netzwerk_status)(sat_system)
             
             # Satelliten-Fakten
             st.markdown("---")
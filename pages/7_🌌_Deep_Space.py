@@ -1,13 +1,16 @@
 import streamlit as st
-import requests
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import random
-import time
-import os
 from dotenv import load_dotenv
 
+from utils.data_context import get_data_context
+from utils.fragments import auto_refresh_toggle, fragment
+from utils.image_cache import cached_image
+from utils.instrumentation import FIGURE, set_page, timed
+from utils.prefetch import start_prefetcher
+from utils.simulation import DAY, daily_sample, simulation_rng
+
 # Load environment variables
 load_dotenv()
 
@@ -19,6 +22,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+set_page("Deep Space")
+
 # Custom CSS für Deep Space Theme
 st.markdown("""
 <style>
@@ -68,21 +73,12 @@ st.markdown("""
 
 class DeepSpaceAPI:
     def __init__(self):
-        # NASA API Key aus Environment Variable laden
-        self.nasa_api_key = os.getenv("NASA_API_KEY", "DEMO_KEY")
-        
-        # NASA APIs
-        self.nasa_apod_url = f"https://api.nasa.gov/planetary/apod?api_key={self.nasa_api_key}"
-        self.nasa_neo_url = f"https://api.nasa.gov/neo/rest/v1/feed?api_key={self.nasa_api_key}"
+        # APOD und NEOs kommen aus dem gemeinsamen Daten-Kontext (bereits von der Startseite geladen)
+        self.context = get_data_context()
         
     def get_nasa_picture_of_day(self):
         """Holt NASA Picture of the Day"""
-        try:
-            response = requests.get(self.nasa_apod_url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except:
-            return self._get_fallback_apod()
+        return self.context.data('apod') or self._get_fallback_apod()
     
     def _get_fallback_apod(self):
         """Fallback für NASA-Bild"""
@@ -106,7 +102,7 @@ class DeepSpaceAPI:
                 'media_type': 'image'
             }
         ]
-        return random.choice(fallback_images)
+        return simulation_rng('apod_fallback', DAY).choice(fallback_images)
     
     def get_hubble_discoveries(self):
         """Simulierte Hubble-Entdeckungen"""
@@ -188,32 +184,22 @@ class DeepSpaceAPI:
     
     def get_asteroid_data(self):
         """Asteroid und Komet Tracking"""
-        try:
-            today = datetime.now().strftime('%Y-%m-%d')
-            url = f"{self.nasa_neo_url}&start_date={today}&end_date={today}"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            asteroids = []
-            for date, objects in data['near_earth_objects'].items():
-                for obj in objects[:3]:  # Top 3
-                    asteroids.append({
-                        'name': obj['name'],
-                        'type': 'Near-Earth Asteroid',
-                        'distance': f"{float(obj['close_approach_data'][0]['miss_distance']['kilometers']):.0f} km",
-                        'diameter': f"~{obj['estimated_diameter']['meters']['estimated_diameter_max']:.0f} meter",
-                        'closest_approach': obj['close_approach_data'][0]['close_approach_date'],
-                        'hazardous': obj['is_potentially_hazardous_asteroid']
-                    })
-            
-            if asteroids:
-                return asteroids
-            else:
-                return self._get_fallback_asteroids()
-                
-        except:
+        neo = self.context.data('neo_today')
+        if not neo:
             return self._get_fallback_asteroids()
+        
+        asteroids = []
+        for obj in neo['objects'][:3]:  # Top 3
+            asteroids.append({
+                'name': obj['name'],
+                'type': 'Near-Earth Asteroid',
+                'distance': f"{float(obj['close_approach_data'][0]['miss_distance']['kilometers']):.0f} km",
+                'diameter': f"~{obj['estimated_diameter']['meters']['estimated_diameter_max']:.0f} meter",
+                'closest_approach': obj['close_approach_data'][0]['close_approach_date'],
+                'hazardous': obj['is_potentially_hazardous_asteroid']
+            })
+        
+        return asteroids or self._get_fallback_asteroids()
     
     def _get_fallback_asteroids(self):
         """Fallback Asteroid Daten"""
@@ -244,6 +230,7 @@ class DeepSpaceAPI:
             }
         ]
 
+@timed('discovery_timeline', FIGURE)
 def create_discovery_timeline():
     """Erstellt Timeline der Deep Space Entdeckungen"""
     discoveries = [
@@ -273,6 +260,7 @@ def create_discovery_timeline():
     
     return fig
 
+@timed('distance_comparison', FIGURE)
 def create_distance_comparison():
     """Vergleich der Entfernungen im Deep Space"""
     objects = [
@@ -303,6 +291,49 @@ def create_distance_comparison():
     
     return fig
 
+def render_apod(deep_space):
+    """NASA Astronomy Picture of the Day"""
+    # NASA Picture of the Day
+    st.markdown("---")
+    st.markdown("### 🌟 NASA Astronomy Picture of the Day")
+    
+    nasa_pic = deep_space.get_nasa_picture_of_day()
+    if nasa_pic and nasa_pic.get('media_type') == 'image':
+        col_pic, col_desc = st.columns([1, 1])
+        
+        with col_pic:
+            st.image(cached_image(nasa_pic['url']), use_container_width=True)
+        
+        with col_desc:
+            st.markdown(f"""
+            **📅 {nasa_pic['title']}**
+            
+            {nasa_pic['explanation'][:300]}...
+            
+            *Quelle: NASA Astronomy Picture of the Day*
+            """)
+
+def render_asteroids(deep_space):
+    """Nächste Asteroiden-Annäherungen (NeoWs)"""
+    # Asteroid & Comet Tracking
+    st.markdown("---")
+    st.markdown("### ☄️ Asteroiden & Kometen Tracking")
+    
+    asteroids = deep_space.get_asteroid_data()
+    
+    for asteroid in asteroids:
+        hazard_color = "🔴" if asteroid['hazardous'] else "🟢"
+        st.markdown(f"""
+        <div class="discovery-card">
+            <h4>{hazard_color} {asteroid['name']}</h4>
+            <p><strong>🏷️ Typ:</strong> {asteroid['type']}</p>
+            <p><strong>📏 Entfernung:</strong> {asteroid['distance']}</p>
+            <p><strong>📐 Durchmesser:</strong> {asteroid['diameter']}</p>
+            <p><strong>📅 Nächste Annäherung:</strong> {asteroid['closest_approach']}</p>
+            <p><strong>⚠️ Gefährlich:</strong> {'Ja' if asteroid['hazardous'] else 'Nein'}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
 def main():
     # Header
     st.markdown("""
@@ -313,9 +344,14 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
+    # Hintergrund-Prefetch für APOD & Mars Fotos
+    start_prefetcher()
+    
     # Initialize API
     deep_space = DeepSpaceAPI()
     
+    every = auto_refresh_toggle()
+    
     # Live Status Metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -355,25 +391,8 @@ def main():
         </div>
         """, unsafe_allow_html=True)
     
-    # NASA Picture of the Day
-    st.markdown("---")
-    st.markdown("### 🌟 NASA Astronomy Picture of the Day")
-    
-    nasa_pic = deep_space.get_nasa_picture_of_day()
-    if nasa_pic and nasa_pic.get('media_type') == 'image':
-        col_pic, col_desc = st.columns([1, 1])
-        
-        with col_pic:
-            st.image(nasa_pic['url'], use_container_width=True)
-        
-        with col_desc:
-            st.markdown(f"""
-            **📅 {nasa_pic['title']}**
-            
-            {nasa_pic['explanation'][:300]}...
-            
-            *Quelle: NASA Astronomy Picture of the Day*
-            """)
+    # APOD und Asteroiden aktualisieren sich getrennt; die übrigen Bereiche sind statisch
+    fragment(run_every=every(3600))(render_apod)(deep_space)
     
     # Hubble Space Telescope
     st.markdown("---")
@@ -456,24 +475,7 @@ def main():
         distance_fig = create_distance_comparison()
         st.plotly_chart(distance_fig, use_container_width=True)
     
-    # Asteroid & Comet Tracking
-    st.markdown("---")
-    st.markdown("### ☄️ Asteroiden & Kometen Tracking")
-    
-    asteroids = deep_space.get_asteroid_data()
-    
-    for asteroid in asteroids:
-        hazard_color = "🔴" if asteroid['hazardous'] else "🟢"
-        st.markdown(f"""
-        <div class="discovery-card">
-            <h4>{hazard_color} {asteroid['name']}</h4>
-            <p><strong>🏷️ Typ:</strong> {asteroid['type']}</p>
-            <p><strong>📏 Entfernung:</strong> {asteroid['distance']}</p>
-            <p><strong>📐 Durchmesser:</strong> {asteroid['diameter']}</p>
-            <p><strong>📅 Nächste Annäherung:</strong> {asteroid['closest_approach']}</p>
-            <p><strong>⚠️ Gefährlich:</strong> {'Ja' if asteroid['hazardous'] else 'Nein'}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    fragment(run_every=every(3600))(render_asteroids)(deep_space)
     
     # Deep Space Facts
     st.markdown("---")
@@ -487,7 +489,7 @@ def main():
         "🌟 Es gibt mehr Sterne im Universum als Sandkörner auf allen Stränden der Erde"
     ]
     
-    selected_facts = random.sample(facts, 3)
+    selected_facts = daily_sample('deep_space_facts', facts, 3)
     for fact in selected_facts:
         st.info(fact)
     
@@ -512,12 +514,7 @@ def main():
         - Nächster Stern: 4,24 Lichtjahre
         - Milchstraße: 100.000 Lichtjahre Durchmesser
         """)
-        
-        st.markdown("---")
-        st.markdown("*🔄 Auto-Refresh alle 60 Sekunden*")
     
-    # Auto-refresh
-    time.sleep(1)
     if st.button("🔄 Deep Space Daten aktualisieren"):
         st.rerun()
 
@@ -0,0 +1,119 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils.instrumentation import LOG_PATH, get_span_stats, read_span_log, set_page
+
+# Page Config
+st.set_page_config(
+    page_title="⏱️ Performance",
+    page_icon="⏱️",
+    layout="wide"
+)
+
+set_page("Performance")
+
+# Custom CSS
+st.markdown("""
+<style>
+    .main-header {
+        background: linear-gradient(135deg, #0f0f23 0%, #1a1a2e 50%, #16213e 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        margin-bottom: 2rem;
+        text-align: center;
+        color: white;
+        box-shadow: 0 8px 32px rgba(31, 38, 135, 0.37);
+    }
+</style>
+""", unsafe_allow_html=True)
+
+KIND_LABELS = {
+    'fetch': '📡 API-Abruf',
+    'parse': '🧩 Parsen',
+    'figure': '📊 Diagramm',
+    'map': '🗺️ Karte bauen',
+    'render': '🖼️ Karte rendern',
+}
+
+
+def create_latency_chart(df):
+    """p50/p95 pro Komponente als horizontale Balken"""
+    df = df.sort_values('p95')
+    labels = df['page'] + ' · ' + df['component']
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(y=labels, x=df['p50'], name='p50', orientation='h', marker_color='#4facfe'))
+    fig.add_trace(go.Bar(y=labels, x=df['p95'], name='p95', orientation='h', marker_color='#f5576c'))
+    fig.update_layout(
+        title="⏱️ Latenz pro Komponente (ms)",
+        barmode='group',
+        xaxis_title="Millisekunden",
+        height=max(300, 28 * len(df) + 120),
+        template="plotly_dark",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+def main():
+    st.markdown("""
+    <div class="main-header">
+        <h1>⏱️ PERFORMANCE</h1>
+        <p>Laufzeiten von API-Abrufen, Parsern, Diagrammen und Karten</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    quelle = st.radio(
+        "📂 Datenquelle",
+        ["Dieser Prozess", "Log-Datei (alle Prozesse)"],
+        horizontal=True,
+        key="performance_quelle"
+    )
+    if quelle == "Dieser Prozess":
+        rows = get_span_stats().summary()
+    else:
+        rows = read_span_log()
+        st.caption(f"📄 {LOG_PATH}")
+    
+    if not rows:
+        st.info("Noch keine Messwerte - einfach ein paar Seiten des Dashboards öffnen.")
+        return
+    
+    df = pd.DataFrame(rows)
+    df['kind'] = df['kind'].map(lambda kind: KIND_LABELS.get(kind, kind))
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        seiten = st.multiselect("📄 Seiten", sorted(df['page'].unique()), key="performance_seiten")
+    with col2:
+        arten = st.multiselect("🏷️ Art", sorted(df['kind'].unique()), key="performance_arten")
+    if seiten:
+        df = df[df['page'].isin(seiten)]
+    if arten:
+        df = df[df['kind'].isin(arten)]
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric("📏 Messungen", int(df['count'].sum()))
+    col2.metric("🐢 Langsamste p95", f"{df['p95'].max():.0f} ms")
+    col3.metric("❌ Fehler", int(df['errors'].sum()))
+    
+    st.plotly_chart(create_latency_chart(df), use_container_width=True)
+    
+    st.dataframe(
+        df.rename(columns={
+            'page': 'Seite', 'component': 'Komponente', 'kind': 'Art', 'count': 'Anzahl',
+            'errors': 'Fehler', 'p50': 'p50 (ms)', 'p95': 'p95 (ms)', 'max': 'Max (ms)'
+        }).round(1),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    if quelle == "Dieser Prozess" and st.button("🧹 Messwerte zurücksetzen"):
+        get_span_stats().reset()
+        st.rerun()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Headless Daten-Collector: alle Quellen nach Zeitplan abrufen, ohne Streamlit
+
+Schreibt dieselben Snapshots und Zeitreihen in data/ wie der Prefetcher im Dashboard.
+Solange der Collector läuft (Heartbeat-Snapshot), pollen die Dashboard-Prozesse nicht
+selbst, sondern lesen nur noch seine Daten - egal wie viele Worker laufen.
+
+    python -m src.collector            # Dauerbetrieb
+    python -m src.collector --once     # ein Durchlauf, z.B. per Cron
+"""
+import argparse
+import functools
+import os
+import signal
+import socket
+import sys
+from datetime import datetime
+
+# Direkt als Skript gestartet (python src/collector.py): Projekt-Root für utils/ importierbar machen
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.config import DATA_DIR  # noqa: E402
+from utils.data_context import COLLECTOR_HEARTBEAT, get_data_context  # noqa: E402
+from utils.instrumentation import get_logger  # noqa: E402
+from utils.prefetch import Prefetcher  # noqa: E402
+
+logger = get_logger('collector')
+
+
+def get_location_name(lat, lon):
+    """Versucht herauszufinden über welchem Land/Ozean die ISS ist"""
+    # Einfache Zuordnung basierend auf Koordinaten
+    if -90 <= lat <= 90 and -180 <= lon <= 180:
+        if abs(lat) < 30 and abs(lon) < 30:
+            return "Afrika/Europa Region"
+        elif lat > 30 and -100 < lon < 50:
+            return "Europa/Asien"
+        elif lat < -30:
+            return "Südlicher Ozean"
+        elif abs(lon) > 150:
+            return "Pazifischer Ozean"
+        elif lon < -50:
+            return "Atlantischer Ozean"
+        else:
+            return "Unbekannte Region"
+    return "Orbit"
+
+
+class Collector(Prefetcher):
+    """Prefetcher-Jobs plus alle Quellen des Daten-Kontexts als eigenständiger Prozess
+
+    Jede Quelle wird in der Hälfte ihres max_age neu geladen; so ist ihr Snapshot nie
+    veraltet und kein Dashboard-Prozess muss selbst abrufen.
+    """
+
+    page = 'collector'
+    # Der Collector ist selbst die externe Quelle, auf die andere Prozesse warten
+    defer_to_collector = False
+
+    def __init__(self, iss_seconds=None, heartbeat_seconds=60, verbose=True, **kwargs):
+        super().__init__(**kwargs)
+        self.context = get_data_context()
+        self.verbose = verbose
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+
+        # Quellen mit eigener Ausgabe bzw. Zusatzarbeit (APOD-Bild vorwärmen)
+        jobs = {
+            'iss_position': self.refresh_iss_position,
+            'astronauts': self.refresh_astronauts,
+            'apod': functools.partial(self.refresh_apod, force=True),
+        }
+        for name, source in self.context.sources.items():
+            interval = max(1, source.max_age // 2)
+            if name == 'iss_position' and iss_seconds:
+                interval = min(iss_seconds, interval)
+            job = jobs.get(name) or functools.partial(self.context.refresh, name)
+            self.scheduler.every(interval).seconds.do(self.run_job, job)
+        self.scheduler.every(heartbeat_seconds).seconds.do(self.run_job, self.heartbeat)
+
+    def heartbeat(self):
+        """Meldet den Collector als aktiv (siehe prefetch.collector_alive)"""
+        self.store.put(COLLECTOR_HEARTBEAT, {
+            'pid': os.getpid(),
+            'host': socket.gethostname(),
+            'started_at': self.started_at,
+        })
+        return True
+
+    def refresh_iss_position(self):
+        if not self.context.refresh('iss_position'):
+            return False
+        if self.verbose:
+            iss = self.context.data('iss_position')
+            lat, lon = float(iss['latitude']), float(iss['longitude'])
+            zeit = datetime.fromtimestamp(iss['timestamp']).strftime('%H:%M:%S')
+            print(f"🛰️  {zeit}  📍 {lat:8.4f}°, {lon:9.4f}°  🌍 {get_location_name(lat, lon)}", flush=True)
+        return True
+
+    def refresh_astronauts(self):
+        if not self.context.refresh('astronauts'):
+            return False
+        if self.verbose:
+            print(f"👨‍🚀 Astronauten im Weltraum: {self.context.data('astronauts')['number']}", flush=True)
+        return True
+
+    def refresh_events(self):
+        # Überflüge und Starts laufen als Quellen-Jobs mit, die Alarme prüft evaluate_alerts minütlich
+        return False
+
+    def run_all(self, heartbeat=True):
+        # Heartbeat zuerst, damit Dashboards ihre eigenen Abrufe sofort einstellen; ein einzelner
+        # Durchlauf (--once) meldet sich nicht, sonst pausieren die Dashboards ohne laufenden Collector
+        if heartbeat:
+            self.run_job(self.heartbeat)
+        self.run_job(self.refresh_iss_position)
+        self.run_job(self.refresh_astronauts)
+        for name in self.context.sources:
+            if name not in ('iss_position', 'astronauts', 'apod'):
+                self.run_job(functools.partial(self.context.refresh, name))
+        super().run_all()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cosmic Analytics Daten-Collector (ohne Streamlit)")
+    parser.add_argument('--once', action='store_true', help="alle Quellen einmal abrufen und beenden")
+    parser.add_argument('--poll', type=float, default=1.0, help="Takt der Zeitplan-Prüfung in Sekunden")
+    parser.add_argument('--iss-seconds', type=int, default=None,
+                        help="Intervall für die ISS-Position (Standard: halbes max_age der Quelle)")
+    parser.add_argument('--quiet', action='store_true', help="keine Konsolenausgabe pro Abruf")
+    args = parser.parse_args(argv)
+
+    collector = Collector(iss_seconds=args.iss_seconds, verbose=not args.quiet)
+
+    print("🌌 COSMIC ANALYTICS - DATA COLLECTOR")
+    print("=" * 50)
+    print(f"📂 Daten: {DATA_DIR}")
+
+    if args.once:
+        collector.run_all(heartbeat=False)
+        return 0
+
+    # Sauber beenden bei Ctrl+C / docker stop / systemd
+    signal.signal(signal.SIGTERM, lambda *_: collector.stop())
+    signal.signal(signal.SIGINT, lambda *_: collector.stop())
+    logger.info("Collector gestartet (pid %s)", os.getpid())
+    collector.run(args.poll)
+    logger.info("Collector beendet")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,18 @@
 import streamlit as st
-import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import random
-import time
 import os
 from dotenv import load_dotenv
 
+from utils.alerts import recent_alerts
+from utils.countdown import countdown_span, render_countdown
+from utils.data_context import get_data_context
+from utils.fragments import auto_refresh_toggle, fragment
+from utils.image_cache import cached_image
+from utils.instrumentation import set_page
+from utils.launches import Launch, get_launches
+from utils.prefetch import start_prefetcher
+
 # Load environment variables
 load_dotenv()
 
@@ -17,6 +24,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+set_page("Command Center")
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -69,123 +78,144 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Kachel-Stil für das Countdown-iframe (erbt das Seiten-CSS nicht)
+METRIC_CARD_CSS = """
+    .metric-card {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        padding: 1rem;
+        border-radius: 10px;
+        text-align: center;
+        color: white;
+        margin: 0.5rem;
+    }
+"""
+
 class CosmicAnalyticsAPI:
     def __init__(self):
         # NASA API Key aus Environment Variable laden
         self.nasa_api_key = os.getenv("NASA_API_KEY", "DEMO_KEY")
         
-        # API URLs
-        self.iss_api_url = "http://api.open-notify.org/iss-now.json"
-        self.astros_api_url = "http://api.open-notify.org/astros.json" 
-        self.iss_pass_url = "http://api.open-notify.org/iss-pass.json"
-        self.spacex_upcoming_url = "https://api.spacexdata.com/v4/launches/upcoming"
-        self.spacex_latest_url = "https://api.spacexdata.com/v4/launches/latest"
-        self.nasa_apod_url = f"https://api.nasa.gov/planetary/apod?api_key={self.nasa_api_key}"
-        self.nasa_neo_url = f"https://api.nasa.gov/neo/rest/v1/feed?api_key={self.nasa_api_key}"
+        # Gemeinsamer Daten-Kontext: ISS, Astronauten, APOD, NEOs und Starts werden
+        # prozessweit nur einmal geladen und von allen Seiten gelesen
+        self.context = get_data_context()
     
     def get_iss_location(self):
         """Holt aktuelle ISS Position"""
-        try:
-            response = requests.get(self.iss_api_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            return {
-                'latitude': float(data['iss_position']['latitude']),
-                'longitude': float(data['iss_position']['longitude']),
-                'timestamp': data['timestamp']
-            }
-        except:
-            # Fallback-Position (über Hamburg)
-            return {
-                'latitude': 53.5511,
-                'longitude': 9.9937,
-                'timestamp': int(datetime.now().timestamp())
-            }
+        position = self.context.data('iss_position')
+        if position:
+            return position
+        # Fallback-Position (über Hamburg)
+        return {
+            'latitude': 53.5511,
+            'longitude': 9.9937,
+            'timestamp': int(datetime.now().timestamp())
+        }
     
     def get_astronauts(self):
         """Holt Liste der Astronauten im All"""
-        try:
-            response = requests.get(self.astros_api_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            return data['people'], data['number']
-        except:
-            # Fallback-Daten
-            return [
-                {'name': 'Expedition Crew', 'craft': 'ISS'},
-                {'name': 'Shenzhou Crew', 'craft': 'Tiangong'}
-            ], 7
+        astros = self.context.data('astronauts')
+        if astros:
+            return astros['people'], astros['number']
+        # Fallback-Daten
+        return [
+            {'name': 'Expedition Crew', 'craft': 'ISS'},
+            {'name': 'Shenzhou Crew', 'craft': 'Tiangong'}
+        ], 7
     
     def get_spacex_next_launch(self):
-        """Holt nächste SpaceX Mission"""
-        try:
-            response = requests.get(self.spacex_upcoming_url, timeout=15)
-            response.raise_for_status()
-            launches = response.json()
-            
-            if launches:
-                # Finde nächsten Launch in der Zukunft
-                now = datetime.now()
-                for launch in launches:
-                    if launch.get('date_utc'):
-                        launch_date = datetime.fromisoformat(launch['date_utc'].replace('Z', '+00:00'))
-                        if launch_date > now:
-                            return launch
-            
-            # Fallback zu latest wenn keine upcoming
-            response = requests.get(self.spacex_latest_url, timeout=15)
-            return response.json()
-            
-        except:
-            # Fallback-Mission
-            return {
-                'name': 'Starlink Group 8-5',
-                'date_utc': '2025-05-31T08:58:00Z',
-                'rocket': {'name': 'Falcon 9 Block 5'},
-                'details': 'Deployment of 23 Starlink satellites to low Earth orbit.',
-                'success': None
-            }
+        """Holt nächste SpaceX Mission (Launch-Datensatz)"""
+        launches = get_launches('launches_upcoming') or ()
+        
+        # Finde nächsten Launch in der Zukunft (Datensätze sind nach Startzeit sortiert)
+        now = datetime.now(timezone.utc).timestamp()
+        for launch in launches:
+            if launch.timestamp and launch.timestamp > now:
+                return launch
+        
+        # Fallback-Mission
+        return Launch.decode({
+            'id': 'fallback',
+            'name': 'Starlink Group 8-5',
+            'date_utc': '2025-05-31T08:58:00Z',
+            'details': 'Deployment of 23 Starlink satellites to low Earth orbit.'
+        })
     
     def get_nasa_picture_of_day(self):
         """Holt NASA Picture of the Day"""
-        try:
-            response = requests.get(self.nasa_apod_url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except:
-            # Fallback-Bild
-            return {
-                'title': 'Andromeda Galaxy',
-                'explanation': 'The Andromeda Galaxy is our nearest major galactic neighbor.',
-                'url': 'https://science.nasa.gov/wp-content/uploads/2023/09/hubble-andromeda-galaxy-full-image.jpg',
-                'media_type': 'image'
-            }
+        apod = self.context.data('apod')
+        if apod:
+            return apod
+        # Fallback-Bild
+        return {
+            'title': 'Andromeda Galaxy',
+            'explanation': 'The Andromeda Galaxy is our nearest major galactic neighbor.',
+            'url': 'https://science.nasa.gov/wp-content/uploads/2023/09/hubble-andromeda-galaxy-full-image.jpg',
+            'media_type': 'image'
+        }
     
     def get_asteroid_data(self):
         """Holt Asteroid-Daten"""
-        try:
-            today = datetime.now().strftime('%Y-%m-%d')
-            url = f"{self.nasa_neo_url}&start_date={today}&end_date={today}"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            asteroids = []
-            for date, objects in data['near_earth_objects'].items():
-                for obj in objects[:5]:  # Top 5
-                    asteroids.append({
-                        'name': obj['name'],
-                        'diameter': f"~{obj['estimated_diameter']['meters']['estimated_diameter_max']:.0f}m",
-                        'distance': f"{float(obj['close_approach_data'][0]['miss_distance']['kilometers']):.0f} km",
-                        'hazardous': obj['is_potentially_hazardous_asteroid']
-                    })
-            return asteroids
-        except:
+        neo = self.context.data('neo_today')
+        if not neo:
             # Fallback-Asteroiden
             return [
                 {'name': '2025 AA', 'diameter': '~150m', 'distance': '2,500,000 km', 'hazardous': False},
                 {'name': '2025 BB', 'diameter': '~85m', 'distance': '1,800,000 km', 'hazardous': False}
             ]
+        
+        asteroids = []
+        for obj in neo['objects'][:5]:  # Top 5
+            asteroids.append({
+                'name': obj['name'],
+                'diameter': f"~{obj['estimated_diameter']['meters']['estimated_diameter_max']:.0f}m",
+                'distance': f"{float(obj['close_approach_data'][0]['miss_distance']['kilometers']):.0f} km",
+                'hazardous': obj['is_potentially_hazardous_asteroid']
+            })
+        return asteroids
+
+def render_iss_status(cosmic):
+    """ISS-Kachel mit der aktuellen Position"""
+    iss_data = cosmic.get_iss_location()
+    st.markdown(f"""
+    <div class="metric-card">
+        <h3>🛰️ ISS</h3>
+        <h2>Live</h2>
+        <p>{iss_data['latitude']:.2f}°, {iss_data['longitude']:.2f}°</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+def render_launch_countdown(cosmic):
+    """Countdown-Kachel für den nächsten SpaceX-Start (tickt im Browser)"""
+    target = cosmic.get_spacex_next_launch().timestamp
+    render_countdown(f"""
+    <div class="metric-card">
+        <h3>🚀 SpaceX</h3>
+        <h2>{countdown_span(target, "T-{d}d {h}h {m}m {s}s", done="Gestartet")}</h2>
+        <p>Nächster Start</p>
+    </div>
+    """, css=METRIC_CARD_CSS, height=170)
+
+def render_apod(cosmic):
+    """NASA Picture of the Day"""
+    nasa_pic = cosmic.get_nasa_picture_of_day()
+    
+    st.markdown("---")
+    st.markdown("### 🌟 NASA Picture of the Day")
+    
+    if nasa_pic and nasa_pic.get('media_type') == 'image':
+        col_pic, col_desc = st.columns([1, 1])
+        
+        with col_pic:
+            st.image(cached_image(nasa_pic['url']), use_container_width=True)
+        
+        with col_desc:
+            st.markdown(f"""
+            **📅 {nasa_pic['title']}**
+            
+            {nasa_pic['explanation'][:300]}...
+            
+            *NASA Astronomy Picture of the Day*
+            """)
 
 def main():
     # Header
@@ -197,27 +227,27 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
+    # Hintergrund-Prefetch für APOD & Mars Fotos
+    start_prefetcher()
+    
     # Initialize API
     cosmic = CosmicAnalyticsAPI()
     
+    # ISS, Countdown und APOD laufen als eigene Fragmente; der Rest nur bei vollem Neuladen
+    every = auto_refresh_toggle()
+    
     # Get live data
     iss_data = cosmic.get_iss_location()
     astronauts, astro_count = cosmic.get_astronauts()
     next_launch = cosmic.get_spacex_next_launch()
-    nasa_pic = cosmic.get_nasa_picture_of_day()
+    launch_net = next_launch.date.strftime('%d.%m.%Y %H:%M UTC') if next_launch.date else 'TBD'
     asteroids = cosmic.get_asteroid_data()
     
     # Live Status Metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>🛰️ ISS</h3>
-            <h2>Live</h2>
-            <p>{iss_data['latitude']:.2f}°, {iss_data['longitude']:.2f}°</p>
-        </div>
-        """, unsafe_allow_html=True)
+        fragment(run_every=every(30))(render_iss_status)(cosmic)
     
     with col2:
         st.markdown(f"""
@@ -229,30 +259,7 @@ def main():
         """, unsafe_allow_html=True)
     
     with col3:
-        # SpaceX Launch Countdown
-        if next_launch.get('date_utc'):
-            try:
-                launch_date = datetime.fromisoformat(next_launch['date_utc'].replace('Z', '+00:00'))
-                now = datetime.now()
-                if launch_date > now:
-                    diff = launch_date - now
-                    days = diff.days
-                    hours = diff.seconds // 3600
-                    countdown_text = f"T-{days}d {hours}h"
-                else:
-                    countdown_text = "Gestartet"
-            except:
-                countdown_text = "TBD"
-        else:
-            countdown_text = "TBD"
-            
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>🚀 SpaceX</h3>
-            <h2>{countdown_text}</h2>
-            <p>Nächster Start</p>
-        </div>
-        """, unsafe_allow_html=True)
+        fragment(run_every=every(1800))(render_launch_countdown)(cosmic)
     
     with col4:
         st.markdown(f"""
@@ -363,23 +370,7 @@ def main():
         """, unsafe_allow_html=True)
     
     # Live Data Preview
-    st.markdown("---")
-    st.markdown("### 🌟 NASA Picture of the Day")
-    
-    if nasa_pic and nasa_pic.get('media_type') == 'image':
-        col_pic, col_desc = st.columns([1, 1])
-        
-        with col_pic:
-            st.image(nasa_pic['url'], use_container_width=True)
-        
-        with col_desc:
-            st.markdown(f"""
-            **📅 {nasa_pic['title']}**
-            
-            {nasa_pic['explanation'][:300]}...
-            
-            *NASA Astronomy Picture of the Day*
-            """)
+    fragment(run_every=every(3600))(render_apod)(cosmic)
     
     # Space Facts
     st.markdown("---")
@@ -417,14 +408,23 @@ def main():
         - Speed: ~27,600 km/h
         
         **Next SpaceX Launch:**
-        - Mission: {next_launch.get('name', 'TBD')}
-        - Countdown: {countdown_text}
+        - Mission: {next_launch.name}
+        - NET: {launch_net}
         
         **Astronauts in Space:**
         - Total: {astro_count} Menschen
         - ISS + Tiangong Stations
         """)
         
+        st.markdown("---")
+        st.markdown("### 🔔 Letzte Alarme")
+        alerts = recent_alerts(limit=3)
+        if alerts:
+            for alert in alerts:
+                st.markdown(f"**{alert['title']}**  \n{alert['message']}")
+        else:
+            st.markdown("Keine aktuellen Alarme")
+        
         st.markdown("---")
         st.markdown("### 📍 Hamburg Location")
         st.markdown("""
@@ -436,12 +436,6 @@ def main():
         - Check ISS Mission Control
         - For pass predictions
         """)
-        
-        st.markdown("---")
-        st.markdown("*🔄 Auto-refresh every 30 seconds*")
-    
-    # Auto-refresh
-    time.sleep(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
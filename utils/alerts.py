@@ -0,0 +1,333 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_right
+from datetime import datetime, timezone
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # Windows: Auswertung ohne Dateisperre
+    fcntl = None
+
+from utils.config import DATA_DIR
+from utils.instrumentation import get_logger
+from utils.launch_providers import get_launch_index
+from utils.snapshots import get_snapshot_store
+from utils.space_weather import get_space_weather_store
+
+ALERTS_DIR = os.path.join(DATA_DIR, 'alerts')
+OUTBOX_FILE = os.path.join(ALERTS_DIR, 'outbox.jsonl')
+STATE_FILE = os.path.join(ALERTS_DIR, 'state.json')
+# Optional: Alarme zusätzlich per HTTP POST (JSON) zustellen
+ALERT_WEBHOOK_URL = os.getenv("ALERT_WEBHOOK_URL", "")
+
+KP_ALERT_THRESHOLD = 6
+ISS_PASS_LEAD_MINUTES = 10
+LAUNCH_LEAD_MINUTES = 60
+# Beim ersten Lauf nur Messwerte der letzten Stunden berücksichtigen (keine Alt-Alarme)
+MAX_BACKFILL_HOURS = 6
+# Wie lange versendete Alarm-Keys zur Deduplizierung gemerkt werden
+DEDUP_DAYS = 14
+
+logger = get_logger('alerts')
+
+
+def _iso(unix_seconds):
+    return datetime.fromtimestamp(unix_seconds, tz=timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
+
+
+def make_alert(key, rule, title, message, event_time, severity='info'):
+    return {
+        'key': key,
+        'rule': rule,
+        'title': title,
+        'message': message,
+        'severity': severity,
+        'event_time': event_time,
+        'created_at': int(time.time())
+    }
+
+
+class AlertRule:
+    """Basis: check(cursor, now) liefert (neue Alarme, neuer Cursor) und sieht nur neue Daten an"""
+
+    name = 'base'
+
+    def initial_cursor(self, now):
+        return now - MAX_BACKFILL_HOURS * 3600
+
+    def check(self, cursor, now):
+        raise NotImplementedError
+
+
+class SeriesRule(AlertRule):
+    """Regel auf einer zeitlich sortierten Space-Weather-Reihe (nur Datensätze nach dem Cursor)"""
+
+    feed = None
+
+    def __init__(self, store=None):
+        self.store = store or get_space_weather_store()
+
+    def check(self, cursor, now):
+        rows = self.store.series(self.feed)
+        times = [row['time'] for row in rows]
+        start = bisect_right(times, cursor)
+        alerts = [alert for row in rows[start:] for alert in self.match(row)]
+        return alerts, rows[-1]['time'] if len(rows) > start else cursor
+
+    def match(self, row):
+        raise NotImplementedError
+
+
+class XFlareRule(SeriesRule):
+    name = 'x_flare'
+    feed = 'xray_flares'
+
+    def match(self, row):
+        if not row['klasse'].startswith('X'):
+            return []
+        return [make_alert(
+            f"flare:{row['time']}", self.name,
+            f"☀️ X-Klasse Flare: {row['klasse']}",
+            f"Röntgen-Flare {row['klasse']} mit Maximum um {_iso(row['time'])} - Funkstörungen auf der Tagseite möglich.",
+            row['time'], severity='critical'
+        )]
+
+
+class KpStormRule(SeriesRule):
+    name = 'kp_storm'
+    feed = 'kp'
+
+    def __init__(self, store=None, threshold=KP_ALERT_THRESHOLD):
+        super().__init__(store)
+        self.threshold = threshold
+
+    def match(self, row):
+        if row['kp'] < self.threshold:
+            return []
+        # NOAA G-Skala: G1 ab Kp 5; ein Alarm pro Tag und Sturmstufe
+        level = min(5, int(row['kp']) - 4)
+        day = datetime.fromtimestamp(row['time'], tz=timezone.utc).strftime('%Y-%m-%d')
+        return [make_alert(
+            f"kp:{day}:G{level}", self.name,
+            f"🧲 Geomagnetischer Sturm G{level} (Kp {row['kp']:.1f})",
+            f"Kp {row['kp']:.1f} ab {_iso(row['time'])} - Polarlichter bis nach Norddeutschland möglich.",
+            row['time'], severity='warning'
+        )]
+
+
+class UpcomingEventRule(AlertRule):
+    """Vorlauf-Alarm: feuert, wenn now den Zeitpunkt event_time - lead überschreitet"""
+
+    lead_seconds = 0
+
+    def initial_cursor(self, now):
+        # Bereits laufende Vorlaufzeiten beim Start noch melden
+        return now - self.lead_seconds
+
+    def events(self):
+        """Zeitlich sortierte Liste (event_time, payload)"""
+        raise NotImplementedError
+
+    def check(self, cursor, now):
+        events = self.events()
+        times = [t for t, _ in events]
+        # Ereignisse, deren Alarmzeitpunkt in (cursor, now] liegt
+        start = bisect_right(times, cursor + self.lead_seconds)
+        end = bisect_right(times, now + self.lead_seconds)
+        alerts = [self.alert(t, payload) for t, payload in events[start:end] if t > now]
+        return alerts, now
+
+    def alert(self, event_time, payload):
+        raise NotImplementedError
+
+
+class ISSPassRule(UpcomingEventRule):
+    name = 'iss_pass'
+    lead_seconds = ISS_PASS_LEAD_MINUTES * 60
+
+    def __init__(self, snapshots=None):
+        self.snapshots = snapshots or get_snapshot_store()
+
+    def events(self):
+        passes = self.snapshots.get_data('iss_passes', default=[])
+        return sorted(((int(p['risetime']), p) for p in passes if p.get('risetime')), key=lambda item: item[0])
+
+    def alert(self, event_time, payload):
+        minutes = max(1, int(payload.get('duration', 0)) // 60)
+        return make_alert(
+            f"iss:{event_time}", self.name,
+            f"🛰️ ISS-Überflug über Hamburg in {ISS_PASS_LEAD_MINUTES} Minuten",
+            f"Aufgang um {_iso(event_time)}, sichtbar für ca. {minutes} Minuten.",
+            event_time
+        )
+
+
+class LaunchRule(UpcomingEventRule):
+    name = 'launch'
+    lead_seconds = LAUNCH_LEAD_MINUTES * 60
+
+    def __init__(self, launch_index=None):
+        # Zusammengeführter Index aller Provider, wie ihn das Launch Center anzeigt
+        self.launch_index = launch_index or get_launch_index
+
+    def events(self):
+        index = self.launch_index()
+        if index is None:
+            return []
+        # Der Index ist nach Startzeit sortiert
+        return [(int(launch.timestamp), launch) for launch in index.upcoming() if not launch.tbd]
+
+    def alert(self, event_time, payload):
+        # NET-Verschiebungen erzeugen einen neuen Key und damit einen neuen Alarm
+        agency = f" ({payload.agency})" if payload.agency else ""
+        return make_alert(
+            f"launch:{payload.id}:{event_time}", self.name,
+            f"🚀 Start in 1 Stunde: {payload.name}{agency}",
+            f"Geplanter Start um {_iso(event_time)}.",
+            event_time
+        )
+
+
+class FileOutbox:
+    """Alarme als JSON-Zeilen in data/alerts/outbox.jsonl"""
+
+    def __init__(self, path=OUTBOX_FILE):
+        self.path = path
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    def deliver(self, alert):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(alert, ensure_ascii=False) + '\n')
+
+    def recent(self, limit=5):
+        """Letzte Alarme, neueste zuerst"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()[-limit:]
+        except OSError:
+            return []
+        return [json.loads(line) for line in reversed(lines) if line.strip()]
+
+
+class WebhookOutbox:
+    """Stellt Alarme per HTTP POST zu (z.B. an einen Chat-Webhook)"""
+
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def deliver(self, alert):
+        requests.post(self.url, json=alert, timeout=self.timeout)
+
+
+def default_outboxes():
+    outboxes = [FileOutbox()]
+    if ALERT_WEBHOOK_URL:
+        outboxes.append(WebhookOutbox(ALERT_WEBHOOK_URL))
+    return outboxes
+
+
+class AlertEngine:
+    """Wertet alle Regeln inkrementell aus, dedupliziert und schreibt neue Alarme in die Outboxen
+
+    Dashboard-Worker und Collector teilen sich state.json: jeder Durchlauf liest den Stand
+    unter einer Dateisperre neu ein und schreibt ihn vor dem Freigeben zurück, damit kein
+    Prozess mit veralteten Cursorn bereits versendete Alarme erneut zustellt.
+    """
+
+    def __init__(self, rules=None, outboxes=None, state_path=STATE_FILE):
+        self.rules = rules or [XFlareRule(), KpStormRule(), ISSPassRule(), LaunchRule()]
+        self.outboxes = outboxes or default_outboxes()
+        self.state_path = state_path
+        self.lock_path = f"{state_path}.lock"
+        self._lock = threading.Lock()
+        self.state = self._load_state()
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        state.setdefault('cursors', {})
+        state.setdefault('sent', {})
+        return state
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def evaluate(self, now=None):
+        """Ein Durchlauf über alle Regeln, gibt die neu versendeten Alarme zurück"""
+        now = int(time.time() if now is None else now)
+        os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+        # Eigene Sperrdatei: state.json selbst wird per os.replace ausgetauscht
+        with self._lock, open(self.lock_path, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self.state = self._load_state()
+                return self._evaluate(now)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _evaluate(self, now):
+        sent = []
+        cursors = self.state['cursors']
+        for rule in self.rules:
+            cursor = cursors.get(rule.name)
+            if cursor is None:
+                cursor = rule.initial_cursor(now)
+            try:
+                alerts, cursors[rule.name] = rule.check(cursor, now)
+            except Exception:
+                logger.exception("Alarm-Regel %s fehlgeschlagen", rule.name)
+                continue
+
+            for alert in alerts:
+                if alert['key'] in self.state['sent']:
+                    continue
+                self._deliver(alert)
+                logger.info("Alarm %s: %s", alert['key'], alert['title'])
+                self.state['sent'][alert['key']] = now
+                sent.append(alert)
+
+        # Alte Dedup-Keys verwerfen
+        horizon = now - DEDUP_DAYS * 86400
+        self.state['sent'] = {k: t for k, t in self.state['sent'].items() if t >= horizon}
+        self._save_state()
+        return sent
+
+    def _deliver(self, alert):
+        for outbox in self.outboxes:
+            try:
+                outbox.deliver(alert)
+            except Exception:
+                # Ein nicht erreichbarer Webhook soll die Datei-Outbox nicht blockieren
+                logger.warning("Zustellung an %s fehlgeschlagen", type(outbox).__name__, exc_info=True)
+
+
+def recent_alerts(limit=5):
+    """Letzte Alarme aus der Datei-Outbox (für Sidebar/Seiten)"""
+    return FileOutbox().recent(limit)
+
+
+_alert_engine = None
+_alert_engine_lock = threading.Lock()
+
+
+def get_alert_engine():
+    """Prozessweite Alert-Engine"""
+    global _alert_engine
+    with _alert_engine_lock:
+        if _alert_engine is None:
+            _alert_engine = AlertEngine()
+        return _alert_engine
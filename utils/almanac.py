@@ -0,0 +1,179 @@
+import os
+import threading
+from datetime import date, timedelta
+
+import numpy as np
+
+from utils.astro import (
+    ASTRONOMICAL_TWILIGHT, CIVIL_TWILIGHT, SUN_H0, crossings, culminations, day_grid,
+    horizontal, local_midnights, sun_altitude
+)
+from utils.config import DATA_DIR, HAMBURG_LAT, HAMBURG_LON
+from utils.lunar import moon_elongation, moon_illumination, moon_rise_set
+from utils.planets import OBSERVABLE_PLANETS, planet_positions
+from utils.visibility import PLANET_H0
+
+ALMANAC_DIR = os.path.join(DATA_DIR, 'almanac')
+# Bei Änderungen am Dateiformat erhöhen, damit alte Almanache neu berechnet werden
+ALMANAC_VERSION = 1
+
+# Ereigniszeiten werden als float32-Minuten nach lokaler Mitternacht gespeichert (NaN = kein Ereignis)
+SUN_EVENTS = ('sunrise', 'sunset', 'civil_dawn', 'civil_dusk', 'astronomical_dawn', 'astronomical_dusk')
+
+
+def _minutes(jd, midnights):
+    """JD-Werte -> Minuten nach der jeweiligen lokalen Mitternacht (float32)"""
+    midnights = midnights.reshape((-1,) + (1,) * (np.ndim(jd) - 1))
+    return ((jd - midnights) * 1440.0).astype(np.float32)
+
+
+def build_almanac(year, lat=HAMBURG_LAT, lon=HAMBURG_LON, step_minutes=10):
+    """Tageswerte für ein ganzes Jahr (Sonne, Dämmerung, Mond, Planeten) als Arrays"""
+    start = date(year, 1, 1)
+    days = (date(year + 1, 1, 1) - start).days
+    midnights = local_midnights(start, days)
+    grid = day_grid(midnights, step_minutes)
+
+    # Sonne: Auf-/Untergang und Dämmerung in einem Durchgang (3 Schwellen x Tage)
+    sun_alt = sun_altitude(grid, lat, lon)
+    thresholds = np.array([SUN_H0, CIVIL_TWILIGHT, ASTRONOMICAL_TWILIGHT])
+    sun_rise, sun_set = crossings(
+        np.tile(grid, (3, 1)), (sun_alt[None, :, :] - thresholds[:, None, None]).reshape(-1, grid.shape[1])
+    )
+    sun_rise = sun_rise.reshape(3, days)
+    sun_set = sun_set.reshape(3, days)
+
+    # Mond
+    moonrise, moonset = moon_rise_set(start, days, lat, lon, step_minutes)
+
+    # Planeten: alle Tage x Samples in einer Auswertung, danach pro Tag und Planet
+    flat = grid.ravel()
+    ephemeris = planet_positions(flat, OBSERVABLE_PLANETS)
+    altitude, _ = horizontal(ephemeris['ra'], ephemeris['dec'], flat, lat, lon)
+    rows = altitude.reshape(-1, grid.shape[1])
+    planet_grid = np.tile(grid, (len(OBSERVABLE_PLANETS), 1))
+    rise, set_ = crossings(planet_grid, rows - PLANET_H0)
+    transit, transit_alt = culminations(planet_grid, rows)
+
+    def per_day(values):
+        return values.reshape(len(OBSERVABLE_PLANETS), days).T
+
+    midnight_index = np.arange(days) * grid.shape[1]
+    almanac = {
+        'version': np.array(ALMANAC_VERSION),
+        'year': np.array(year),
+        'location': np.array([lat, lon]),
+        'midnight': midnights,
+        'moonrise': _minutes(moonrise, midnights),
+        'moonset': _minutes(moonset, midnights),
+        'moon_illumination': moon_illumination(midnights).astype(np.float32),
+        'moon_elongation': moon_elongation(midnights).astype(np.float32),
+        'planets': np.array(OBSERVABLE_PLANETS),
+        'planet_rise': _minutes(per_day(rise), midnights),
+        'planet_set': _minutes(per_day(set_), midnights),
+        'planet_transit': _minutes(per_day(transit), midnights),
+        'planet_transit_altitude': per_day(transit_alt).astype(np.float32),
+        'planet_elongation': ephemeris['elongation'][:, midnight_index].T.astype(np.float32),
+    }
+    for i, (rise_key, set_key) in enumerate(zip(SUN_EVENTS[::2], SUN_EVENTS[1::2])):
+        almanac[rise_key] = _minutes(sun_rise[i], midnights)
+        almanac[set_key] = _minutes(sun_set[i], midnights)
+    return almanac
+
+
+class SkyAlmanac:
+    """Jahres-Almanach mit Datei-Cache (.npz) in data/almanac und O(1)-Abfrage pro Datum"""
+
+    def __init__(self, lat=HAMBURG_LAT, lon=HAMBURG_LON, directory=ALMANAC_DIR):
+        self.lat = float(lat)
+        self.lon = float(lon)
+        self.directory = directory
+        self._memory = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, year):
+        return os.path.join(self.directory, f"almanac_{year}_{self.lat:.3f}_{self.lon:.3f}.npz")
+
+    def year(self, year):
+        """Arrays eines Jahres (Speicher -> Datei -> Berechnung)"""
+        with self._lock:
+            if year in self._memory:
+                return self._memory[year]
+
+        almanac = self._load(year)
+        if almanac is None:
+            almanac = build_almanac(year, self.lat, self.lon)
+            self._save(year, almanac)
+
+        with self._lock:
+            self._memory[year] = almanac
+        return almanac
+
+    def _load(self, year):
+        try:
+            with np.load(self._path(year)) as cached:
+                almanac = {key: cached[key] for key in cached.files}
+        except (OSError, ValueError, KeyError):
+            return None
+        if int(almanac.get('version', -1)) != ALMANAC_VERSION:
+            return None
+        return almanac
+
+    def _save(self, year, almanac):
+        path = self._path(year)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(tmp_path, **almanac)
+        os.replace(tmp_path, path)
+
+    def day(self, day):
+        """Alle Almanach-Werte eines lokalen Kalendertags (Zeiten als JD, NaN = kein Ereignis)"""
+        almanac = self.year(day.year)
+        i = day.toordinal() - date(day.year, 1, 1).toordinal()
+        midnight = float(almanac['midnight'][i])
+
+        entry = {'date': day, 'midnight': midnight}
+        for key in SUN_EVENTS + ('moonrise', 'moonset'):
+            entry[key] = midnight + float(almanac[key][i]) / 1440.0
+        entry['moon_illumination'] = float(almanac['moon_illumination'][i])
+        entry['moon_elongation'] = float(almanac['moon_elongation'][i])
+
+        entry['planets'] = {
+            str(name): {
+                'rise': midnight + float(almanac['planet_rise'][i, p]) / 1440.0,
+                'set': midnight + float(almanac['planet_set'][i, p]) / 1440.0,
+                'transit': midnight + float(almanac['planet_transit'][i, p]) / 1440.0,
+                'transit_altitude': float(almanac['planet_transit_altitude'][i, p]),
+                'elongation': float(almanac['planet_elongation'][i, p])
+            }
+            for p, name in enumerate(almanac['planets'])
+        }
+        return entry
+
+    def days(self, start, count):
+        """Tageswerte (Mitternacht, Mondbeleuchtung, Phasenwinkel) für count Tage ab start"""
+        parts = {'midnight': [], 'moon_illumination': [], 'moon_elongation': []}
+        day = start
+        remaining = count
+        while remaining > 0:
+            almanac = self.year(day.year)
+            i = day.toordinal() - date(day.year, 1, 1).toordinal()
+            take = min(remaining, len(almanac['midnight']) - i)
+            for key in parts:
+                parts[key].append(almanac[key][i:i + take])
+            remaining -= take
+            day = day + timedelta(days=take)
+        return {key: np.concatenate(values) for key, values in parts.items()}
+
+
+_almanac = None
+_almanac_lock = threading.Lock()
+
+
+def get_almanac():
+    """Prozessweiter Almanach für den Beobachterstandort (Hamburg)"""
+    global _almanac
+    with _almanac_lock:
+        if _almanac is None:
+            _almanac = SkyAlmanac()
+        return _almanac
@@ -0,0 +1,126 @@
+import os
+import threading
+
+import numpy as np
+
+from utils.config import DATA_DIR
+from utils.timeseries import downsample_minmax
+
+try:
+    import fcntl
+except ImportError:  # Windows: Anhängen ohne Dateisperre
+    fcntl = None
+
+ARCHIVE_DIR = os.path.join(DATA_DIR, 'archive')
+
+
+def record_dtype(channels):
+    """Datensatz-Typ für ein Archiv: ts (float64, Unix-Sekunden) + float32 pro Kanal, ohne Padding"""
+    return np.dtype([('ts', '<f8')] + [(channel, '<f4') for channel in channels])
+
+
+class RecordArchive:
+    """Append-only Archiv fester Datensatzbreite, nach ts sortiert
+
+    Lesen geht ausschließlich über np.memmap: window() schneidet per Binärsuche auf der
+    ts-Spalte und gibt eine Sicht auf die Datei zurück (keine Kopie). Das Betriebssystem
+    lädt nur die Seiten, die tatsächlich angefasst werden - ein 30-Tage-Fenster aus einem
+    Archiv mit Millionen Einträgen kostet daher nur das Fenster selbst.
+    """
+
+    def __init__(self, path, dtype):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    def mapped(self):
+        """Alle vollständigen Datensätze als read-only memmap (leeres Array ohne Datei)"""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+        # Unvollständigen letzten Datensatz (abgebrochener Schreibvorgang) ignorieren
+        count = size // self.dtype.itemsize
+        if count == 0:
+            return np.zeros(0, dtype=self.dtype)
+        return np.memmap(self.path, dtype=self.dtype, mode='r', shape=(count,))
+
+    def __len__(self):
+        return len(self.mapped())
+
+    def last(self):
+        """Jüngster Datensatz oder None"""
+        records = self.mapped()
+        return records[-1].copy() if len(records) else None
+
+    def extent(self):
+        """(ältester, jüngster) Zeitstempel oder None"""
+        records = self.mapped()
+        if not len(records):
+            return None
+        return float(records['ts'][0]), float(records['ts'][-1])
+
+    def append(self, records):
+        """Datensätze (strukturiertes Array oder Tupel-Liste) anhängen, nur neuere als der letzte Eintrag
+
+        Gibt die Zahl geschriebener Datensätze zurück.
+        """
+        records = np.sort(np.asarray(records, dtype=self.dtype), order='ts')
+        if not len(records):
+            return 0
+        with self._lock, open(self.path, 'ab') as f:
+            # Sperre über Prozesse hinweg (Dashboard-Worker + Collector), damit die Datei sortiert bleibt
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                # Angefangenen Datensatz eines abgebrochenen Schreibvorgangs überschreiben
+                size = f.seek(0, os.SEEK_END)
+                f.truncate(size - size % self.dtype.itemsize)
+                last = self.last()
+                if last is not None:
+                    records = records[records['ts'] > last['ts']]
+                # Doppelte Zeitstempel innerhalb des Batches: erster gewinnt
+                if len(records) > 1:
+                    records = records[np.concatenate(([True], np.diff(records['ts']) > 0))]
+                f.write(records.tobytes())
+                return len(records)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def window(self, start, end=None):
+        """Datensätze mit start <= ts <= end als Sicht auf die Datei (O(log n), ohne Kopie)"""
+        records = self.mapped()
+        ts = records['ts']
+        lo = np.searchsorted(ts, start, side='left')
+        hi = len(records) if end is None else np.searchsorted(ts, end, side='right')
+        return records[lo:hi]
+
+    def query(self, seconds, channel, end=None, max_points=600):
+        """Fenster der Länge seconds (bis end bzw. zum jüngsten Wert) auf max_points reduziert
+
+        Gleiches Ergebnisformat wie RingSeries.query: {'time', 'mean', 'min', 'max', 'step'};
+        'step' ist hier der mittlere Abstand der Rohdaten.
+        """
+        records = self.mapped()
+        if end is None:
+            end = float(records['ts'][-1]) if len(records) else 0.0
+        window = self.window(end - seconds, end)
+        times = window['ts'].astype(np.int64)
+        values = window[channel]
+        step = int(np.median(np.diff(times))) if len(times) > 1 else 0
+        times, mean, low, high = downsample_minmax(times, values.astype(np.float64), values, values, max_points)
+        return {'time': times, 'mean': mean, 'min': low, 'max': high, 'step': step}
+
+
+_archives = {}
+_archives_lock = threading.Lock()
+
+
+def get_archive(name, channels):
+    """Prozessweites Archiv data/archive/<name>.bin mit den Kanälen channels"""
+    with _archives_lock:
+        if name not in _archives:
+            _archives[name] = RecordArchive(os.path.join(ARCHIVE_DIR, f"{name}.bin"), record_dtype(channels))
+        return _archives[name]
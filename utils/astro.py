@@ -0,0 +1,191 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from utils.config import TIMEZONE
+
+# Astronomische Grundlagen (Zeit, Sonne, Koordinaten), vektorisiert mit NumPy.
+# Niedrig-präzise Formeln nach Meeus, "Astronomical Algorithms". Alle Zeiten sind UTC,
+# naive datetimes werden als UTC interpretiert.
+
+J2000 = 2451545.0
+UNIX_EPOCH_JD = 2440587.5
+AU_KM = 149597870.7
+# Äquatorradius der Erde
+EARTH_RADIUS_KM = 6378.14
+
+# Standard-Horizonthöhen für Auf-/Untergang (Grad)
+SUN_H0 = -0.8333
+CIVIL_TWILIGHT = -6.0
+NAUTICAL_TWILIGHT = -12.0
+ASTRONOMICAL_TWILIGHT = -18.0
+
+
+def to_datetime64(times):
+    """Wandelt datetime(s) / datetime64 in ein datetime64[ms]-Array (UTC) um"""
+    if isinstance(times, datetime):
+        times = [times]
+    if isinstance(times, np.ndarray) and np.issubdtype(times.dtype, np.datetime64):
+        return times.astype('datetime64[ms]')
+
+    converted = []
+    for t in times:
+        if isinstance(t, datetime) and t.tzinfo is not None:
+            t = t.astimezone(timezone.utc).replace(tzinfo=None)
+        converted.append(np.datetime64(t, 'ms'))
+    return np.array(converted, dtype='datetime64[ms]')
+
+
+def julian_day(times):
+    """Julianisches Datum für datetime(s) oder datetime64-Arrays"""
+    ms = to_datetime64(times).astype('int64')
+    return ms / 86400000.0 + UNIX_EPOCH_JD
+
+
+def jd_to_datetime64(jd):
+    """Julianisches Datum -> datetime64[s] (UTC)"""
+    seconds = np.round((np.asarray(jd, dtype=float) - UNIX_EPOCH_JD) * 86400.0)
+    return seconds.astype('int64').astype('datetime64[s]')
+
+
+def jd_to_datetime(jd):
+    """Julianisches Datum -> timezone-aware datetime (UTC)"""
+    seconds = (float(jd) - UNIX_EPOCH_JD) * 86400.0
+    return datetime.fromtimestamp(round(seconds), tz=timezone.utc)
+
+
+def centuries(jd):
+    """Julianische Jahrhunderte seit J2000"""
+    return (np.asarray(jd, dtype=float) - J2000) / 36525.0
+
+
+def wrap360(angle):
+    return np.mod(angle, 360.0)
+
+
+def wrap180(angle):
+    return np.mod(np.asarray(angle) + 180.0, 360.0) - 180.0
+
+
+def obliquity(jd):
+    """Mittlere Schiefe der Ekliptik (Grad)"""
+    return 23.439291 - 0.0130042 * centuries(jd)
+
+
+def sun_position(jd):
+    """Scheinbare ekliptikale Länge (Grad) und Entfernung (AE) der Sonne"""
+    T = centuries(jd)
+    L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T ** 2
+    M = np.radians(357.52911 + 35999.05029 * T - 0.0001537 * T ** 2)
+    e = 0.016708634 - 0.000042037 * T
+
+    C = ((1.914602 - 0.004817 * T - 0.000014 * T ** 2) * np.sin(M)
+         + (0.019993 - 0.000101 * T) * np.sin(2 * M)
+         + 0.000289 * np.sin(3 * M))
+    true_longitude = L0 + C
+    nu = M + np.radians(C)
+    distance = 1.000001018 * (1 - e ** 2) / (1 + e * np.cos(nu))
+
+    # Nutation & Aberration (vereinfacht)
+    omega = np.radians(125.04 - 1934.136 * T)
+    longitude = true_longitude - 0.00569 - 0.00478 * np.sin(omega)
+    return wrap360(longitude), distance
+
+
+def ecliptic_to_equatorial(longitude, latitude, jd):
+    """Ekliptikale (λ, β) -> äquatoriale (α, δ) Koordinaten, alles in Grad"""
+    lam = np.radians(longitude)
+    beta = np.radians(latitude)
+    eps = np.radians(obliquity(jd))
+
+    ra = np.arctan2(np.sin(lam) * np.cos(eps) - np.tan(beta) * np.sin(eps), np.cos(lam))
+    dec = np.arcsin(np.sin(beta) * np.cos(eps) + np.cos(beta) * np.sin(eps) * np.sin(lam))
+    return wrap360(np.degrees(ra)), np.degrees(dec)
+
+
+def sidereal_time(jd):
+    """Mittlere Greenwich-Sternzeit (Grad)"""
+    T = centuries(jd)
+    gmst = (280.46061837 + 360.98564736629 * (np.asarray(jd, dtype=float) - J2000)
+            + 0.000387933 * T ** 2 - T ** 3 / 38710000.0)
+    return wrap360(gmst)
+
+
+def horizontal(ra, dec, jd, lat, lon):
+    """Äquatoriale Koordinaten -> Höhe & Azimut (Grad, Azimut ab Nord über Ost)"""
+    hour_angle = np.radians(sidereal_time(jd) + lon - ra)
+    phi = np.radians(lat)
+    delta = np.radians(dec)
+
+    sin_alt = np.sin(phi) * np.sin(delta) + np.cos(phi) * np.cos(delta) * np.cos(hour_angle)
+    altitude = np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+    azimuth = np.degrees(np.arctan2(
+        -np.cos(delta) * np.sin(hour_angle),
+        np.sin(delta) * np.cos(phi) - np.cos(delta) * np.sin(phi) * np.cos(hour_angle)
+    ))
+    return altitude, wrap360(azimuth)
+
+
+def sun_altitude(jd, lat, lon):
+    """Höhe der Sonne über dem Horizont (Grad)"""
+    longitude, _ = sun_position(jd)
+    ra, dec = ecliptic_to_equatorial(longitude, 0.0, jd)
+    altitude, _ = horizontal(ra, dec, jd, lat, lon)
+    return altitude
+
+
+def local_zone(tz_name=TIMEZONE):
+    """ZoneInfo für den Beobachterstandort (UTC wenn die tz-Datenbank fehlt)"""
+    try:
+        return ZoneInfo(tz_name)
+    except Exception:
+        return timezone.utc
+
+
+def local_midnights(start_date, days, tz_name=TIMEZONE):
+    """JD der lokalen Mitternacht für `days` aufeinanderfolgende Kalendertage ab start_date"""
+    zone = local_zone(tz_name)
+    midnights = [
+        datetime.combine(start_date + timedelta(days=i), datetime.min.time(), tzinfo=zone)
+        for i in range(days)
+    ]
+    return julian_day(midnights)
+
+
+def day_grid(start_jds, step_minutes=10, hours=24):
+    """Abtast-Gitter (Tage x Samples) mit JD-Werten, eine Zeile pro Start-JD"""
+    samples = int(round(hours * 60 / step_minutes)) + 1
+    offsets = np.arange(samples) * (step_minutes / 1440.0)
+    return np.asarray(start_jds, dtype=float).reshape(-1, 1) + offsets
+
+
+def crossings(jd_grid, values, threshold=0.0):
+    """Erster Auf- und Abwärtsdurchgang pro Zeile (linear interpoliert, NaN wenn keiner)
+
+    Gibt (rise_jd, set_jd) zurück: rise = Wert steigt über threshold, set = fällt darunter.
+    """
+    above = np.asarray(values) - threshold
+    a, b = above[:, :-1], above[:, 1:]
+    frac = np.where(a != b, a / np.where(a != b, a - b, 1.0), 0.0)
+    jd_cross = jd_grid[:, :-1] + frac * (jd_grid[:, 1:] - jd_grid[:, :-1])
+
+    def first(mask):
+        has = mask.any(axis=1)
+        idx = mask.argmax(axis=1)
+        result = jd_cross[np.arange(len(idx)), idx]
+        return np.where(has, result, np.nan)
+
+    return first((a < 0) & (b >= 0)), first((a >= 0) & (b < 0))
+
+
+def culminations(jd_grid, values):
+    """Zeitpunkt und Wert des Maximums pro Zeile (Parabel durch das Maximum und seine Nachbarn)"""
+    values = np.asarray(values)
+    rows = np.arange(values.shape[0])
+    idx = np.clip(np.argmax(values, axis=1), 1, values.shape[1] - 2)
+    y0, y1, y2 = values[rows, idx - 1], values[rows, idx], values[rows, idx + 1]
+    denom = y0 - 2 * y1 + y2
+    offset = np.where(denom != 0, 0.5 * (y0 - y2) / np.where(denom != 0, denom, 1.0), 0.0)
+    step = jd_grid[rows, idx + 1] - jd_grid[rows, idx]
+    return jd_grid[rows, idx] + offset * step, y1 - 0.25 * (y0 - y2) * offset
@@ -0,0 +1,129 @@
+from functools import lru_cache
+
+import numpy as np
+
+from utils.astro import ecliptic_to_equatorial, julian_day, sidereal_time, sun_position, wrap180
+from utils.config import HAMBURG_LAT, HAMBURG_LON
+
+# Geomagnetischer Nordpol (zentrierter Dipol, IGRF-13 Epoche 2020)
+GEOMAGNETIC_POLE_LAT = 80.65
+GEOMAGNETIC_POLE_LON = -72.68
+
+# Äquatorgrenze des Ovals um magnetische Mitternacht bei Kp 0 und Verschiebung pro Kp-Stufe,
+# Tagseite liegt um DAYSIDE_SHIFT Grad polwärts (vereinfachtes Feldstein/Starkov-Oval)
+BOUNDARY_KP0 = 66.5
+BOUNDARY_PER_KP = 2.0
+DAYSIDE_SHIFT = 9.0
+
+AURORA_CITIES = {
+    'Hamburg': (HAMBURG_LAT, HAMBURG_LON),
+    'Berlin': (52.52, 13.40),
+    'München': (48.14, 11.58),
+    'Tromsø': (69.65, 18.96),
+    'Reykjavik': (64.15, -21.94),
+    'Oslo': (59.91, 10.75),
+}
+
+
+def geomagnetic_coordinates(lat, lon):
+    """Geographische -> geomagnetische Breite/Länge (Grad, zentrierter Dipol)"""
+    phi = np.radians(lat)
+    lam = np.radians(lon)
+    phi_p = np.radians(GEOMAGNETIC_POLE_LAT)
+    lam_p = np.radians(GEOMAGNETIC_POLE_LON)
+
+    sin_mlat = np.sin(phi) * np.sin(phi_p) + np.cos(phi) * np.cos(phi_p) * np.cos(lam - lam_p)
+    mlat = np.arcsin(np.clip(sin_mlat, -1.0, 1.0))
+    mlon = np.arctan2(
+        np.cos(phi) * np.sin(lam - lam_p),
+        np.cos(phi) * np.sin(phi_p) * np.cos(lam - lam_p) - np.sin(phi) * np.cos(phi_p)
+    )
+    return np.degrees(mlat), np.degrees(mlon)
+
+
+def subsolar_point(jd):
+    """Geographische Breite/Länge des Subsolarpunkts (Grad)"""
+    sun_lon, _ = sun_position(jd)
+    ra, dec = ecliptic_to_equatorial(sun_lon, 0.0, jd)
+    return dec, wrap180(ra - sidereal_time(jd))
+
+
+def magnetic_local_time(mlon, jd):
+    """Magnetische Ortszeit (Stunden, 0-24) aus geomagnetischer Länge"""
+    sun_lat, sun_lon = subsolar_point(jd)
+    _, sun_mlon = geomagnetic_coordinates(sun_lat, sun_lon)
+    return np.mod(12.0 + (np.asarray(mlon) - sun_mlon) / 15.0, 24.0)
+
+
+def equatorward_boundary(kp, mlt=0.0):
+    """Geomagnetische Breite der Äquatorgrenze des Ovals für Kp und MLT"""
+    dayside = (1 - np.cos(np.radians(np.asarray(mlt) * 15.0))) / 2
+    return BOUNDARY_KP0 - BOUNDARY_PER_KP * kp + DAYSIDE_SHIFT * dayside
+
+
+def aurora_probability(mlat, mlt, kp):
+    """Polarlicht-Wahrscheinlichkeit (0-100 %) für |geomag. Breite| und MLT bei gegebenem Kp
+
+    Gauß-Profil um die Ovalmitte; die äquatorwärtige Flanke deckt auch Polarlicht
+    tief am Horizont ab, polwärts (Polkappe) fällt die Wahrscheinlichkeit langsamer ab.
+    """
+    boundary = equatorward_boundary(kp, mlt)
+    width = 6.0 + 0.6 * kp
+    center = boundary + width / 2
+    sigma = np.where(np.abs(mlat) < center, width / 2, width)
+    peak = min(95.0, 50.0 + 5.0 * kp)
+    return peak * np.exp(-0.5 * ((np.abs(mlat) - center) / sigma) ** 2)
+
+
+@lru_cache(maxsize=8)
+def aurora_grid(kp, kp_time, resolution=1.0, max_lat=85.0):
+    """Globales Wahrscheinlichkeitsgitter (Nord nach Süd) für ein Kp-Intervall, gecacht pro Kp-Update
+
+    kp_time ist der Beginn des 3-Stunden-Intervalls (Unix-Sekunden); das Oval wird für
+    die Intervallmitte berechnet.
+    """
+    lats = np.arange(max_lat, -max_lat - resolution / 2, -resolution)
+    lons = np.arange(-180.0, 180.0 + resolution / 2, resolution)
+    lat_grid, lon_grid = np.meshgrid(lats, lons, indexing='ij')
+
+    jd = float(julian_day(np.array([kp_time + 5400], dtype='datetime64[s]'))[0])
+    mlat, mlon = geomagnetic_coordinates(lat_grid, lon_grid)
+    mlt = magnetic_local_time(mlon, jd)
+
+    return {
+        'kp': kp,
+        'kp_time': kp_time,
+        'lat': lats,
+        'lon': lons,
+        'probability': aurora_probability(mlat, mlt, kp),
+    }
+
+
+def city_probabilities(kp, cities=AURORA_CITIES):
+    """Chance pro Stadt in der kommenden Nacht (Oval auf der Nachtseite, MLT 0)"""
+    names = list(cities)
+    lat = np.array([cities[name][0] for name in names])
+    lon = np.array([cities[name][1] for name in names])
+    mlat, _ = geomagnetic_coordinates(lat, lon)
+    chance = aurora_probability(mlat, 0.0, kp)
+
+    return {
+        name: {
+            'breitengrad': round(float(lat[i]), 1),
+            'laengengrad': round(float(lon[i]), 1),
+            'geomagnetische_breite': round(float(mlat[i]), 1),
+            'wahrscheinlichkeit': int(round(float(chance[i])))
+        }
+        for i, name in enumerate(names)
+    }
+
+
+def probability_rgba(probability, threshold=5.0):
+    """Gitter -> RGBA-Bild (grün, Deckkraft nach Wahrscheinlichkeit) für eine Karten-Überlagerung"""
+    p = np.clip(probability / 100.0, 0.0, 1.0)
+    rgba = np.zeros(probability.shape + (4,), dtype=np.float32)
+    rgba[..., 0] = p ** 2
+    rgba[..., 1] = 0.9
+    rgba[..., 2] = 0.4 * (1 - p)
+    rgba[..., 3] = np.where(probability >= threshold, 0.25 + 0.6 * p, 0.0)
+    return rgba
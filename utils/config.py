@@ -0,0 +1,17 @@
+import os
+
+from dotenv import load_dotenv
+
+# .env laden, bevor Einstellungen gelesen werden (Module werden vor load_dotenv() der Seiten importiert)
+load_dotenv()
+
+# Projekt-Verzeichnisse
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# DATA_DIR/LOG_DIR überschreibbar (z.B. Benchmark oder Collector mit eigenem Datenverzeichnis)
+DATA_DIR = os.getenv("DATA_DIR") or os.path.join(BASE_DIR, 'data')
+LOG_DIR = os.getenv("LOG_DIR") or os.path.join(BASE_DIR, 'logs')
+
+# Beobachterstandort (Default: Hamburg)
+HAMBURG_LAT = float(os.getenv("HAMBURG_LAT", "53.5511"))
+HAMBURG_LON = float(os.getenv("HAMBURG_LON", "9.9937"))
+TIMEZONE = os.getenv("TIMEZONE", "Europe/Berlin")
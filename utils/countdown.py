@@ -0,0 +1,62 @@
+import html
+
+import streamlit.components.v1 as components
+
+# Tickt im Browser: jedes Element mit data-countdown (Zielzeit in Unix-Sekunden) wird sekündlich
+# aus der Browser-Uhr neu berechnet. Der Server muss dafür nicht mehr neu laufen.
+_TICKER_JS = """
+<script>
+(function () {
+    var elements = document.querySelectorAll('[data-countdown]');
+    function tick() {
+        var now = Date.now() / 1000;
+        elements.forEach(function (el) {
+            var left = Math.floor(parseFloat(el.dataset.countdown) - now);
+            if (left <= 0) {
+                el.textContent = el.dataset.done;
+                return;
+            }
+            var d = Math.floor(left / 86400), h = Math.floor(left % 86400 / 3600),
+                m = Math.floor(left % 3600 / 60), s = left % 60;
+            el.textContent = el.dataset.format
+                .replace('{d}', d).replace('{h}', h).replace('{m}', m)
+                .replace('{s}', s < 10 ? '0' + s : s);
+        });
+    }
+    tick();
+    setInterval(tick, 1000);
+})();
+</script>
+"""
+
+# Das iframe erbt kein CSS der Seite: Grundschrift wie in Streamlit
+_BASE_CSS = """
+body { margin: 0; font-family: "Source Sans Pro", sans-serif; color: #31333f; }
+h1, h2, h3, h4 { margin: 0.3rem 0; }
+p { margin: 0.3rem 0; }
+"""
+
+
+def countdown_span(target, fmt="{d}d {h}h {m}m", done="Recently Launched", unknown="TBD"):
+    """Platzhalter für einen im Browser tickenden Countdown bis target (Unix-Sekunden)
+
+    fmt kennt {d}, {h}, {m} und {s}; ohne Zielzeit wird unknown angezeigt.
+    """
+    if target is None:
+        return html.escape(unknown)
+    return (f'<span data-countdown="{int(target)}" data-format="{html.escape(fmt)}" '
+            f'data-done="{html.escape(done)}"></span>')
+
+
+def countdown_html(body, css=''):
+    """Vollständiges Dokument für das Countdown-iframe
+
+    Enthält nur die Zielzeiten, nicht die aktuelle Uhrzeit: solange sich der Starttermin (NET)
+    nicht ändert, bleibt das HTML identisch und der Browser behält das laufende iframe.
+    """
+    return f"<style>{_BASE_CSS}{css}</style>{body}{_TICKER_JS}"
+
+
+def render_countdown(body, css='', height=150):
+    """body (mit countdown_span-Platzhaltern) als selbst tickendes iframe ausgeben"""
+    components.html(countdown_html(body, css), height=height, scrolling=False)
@@ -0,0 +1,154 @@
+import threading
+import time
+
+from utils.config import HAMBURG_LAT, HAMBURG_LON
+from utils.instrumentation import get_logger
+from utils.iss_track import record_position
+from utils.snapshots import get_snapshot_store
+from utils.space_apis import (fetch_apod, fetch_astronauts, fetch_iss_passes, fetch_iss_position,
+                              fetch_launchpads, fetch_ll2_previous, fetch_ll2_upcoming, fetch_mars_manifest,
+                              fetch_neo_feed, fetch_past_launches, fetch_rockets, fetch_upcoming_launches)
+
+logger = get_logger('data_context')
+
+# Snapshot, über den ein externer Collector (src/collector.py) sich als aktiv meldet
+COLLECTOR_HEARTBEAT = 'collector'
+HEARTBEAT_MAX_AGE = 180
+
+
+def collector_alive(store=None, now=None):
+    """True, wenn ein externer Collector in den letzten HEARTBEAT_MAX_AGE Sekunden lebte"""
+    entry = (store or get_snapshot_store()).get(COLLECTOR_HEARTBEAT)
+    if entry is None:
+        return False
+    return (now or time.time()) - entry['fetched_at'] <= HEARTBEAT_MAX_AGE
+
+
+class DataSource:
+    """Eine Datenquelle: Abruffunktion und maximales Alter ihres Snapshots"""
+
+    def __init__(self, name, fetch, max_age, is_current=None):
+        self.name = name
+        self.fetch = fetch
+        self.max_age = max_age
+        # Optionale Zusatzprüfung auf den Nutzdaten (z.B. APOD vom aktuellen Tag)
+        self.is_current = is_current
+
+    def is_fresh(self, entry, now):
+        if entry is None or now - entry['fetched_at'] > self.max_age:
+            return False
+        return self.is_current is None or self.is_current(entry['data'])
+
+
+def _iss_position():
+    # Jede abgerufene Position ins Bahnlog, damit die ISS-Seite die echte Spur zeigen kann
+    return record_position(fetch_iss_position())
+
+
+def _neo_today():
+    return {'date': time.strftime('%Y-%m-%d'), 'objects': fetch_neo_feed()}
+
+
+# Quellen, die von mehreren Seiten gelesen werden (max_age in Sekunden)
+SOURCES = {
+    'iss_position': DataSource('iss_position', _iss_position, 10),
+    'astronauts': DataSource('astronauts', fetch_astronauts, 3600),
+    'iss_passes': DataSource('iss_passes', lambda: fetch_iss_passes(HAMBURG_LAT, HAMBURG_LON), 1800),
+    'launches_upcoming': DataSource('launches_upcoming', fetch_upcoming_launches, 1800),
+    'launches_past': DataSource('launches_past', fetch_past_launches, 3600),
+    # Stammdaten zu den Starts (Namen für Raketen-/Startplatz-IDs)
+    'rockets': DataSource('rockets', fetch_rockets, 86400),
+    'launchpads': DataSource('launchpads', fetch_launchpads, 86400),
+    # Launch Library 2: alle Anbieter (Rate-Limit ohne Key beachten)
+    'll2_upcoming': DataSource('ll2_upcoming', fetch_ll2_upcoming, 1800),
+    'll2_previous': DataSource('ll2_previous', fetch_ll2_previous, 3600),
+    # Kein Datumsvergleich: vor der Veröffentlichung liefert NASA noch das Vortagsbild, das würde
+    # sonst bei jedem Seitenaufruf neu geladen. Den Tageswechsel übernimmt der Prefetcher (prüft alle
+    # 10 Minuten, schreibt aber nur bei neuem Datum), max_age ist daher ein ganzer Tag: kürzer würde
+    # ein Seitenaufruf das unveränderte Bild synchron nachladen
+    'apod': DataSource('apod', fetch_apod, 86400),
+    # Missions-Manifeste (Fotos/Kameras pro Sol) für den Sol-Index der Mars-Fotos; neue Sols kommen täglich
+    'mars_manifest_perseverance': DataSource('mars_manifest_perseverance',
+                                             lambda: fetch_mars_manifest('perseverance'), 21600),
+    'mars_manifest_curiosity': DataSource('mars_manifest_curiosity', lambda: fetch_mars_manifest('curiosity'), 21600),
+    'neo_today': DataSource('neo_today', _neo_today, 3600,
+                            is_current=lambda neo: neo.get('date') == time.strftime('%Y-%m-%d')),
+}
+
+
+class DataContext:
+    """Prozessweiter Stand aller gemeinsamen Datenquellen
+
+    Jede Quelle hat genau einen aktuellen Snapshot ({'data', 'fetched_at', 'version'}) im
+    Snapshot-Store. Seiten lesen nur von hier; abgerufen wird erst, wenn der Snapshot
+    älter als max_age ist, und pro Quelle höchstens von einem Thread gleichzeitig.
+    Läuft ein externer Collector, hält er alle Quellen aktuell: dann wird nur noch gelesen
+    und nur bei fehlendem Snapshot selbst abgerufen.
+    """
+
+    def __init__(self, store=None, sources=SOURCES):
+        self.store = store or get_snapshot_store()
+        self.sources = sources
+        self._locks = {name: threading.Lock() for name in sources}
+
+    def get(self, name):
+        """Aktueller Snapshot einer Quelle (lädt bei Bedarf nach), None wenn nie erfolgreich geladen"""
+        source = self.sources[name]
+        entry = self.store.get(name)
+        if source.is_fresh(entry, time.time()):
+            return entry
+        if entry is not None and collector_alive(self.store):
+            return entry
+
+        with self._locks[name]:
+            # Ein anderer Thread hat inzwischen geladen
+            entry = self.store.get(name)
+            if source.is_fresh(entry, time.time()):
+                return entry
+            try:
+                return self.store.put(name, source.fetch())
+            except Exception:
+                logger.warning("Quelle %s nicht erreichbar", name, exc_info=True)
+                # Veralteter Snapshot ist besser als keiner
+                return entry
+
+    def is_fresh(self, name):
+        """True, wenn der Snapshot einer Quelle ohne Nachladen verwendet werden kann"""
+        return self.sources[name].is_fresh(self.store.get(name), time.time())
+
+    def data(self, name, default=None):
+        """Nur die Nutzdaten einer Quelle"""
+        entry = self.get(name)
+        return entry['data'] if entry else default
+
+    def refresh(self, name):
+        """Quelle unabhängig vom Alter neu laden (Hintergrund-Jobs), True bei Erfolg"""
+        with self._locks[name]:
+            try:
+                self.store.put(name, self.sources[name].fetch())
+                return True
+            except Exception:
+                logger.warning("Quelle %s nicht erreichbar", name, exc_info=True)
+                return False
+
+    def invalidate(self, name):
+        """Snapshot einer Quelle verwerfen, der nächste get() ruft neu ab (z.B. im Benchmark)"""
+        self.store.delete(name)
+
+    def version(self, name):
+        """Versionsnummer des aktuellen Snapshots ohne Nachladen (0 ohne Daten)"""
+        entry = self.store.get(name)
+        return entry['version'] if entry else 0
+
+
+_data_context = None
+_data_context_lock = threading.Lock()
+
+
+def get_data_context():
+    """Prozessweiter Daten-Kontext für alle Seiten"""
+    global _data_context
+    with _data_context_lock:
+        if _data_context is None:
+            _data_context = DataContext()
+        return _data_context
@@ -0,0 +1,74 @@
+import inspect
+from functools import wraps
+
+import streamlit as st
+from streamlit_folium import st_folium
+
+from utils.instrumentation import current_page, set_page
+
+# st.fragment gibt es erst ab Streamlit 1.37 (1.33-1.36: experimental_fragment); requirements.txt pinnt
+# eine Version mit Fragmenten, der Fallback ist nur ein Sicherheitsnetz für ältere Installationen
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+FRAGMENTS_AVAILABLE = _fragment is not None
+
+# st_folium kann Ebenen ab streamlit-folium 0.15 nachreichen, ohne die Karte neu zu bauen
+LIVE_MAP_AVAILABLE = 'feature_group_to_add' in inspect.signature(st_folium).parameters
+
+
+def fragment(run_every=None):
+    """Decorator: Funktion als eigenständig neu laufendes Fragment (optional alle run_every Sekunden)
+
+    Ohne Fragment-Unterstützung läuft die Funktion ganz normal im Skript mit; ein Intervall
+    gibt es dann nicht, aktualisiert wird nur bei der nächsten kompletten Ausführung.
+    """
+    def decorator(func):
+        if not FRAGMENTS_AVAILABLE:
+            return func
+        # Fragment-Läufe starten in einem eigenen Thread ohne das set_page() der Seite:
+        # die Seite beim Dekorieren merken, damit ihre Spans nicht unter 'background' landen
+        page = current_page()
+
+        @wraps(func)
+        def run(*args, **kwargs):
+            set_page(page)
+            return func(*args, **kwargs)
+        return _fragment(run, run_every=run_every)
+    return decorator
+
+
+def live_folium(base_map, layer, key, center=None, width=700, height=400):
+    """Karte einmal ausliefern, danach nur noch die Ebene layer (FeatureGroup) aktualisieren
+
+    base_map muss über die Läufe hinweg dasselbe Objekt bleiben (z.B. in st.session_state),
+    sonst erkennt st_folium die Karte als neu und sendet sie komplett.
+    """
+    return st_folium(
+        base_map,
+        key=key,
+        feature_group_to_add=layer,
+        center=center,
+        width=width,
+        height=height,
+        returned_objects=[]
+    )
+
+
+def auto_refresh_toggle(label="🔄 Auto-Refresh", key=None):
+    """Sidebar-Schalter für die Auto-Aktualisierung einer Seite
+
+    Gibt every(seconds) zurück: das run_every für ein Fragment, solange der Schalter an ist
+    (sonst None). So aktualisiert sich jeder Bereich in seinem eigenen Takt, statt dass
+    die ganze Seite per sleep + rerun neu läuft.
+    """
+    enabled = st.sidebar.checkbox(
+        label,
+        value=False,
+        key=key,
+        disabled=not FRAGMENTS_AVAILABLE,
+        help="Jeder Bereich aktualisiert sich in seinem eigenen Takt" if FRAGMENTS_AVAILABLE
+        else "Benötigt Streamlit >= 1.37"
+    )
+
+    def every(seconds):
+        return seconds if enabled else None
+    return every
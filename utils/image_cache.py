@@ -0,0 +1,182 @@
+import hashlib
+import io
+import os
+import threading
+
+import requests
+from PIL import Image, ImageOps
+
+from utils.config import DATA_DIR
+from utils.instrumentation import FETCH, get_logger, span
+
+IMAGE_CACHE_DIR = os.path.join(DATA_DIR, 'images')
+
+# Varianten: Grid-Thumbnail (feste Kachelgröße) und Anzeige-Version (max. Kantenlänge)
+THUMBNAIL_SIZE = (400, 300)
+DISPLAY_MAX_EDGE = 1280
+
+logger = get_logger('image_cache')
+
+
+class ImageCache:
+    """Lokaler Bild-Proxy: lädt jedes Bild einmal, speichert WebP-Varianten mit LRU-Eviction"""
+
+    def __init__(self, cache_dir=IMAGE_CACHE_DIR, max_bytes=None, quality=80, timeout=20,
+                 max_download_bytes=50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        if max_bytes is None:
+            max_bytes = int(os.getenv("IMAGE_CACHE_MAX_MB", "200")) * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.quality = quality
+        self.timeout = timeout
+        self.max_download_bytes = max_download_bytes
+
+        self._lock = threading.Lock()
+        self._url_locks = {}
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get_thumbnail(self, url):
+        """WebP-Thumbnail für Foto-Grids (bytes oder None)"""
+        return self._get(url, 'thumb')
+
+    def get_display(self, url):
+        """WebP-Anzeigeversion mit begrenzter Kantenlänge (bytes oder None)"""
+        return self._get(url, 'display')
+
+    def warm(self, url):
+        """Lädt ein Bild vorab in den Cache (z.B. durch den Prefetcher)"""
+        return self._get(url, 'display') is not None
+
+    def _key(self, url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _path(self, url, variant):
+        return os.path.join(self.cache_dir, f"{self._key(url)}_{variant}.webp")
+
+    def _url_lock(self, url):
+        with self._lock:
+            return self._url_locks.setdefault(self._key(url), threading.Lock())
+
+    def _get(self, url, variant):
+        if not url:
+            return None
+
+        path = self._path(url, variant)
+        data = self._read(path)
+        if data is not None:
+            return data
+
+        # Pro URL nur ein Download, auch bei parallelen Sessions
+        with self._url_lock(url):
+            data = self._read(path)
+            if data is None:
+                try:
+                    with span('image_download', FETCH):
+                        self._build_variants(url)
+                except Exception:
+                    logger.warning("Bild konnte nicht geladen werden: %s", url, exc_info=True)
+                    return None
+                data = self._read(path)
+
+        self._evict()
+        return data
+
+    def _read(self, path):
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        # mtime dient als LRU-Zeitstempel (atime ist oft deaktiviert)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return data
+
+    def _download(self, url):
+        response = requests.get(url, timeout=self.timeout, stream=True)
+        response.raise_for_status()
+
+        buffer = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buffer.write(chunk)
+            if buffer.tell() > self.max_download_bytes:
+                raise ValueError(f"Image too large: {url}")
+        buffer.seek(0)
+        return buffer
+
+    def _build_variants(self, url):
+        """Erzeugt Thumbnail und Anzeige-Version aus einem einzigen Download"""
+        image = Image.open(self._download(url))
+
+        # JPEG-Decoder direkt in reduzierter Auflösung dekodieren lassen
+        image.draft('RGB', (DISPLAY_MAX_EDGE, DISPLAY_MAX_EDGE))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGB')
+
+        display = image.copy()
+        display.thumbnail((DISPLAY_MAX_EDGE, DISPLAY_MAX_EDGE), Image.LANCZOS)
+        self._write(self._path(url, 'display'), display)
+
+        thumb = ImageOps.fit(display, THUMBNAIL_SIZE, Image.LANCZOS)
+        self._write(self._path(url, 'thumb'), thumb)
+
+    def _write(self, path, image):
+        buffer = io.BytesIO()
+        image.save(buffer, format='WEBP', quality=self.quality, method=4)
+
+        # Atomar schreiben, damit parallele Leser nie halbe Dateien sehen
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(buffer.getvalue())
+        os.replace(tmp_path, path)
+
+    def _evict(self):
+        """Entfernt am längsten ungenutzte Dateien, bis das Größenlimit eingehalten ist"""
+        try:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith('.webp'):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+_image_cache = None
+_image_cache_lock = threading.Lock()
+
+
+def get_image_cache():
+    """Prozessweiter Bild-Cache (wird von allen Seiten geteilt)"""
+    global _image_cache
+    with _image_cache_lock:
+        if _image_cache is None:
+            _image_cache = ImageCache()
+        return _image_cache
+
+
+def cached_image(url, variant='display'):
+    """Liefert Bild-Bytes für st.image, bei Fehlern die Original-URL als Fallback"""
+    cache = get_image_cache()
+    data = cache.get_thumbnail(url) if variant == 'thumb' else cache.get_display(url)
+    return data if data is not None else url
@@ -0,0 +1,192 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+import numpy as np
+
+from utils.config import LOG_DIR
+
+# JSON-Zeilen-Log in logs/ (absoluter Pfad in LOG_FILE wird direkt verwendet)
+LOG_FILE = os.getenv("LOG_FILE", "cosmic_analytics.log")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_PATH = LOG_FILE if os.path.isabs(LOG_FILE) else os.path.join(LOG_DIR, LOG_FILE)
+
+# Messwerte pro (Seite, Komponente, Art) für die Perzentile im Performance-Panel
+SPAN_HISTORY = 500
+
+# Arten von Spans
+FETCH = 'fetch'
+PARSE = 'parse'
+FIGURE = 'figure'
+MAP = 'map'
+RENDER = 'render'
+
+
+class JsonFormatter(logging.Formatter):
+    """Eine JSON-Zeile pro Log-Eintrag; Spans ergänzen page, component, kind, ms und ok"""
+
+    def format(self, record):
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        entry.update(getattr(record, 'span', {}))
+        if record.exc_info:
+            entry['error'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+_logging_configured = False
+_logging_lock = threading.Lock()
+
+
+def get_logger(name):
+    """Logger unterhalb von 'cosmic', schreibt beim ersten Aufruf in die JSON-Log-Datei"""
+    global _logging_configured
+    with _logging_lock:
+        if not _logging_configured:
+            root = logging.getLogger('cosmic')
+            root.setLevel(LOG_LEVEL.upper())
+            root.propagate = False
+            try:
+                os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+                handler = logging.FileHandler(LOG_PATH, encoding='utf-8')
+            except OSError:
+                # Schreibgeschütztes Deployment: Log auf stderr
+                handler = logging.StreamHandler()
+            handler.setFormatter(JsonFormatter())
+            root.addHandler(handler)
+            _logging_configured = True
+    return logging.getLogger(f"cosmic.{name}")
+
+
+_span_logger = get_logger('span')
+_context = threading.local()
+
+
+def set_page(page):
+    """Seite, der alle folgenden Spans dieses Threads (= Streamlit-Session-Lauf) zugeordnet werden"""
+    _context.page = page
+
+
+def current_page():
+    return getattr(_context, 'page', 'background')
+
+
+class SpanStats:
+    """Letzte Laufzeiten (ms) pro (Seite, Komponente, Art) im Speicher, prozessweit"""
+
+    def __init__(self, history=SPAN_HISTORY):
+        self.history = history
+        self._lock = threading.Lock()
+        self._durations = {}
+        self._errors = {}
+
+    def record(self, page, component, kind, duration_ms, ok=True):
+        key = (page, component, kind)
+        with self._lock:
+            if key not in self._durations:
+                self._durations[key] = deque(maxlen=self.history)
+                self._errors[key] = 0
+            self._durations[key].append(duration_ms)
+            if not ok:
+                self._errors[key] += 1
+
+    def summary(self):
+        """Liste mit page, component, kind, count, errors, p50, p95, max (ms)"""
+        with self._lock:
+            items = [(key, np.array(values), self._errors[key]) for key, values in self._durations.items()]
+        return [_summarize(key, values, errors) for key, values, errors in sorted(items)]
+
+    def reset(self):
+        with self._lock:
+            self._durations.clear()
+            self._errors.clear()
+
+
+def _summarize(key, values, errors):
+    page, component, kind = key
+    p50, p95 = np.percentile(values, [50, 95])
+    return {
+        'page': page,
+        'component': component,
+        'kind': kind,
+        'count': len(values),
+        'errors': errors,
+        'p50': float(p50),
+        'p95': float(p95),
+        'max': float(values.max()),
+    }
+
+
+_span_stats = SpanStats()
+
+
+def get_span_stats():
+    """Prozessweite Span-Statistik"""
+    return _span_stats
+
+
+@contextmanager
+def span(component, kind, **fields):
+    """Misst den Block, zählt ihn in die Statistik und schreibt eine JSON-Zeile ins Log
+
+    Fehler werden mitgezählt und unverändert weitergereicht.
+    """
+    page = current_page()
+    start = time.perf_counter()
+    ok = True
+    try:
+        yield
+    except Exception:
+        ok = False
+        raise
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000.0
+        _span_stats.record(page, component, kind, duration_ms, ok)
+        if _span_logger.isEnabledFor(logging.INFO):
+            _span_logger.info('span', extra={'span': dict(
+                fields, page=page, component=component, kind=kind, ms=round(duration_ms, 3), ok=ok
+            )})
+
+
+def timed(component, kind):
+    """Decorator-Variante von span()"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(component, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def read_span_log(path=LOG_PATH, max_lines=20000):
+    """Spans aller Prozesse (App, Collector) aus dem Ende der Log-Datei zusammengefasst"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = deque(f, maxlen=max_lines)
+    except OSError:
+        return []
+
+    durations = {}
+    errors = {}
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if entry.get('msg') != 'span':
+            continue
+        key = (entry['page'], entry['component'], entry['kind'])
+        durations.setdefault(key, []).append(entry['ms'])
+        errors[key] = errors.get(key, 0) + (0 if entry.get('ok', True) else 1)
+
+    return [_summarize(key, np.array(durations[key]), errors[key]) for key in sorted(durations)]
@@ -0,0 +1,78 @@
+import os
+import threading
+
+import numpy as np
+
+from utils.archive import RecordArchive, record_dtype
+from utils.astro import EARTH_RADIUS_KM
+from utils.config import DATA_DIR
+
+TRACK_DIR = os.path.join(DATA_DIR, 'iss_track')
+TRACK_FILE = os.path.join(TRACK_DIR, 'positions.bin')
+
+# Ein Datensatz = 20 Bytes (ts, lat, lon, alt); Datei ist nach ts sortiert (= Zeitindex)
+RECORD_DTYPE = record_dtype(('lat', 'lon', 'alt'))
+
+# open-notify liefert keine Höhe: Nennwert für die Geschwindigkeitsberechnung
+NOMINAL_ALTITUDE_KM = 420.0
+# Erddrehung in Grad/s (siderisch), um Längen in ein nicht mitrotierendes System umzurechnen
+EARTH_ROTATION_DEG_S = 360.0 / 86164.0905
+# Beobachtungspaare mit größerem Abstand (Lücken, Neustarts) nicht für die Geschwindigkeit verwenden
+MAX_PAIR_GAP = 300
+
+
+def record_position(position, log=None):
+    """Position aus fetch_iss_position() ins Log schreiben"""
+    log = log or get_position_log()
+    log.append([(position['timestamp'], position['latitude'], position['longitude'],
+                 position.get('altitude', np.nan))])
+    return position
+
+
+def split_track(records):
+    """[(lat, lon), ...]-Segmente für die Karte, getrennt an der Datumsgrenze"""
+    if not len(records):
+        return []
+    points = np.column_stack([records['lat'], records['lon']]).astype(np.float64)
+    breaks = np.flatnonzero(np.abs(np.diff(points[:, 1])) > 180) + 1
+    return [segment.tolist() for segment in np.split(points, breaks) if len(segment) > 1]
+
+
+def observed_speed(records, max_gap=MAX_PAIR_GAP):
+    """Bahngeschwindigkeit in km/s aus aufeinanderfolgenden Beobachtungen, None bei zu wenig Daten
+
+    Die Längen werden um die Erddrehung korrigiert (inertiales System), der Winkelabstand
+    per Haversine bestimmt und auf den Bahnradius hochgerechnet; Median aller Paare.
+    """
+    if len(records) < 2:
+        return None
+    ts = np.asarray(records['ts'], dtype=np.float64)
+    lat = np.radians(np.asarray(records['lat'], dtype=np.float64))
+    lon = np.radians(np.asarray(records['lon'], dtype=np.float64) + EARTH_ROTATION_DEG_S * (ts - ts[0]))
+    alt = np.asarray(records['alt'], dtype=np.float64)
+    alt = np.where(np.isnan(alt), NOMINAL_ALTITUDE_KM, alt)
+
+    dt = np.diff(ts)
+    valid = (dt > 0) & (dt <= max_gap)
+    if not valid.any():
+        return None
+
+    dlat = np.diff(lat)
+    dlon = np.diff(lon)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
+    angle = 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+    radius = EARTH_RADIUS_KM + (alt[:-1] + alt[1:]) / 2
+    return float(np.median(angle[valid] * radius[valid] / dt[valid]))
+
+
+_position_log = None
+_position_log_lock = threading.Lock()
+
+
+def get_position_log():
+    """Prozessweites ISS-Positionslog (RecordArchive, gelesen per memmap)"""
+    global _position_log
+    with _position_log_lock:
+        if _position_log is None:
+            _position_log = RecordArchive(TRACK_FILE, RECORD_DTYPE)
+        return _position_log
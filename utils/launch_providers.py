@@ -0,0 +1,286 @@
+import bisect
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.astro import EARTH_RADIUS_KM
+from utils.instrumentation import get_logger
+from utils.launches import Field, Launch, get_decoded_cache
+
+logger = get_logger('launch_providers')
+
+# Gleicher Start bei zwei Anbietern: NET höchstens so weit auseinander ...
+MATCH_WINDOW = 3 * 3600
+# ... und Startplätze (falls Koordinaten bekannt) näher als das (SLC-40/SLC-41 liegen ~2 km auseinander)
+PAD_MATCH_KM = 1.0
+
+
+class LaunchProvider:
+    """Schnittstelle für Start-Quellen
+
+    sources sind die Daten-Kontext-Quellen des Providers (werden gemeinsam abgerufen und
+    bestimmen den Cache-Schlüssel des Index); launches(cache) liefert daraus Launch-Datensätze.
+    """
+
+    name = 'base'
+    label = 'Base'
+    sources = ()
+
+    def launches(self, cache):
+        raise NotImplementedError
+
+
+class SpaceXProvider(LaunchProvider):
+    """SpaceX API v4 (Raketen- und Startplatznamen über die Stammdaten aufgelöst)"""
+
+    name = 'spacex'
+    label = 'SpaceX API'
+    sources = ('launches_upcoming', 'launches_past', 'rockets', 'launchpads')
+
+    def launches(self, cache):
+        records = []
+        for source in ('launches_upcoming', 'launches_past'):
+            # Kopien: die dekodierten Datensätze werden auch direkt von anderen Seiten gelesen
+            records.extend(launch.copy(agency='SpaceX', providers=(self.label,))
+                           for launch in cache.launches(source) or ())
+        return records
+
+
+def _mission_name(name):
+    # LL2: "Falcon 9 Block 5 | Starlink Group 11-21" -> "Starlink Group 11-21"
+    return name.split(' | ')[-1]
+
+
+LL2_SUCCESS = {'Success': True, 'Failure': False, 'Partial Failure': False}
+LL2_PENDING = {'Go', 'TBD', 'TBC', 'Hold', 'In Flight'}
+
+# Launch Library 2 (/launch/upcoming, /launch/previous, mode=normal) -> Launch
+LL2_SCHEMA = Launch.compile({
+    'id': Field('id', str, required=True),
+    'name': Field('name', str, 'Mission', parse=_mission_name),
+    'date_utc': Field('net', str),
+    'success': Field('status.abbrev', str, parse=LL2_SUCCESS.get),
+    'upcoming': Field('status.abbrev', str, False, parse=lambda abbrev: abbrev in LL2_PENDING),
+    'tbd': Field('status.abbrev', str, False, parse=lambda abbrev: abbrev in ('TBD', 'TBC')),
+    'details': Field('mission.description', str),
+    'vehicle': Field('rocket.configuration.name', str),
+    'pad': Field('pad.name', str),
+    # LL2 liefert Koordinaten als Strings
+    'pad_lat': Field('pad.latitude', (str, int, float), parse=float),
+    'pad_lon': Field('pad.longitude', (str, int, float), parse=float),
+    'agency': Field('launch_service_provider.name', str),
+})
+
+
+class LaunchLibraryProvider(LaunchProvider):
+    """Launch Library 2 (The Space Devs): Starts aller Anbieter weltweit"""
+
+    name = 'll2'
+    label = 'Launch Library 2'
+    sources = ('ll2_upcoming', 'll2_previous')
+
+    def launches(self, cache):
+        records = []
+        for source in self.sources:
+            decoded = cache.get(source, (source,), lambda data: Launch.decode_many(data, LL2_SCHEMA)) or ()
+            records.extend(launch.copy(providers=(self.label,)) for launch in decoded)
+        return records
+
+
+# Reihenfolge = Priorität beim Zusammenführen: LL2 wird laufend gepflegt (aktuellere NETs),
+# die SpaceX API ergänzt fehlende Felder (Raketen-/Startplatz-IDs, Flugnummer)
+PROVIDERS = (LaunchLibraryProvider(), SpaceXProvider())
+
+
+def _name_key(name):
+    return re.sub(r'[^a-z0-9]', '', name.lower()) if name else None
+
+
+def _pad_designators(name):
+    # "KSC LC 39A" / "Launch Complex 39A" -> {'39a'}
+    return set(re.findall(r'\d+[a-z]?', name.lower())) if name else set()
+
+
+def _distance_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def same_pad(a, b):
+    """Gleicher Startplatz: Koordinaten wenn möglich, sonst Bezeichner (39A, 40, 4E); None wenn unbekannt"""
+    if None not in (a.pad_lat, a.pad_lon, b.pad_lat, b.pad_lon):
+        return _distance_km(a.pad_lat, a.pad_lon, b.pad_lat, b.pad_lon) <= PAD_MATCH_KM
+    pads_a, pads_b = _pad_designators(a.pad), _pad_designators(b.pad)
+    if pads_a and pads_b:
+        return bool(pads_a & pads_b)
+    return None
+
+
+def same_vehicle(a, b):
+    """Gleiche Rakete ("Falcon 9" passt zu "Falcon 9 Block 5"); None wenn unbekannt"""
+    key_a, key_b = _name_key(a.vehicle), _name_key(b.vehicle)
+    if not key_a or not key_b:
+        return None
+    return key_a.startswith(key_b) or key_b.startswith(key_a)
+
+
+def same_agency(a, b):
+    """Gleicher Startdienstleister; None wenn unbekannt"""
+    key_a, key_b = _name_key(a.agency), _name_key(b.agency)
+    if not key_a or not key_b:
+        return None
+    return key_a == key_b
+
+
+def same_launch(a, b, window=MATCH_WINDOW):
+    """Derselbe Start aus zwei Quellen: NET innerhalb von window, kein Widerspruch bei Anbieter,
+    Rakete und Startplatz und mindestens eine positive Übereinstimmung davon
+
+    Datensätze desselben Providers werden nie zusammengeführt (das sind verschiedene Starts).
+    """
+    if set(a.providers or ()) & set(b.providers or ()):
+        return False
+    if abs(a.timestamp - b.timestamp) > window:
+        return False
+    checks = (same_agency(a, b), same_vehicle(a, b), same_pad(a, b))
+    return False not in checks and True in checks
+
+
+def _merge(primary, secondary):
+    """primary behalten, leere Felder aus secondary ergänzen, Quellen zusammenführen"""
+    merged = primary.copy(providers=primary.providers + tuple(
+        provider for provider in secondary.providers if provider not in primary.providers))
+    for name in Launch.__slots__:
+        if getattr(merged, name) is None:
+            setattr(merged, name, getattr(secondary, name))
+    return merged
+
+
+def merge_launches(groups, window=MATCH_WINDOW):
+    """Launch-Listen mehrerer Provider (in Prioritätsreihenfolge) zu einer sortierten, doppelfreien Liste
+
+    Zeitlich sortierter Durchlauf: jeder Datensatz wird nur mit den bereits übernommenen
+    Starts der letzten window Sekunden verglichen. Starts ohne Zeit fallen weg.
+    """
+    ranked = sorted(
+        ((launch.timestamp, rank, launch)
+         for rank, launches in enumerate(groups) for launch in launches if launch.timestamp is not None),
+        key=lambda item: (item[0], item[1]))
+
+    merged = []
+    ranks = []
+    times = []
+    for timestamp, rank, launch in ranked:
+        match = None
+        for i in range(len(merged) - 1, -1, -1):
+            if timestamp - times[i] > window:
+                break
+            if same_launch(merged[i], launch, window):
+                match = i
+                break
+        if match is not None:
+            previous, previous_rank = merged.pop(match), ranks.pop(match)
+            del times[match]
+            if rank < previous_rank:
+                launch = _merge(launch, previous)
+            else:
+                launch, rank = _merge(previous, launch), previous_rank
+        # Die Zeit des bevorzugten Providers kann den Start verschieben: sortiert einfügen,
+        # damit die Rückwärtssuche oben abbrechen darf
+        i = bisect.bisect_right(times, launch.timestamp)
+        merged.insert(i, launch)
+        ranks.insert(i, rank)
+        times.insert(i, launch.timestamp)
+
+    return merged
+
+
+class LaunchIndex:
+    """Zusammengeführte Starts aller Provider, nach Startzeit sortiert (Binärsuche auf der Zeit)"""
+
+    def __init__(self, launches):
+        self.launches = tuple(launches)
+        self._times = [launch.timestamp for launch in self.launches]
+
+    def __len__(self):
+        return len(self.launches)
+
+    def upcoming(self, now=None, limit=None):
+        """Starts nach now, nächster zuerst"""
+        start = bisect.bisect_right(self._times, time.time() if now is None else now)
+        end = len(self.launches) if limit is None else start + limit
+        return list(self.launches[start:end])
+
+    def recent(self, now=None, limit=None):
+        """Starts bis now, neuester zuerst"""
+        end = bisect.bisect_right(self._times, time.time() if now is None else now)
+        start = 0 if limit is None else max(0, end - limit)
+        return list(reversed(self.launches[start:end]))
+
+    def providers(self):
+        """Anzahl Starts pro Quelle"""
+        counts = {}
+        for launch in self.launches:
+            for provider in launch.providers or ():
+                counts[provider] = counts.get(provider, 0) + 1
+        return counts
+
+
+class LaunchAggregator:
+    """Starts aller Provider: parallel abrufen, zusammenführen, einmal pro Datenstand indexieren"""
+
+    def __init__(self, providers=PROVIDERS, cache=None):
+        self.providers = tuple(providers)
+        self.cache = cache or get_decoded_cache()
+        self.sources = tuple(source for provider in self.providers for source in provider.sources)
+
+    def _fetch_provider(self, provider):
+        for source in provider.sources:
+            self.cache.context.get(source)
+
+    def fetch(self):
+        """Veraltete Quellen nachladen, ein Thread pro Provider (langsame APIs blockieren sich nicht gegenseitig)"""
+        context = self.cache.context
+        stale = [provider for provider in self.providers
+                 if not all(context.is_fresh(source) for source in provider.sources)]
+        if not stale:
+            return
+        with ThreadPoolExecutor(max_workers=len(stale), thread_name_prefix='launch-provider') as pool:
+            list(pool.map(self._fetch_provider, stale))
+
+    def _build(self, *_data):
+        groups = []
+        for provider in self.providers:
+            try:
+                groups.append(provider.launches(self.cache))
+            except Exception:
+                logger.warning("Provider %s fehlgeschlagen", provider.name, exc_info=True)
+                groups.append([])
+        if not any(groups):
+            return None
+        return LaunchIndex(merge_launches(groups))
+
+    def index(self):
+        """Aktueller LaunchIndex, None solange kein Provider Daten hat"""
+        self.fetch()
+        return self.cache.get('launch_index', self.sources, self._build, required=0)
+
+
+_launch_aggregator = None
+_launch_aggregator_lock = threading.Lock()
+
+
+def get_launch_aggregator():
+    """Prozessweiter Aggregator über alle Start-Provider"""
+    global _launch_aggregator
+    with _launch_aggregator_lock:
+        if _launch_aggregator is None:
+            _launch_aggregator = LaunchAggregator()
+        return _launch_aggregator
+
+
+def get_launch_index():
+    return get_launch_aggregator().index()
@@ -0,0 +1,277 @@
+import threading
+from datetime import datetime, timezone
+
+from utils.data_context import get_data_context
+from utils.instrumentation import get_logger
+
+logger = get_logger('launches')
+
+
+class Field:
+    """Schema-Eintrag: Quellpfad im JSON (Punkte für verschachtelte Objekte), Typ und Default
+
+    type darf auch ein Tupel erlaubter Typen sein; parse wandelt den geprüften Wert
+    anschließend um (z.B. Status-Text -> bool).
+    """
+
+    __slots__ = ('path', 'type', 'default', 'required', 'parse')
+
+    def __init__(self, path, type, default=None, required=False, parse=None):
+        self.path = tuple(path.split('.'))
+        self.type = type
+        self.default = default
+        self.required = required
+        self.parse = parse
+
+
+def _convert(value, type):
+    """Wert prüfen bzw. umwandeln; bool zählt nicht als Zahl, int wird zu float"""
+    if type is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if not isinstance(value, type) or (type is not bool and isinstance(value, bool)):
+        expected = '/'.join(t.__name__ for t in type) if isinstance(type, tuple) else type.__name__
+        raise ValueError(f"{expected} erwartet, {value!r} erhalten")
+    return value
+
+
+class Record:
+    """Basis für typisierte Datensätze mit __slots__, dekodiert über SCHEMA"""
+
+    SCHEMA = {}
+    __slots__ = ()
+
+    @classmethod
+    def compile(cls, schema):
+        """Schema vorbereiten: (Felder, übrige Slots), einmal pro Schema statt pro Datensatz
+
+        So lassen sich Datensätze auch aus fremden JSON-Formaten dekodieren (eigenes Schema,
+        gleiche Klasse); Slots ohne Feld im Schema werden mit None belegt.
+        """
+        unknown = set(schema) - set(cls.__slots__)
+        if unknown:
+            raise ValueError(f"{cls.__name__}: unbekannte Felder {sorted(unknown)}")
+        return tuple(schema.items()), tuple(name for name in cls.__slots__ if name not in schema)
+
+    @classmethod
+    def decode(cls, data, schema=None):
+        """Ein JSON-Objekt in einen Datensatz umwandeln (ValueError bei Schemaverletzung)"""
+        if not isinstance(data, dict):
+            raise ValueError(f"{cls.__name__}: Objekt erwartet")
+        fields, extra = schema or cls._schema
+        record = cls.__new__(cls)
+        for name, field in fields:
+            value = data
+            for key in field.path:
+                value = value.get(key) if isinstance(value, dict) else None
+            if value is None:
+                if field.required:
+                    raise ValueError(f"{cls.__name__}.{name}: Pflichtfeld fehlt")
+                value = field.default
+            else:
+                try:
+                    value = _convert(value, field.type)
+                    if field.parse is not None:
+                        value = field.parse(value)
+                except ValueError as e:
+                    raise ValueError(f"{cls.__name__}.{name}: {e}") from None
+            setattr(record, name, value)
+        for name in extra:
+            setattr(record, name, None)
+        record._finish()
+        return record
+
+    @classmethod
+    def decode_many(cls, items, schema=None):
+        """Liste dekodieren; ungültige Einträge werden übersprungen und geloggt"""
+        records = []
+        for item in items or ():
+            try:
+                records.append(cls.decode(item, schema))
+            except ValueError as e:
+                logger.warning("Datensatz übersprungen: %s", e)
+        return records
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._schema = cls.compile(cls.SCHEMA)
+
+    def _finish(self):
+        """Abgeleitete Felder nach dem Dekodieren setzen"""
+
+    def copy(self, **changes):
+        """Flache Kopie, optional mit geänderten Feldern (geteilte Datensätze nicht verändern)"""
+        record = type(self).__new__(type(self))
+        for name in self.__slots__:
+            setattr(record, name, changes[name] if name in changes else getattr(self, name))
+        return record
+
+    def __repr__(self):
+        return f"{type(self).__name__}({getattr(self, 'id', None)!r}, {getattr(self, 'name', None)!r})"
+
+
+def launch_timestamp(date_utc):
+    """ISO-Startzeit (z.B. '2025-05-31T08:58:00Z') als Unix-Sekunden, None wenn nicht lesbar"""
+    if not date_utc:
+        return None
+    try:
+        return datetime.fromisoformat(date_utc.replace('Z', '+00:00')).timestamp()
+    except (AttributeError, ValueError):
+        return None
+
+
+class Launch(Record):
+    """Ein Start (SpaceX v4 /launches)
+
+    vehicle, pad und pad_lat/pad_lon werden aufgelöst bzw. vom Provider gesetzt, ebenso
+    agency (Startdienstleister) und providers (Quellen, aus denen der Datensatz stammt).
+    """
+
+    SCHEMA = {
+        'id': Field('id', str, required=True),
+        'name': Field('name', str, 'Mission'),
+        'date_utc': Field('date_utc', str),
+        'timestamp': Field('date_unix', float),
+        'rocket': Field('rocket', str),
+        'launchpad': Field('launchpad', str),
+        'success': Field('success', bool),
+        'details': Field('details', str),
+        'upcoming': Field('upcoming', bool, False),
+        'tbd': Field('tbd', bool, False),
+        'flight_number': Field('flight_number', int),
+    }
+    __slots__ = tuple(SCHEMA) + ('vehicle', 'pad', 'pad_lat', 'pad_lon', 'agency', 'providers')
+
+    def _finish(self):
+        if self.timestamp is None:
+            self.timestamp = launch_timestamp(self.date_utc)
+
+    @property
+    def date(self):
+        """Startzeit als datetime (UTC) oder None"""
+        return datetime.fromtimestamp(self.timestamp, timezone.utc) if self.timestamp is not None else None
+
+    @property
+    def status(self):
+        if self.success is None:
+            return 'Upcoming' if self.upcoming else 'Pending'
+        return 'Success' if self.success else 'Failed'
+
+
+class Rocket(Record):
+    """Rakete (SpaceX v4 /rockets)"""
+
+    SCHEMA = {
+        'id': Field('id', str, required=True),
+        'name': Field('name', str, 'Unknown'),
+        'type': Field('type', str),
+        'active': Field('active', bool, False),
+        'stages': Field('stages', int),
+        'cost_per_launch': Field('cost_per_launch', int),
+        'success_rate_pct': Field('success_rate_pct', int),
+        'first_flight': Field('first_flight', str),
+        'country': Field('country', str),
+        'company': Field('company', str),
+        'height_m': Field('height.meters', float),
+        'mass_kg': Field('mass.kg', float),
+        'description': Field('description', str),
+    }
+    __slots__ = tuple(SCHEMA)
+
+
+class Launchpad(Record):
+    """Startplatz (SpaceX v4 /launchpads)"""
+
+    SCHEMA = {
+        'id': Field('id', str, required=True),
+        'name': Field('name', str, 'Unknown'),
+        'full_name': Field('full_name', str),
+        'locality': Field('locality', str),
+        'region': Field('region', str),
+        'latitude': Field('latitude', float),
+        'longitude': Field('longitude', float),
+        'launch_attempts': Field('launch_attempts', int, 0),
+        'launch_successes': Field('launch_successes', int, 0),
+        'status': Field('status', str),
+        'timezone': Field('timezone', str),
+    }
+    __slots__ = tuple(SCHEMA)
+
+
+def resolve_names(launches, rockets, launchpads):
+    """vehicle/pad der Starts aus den Raketen- und Startplatz-Indizes ({id: Datensatz}) setzen"""
+    for launch in launches:
+        rocket = rockets.get(launch.rocket)
+        pad = launchpads.get(launch.launchpad)
+        launch.vehicle = rocket.name if rocket else None
+        launch.pad = pad.name if pad else None
+        launch.pad_lat = pad.latitude if pad else None
+        launch.pad_lon = pad.longitude if pad else None
+    return launches
+
+
+class DecodedCache:
+    """Dekodierte Datensätze je Quelle, neu berechnet nur wenn sich ein Snapshot ändert
+
+    Schlüssel ist (version, fetched_at) aller beteiligten Snapshots; zwischen zwei Abrufen
+    lesen alle Seiten und Sessions dieselben (unveränderlich zu behandelnden) Datensätze.
+    """
+
+    def __init__(self, context=None):
+        self.context = context or get_data_context()
+        self._lock = threading.Lock()
+        self._cache = {}
+
+    def get(self, key_name, sources, build, required=1):
+        """build(*daten) für die Quellen sources, None solange eine der ersten required Quellen keine Daten hat"""
+        entries = [self.context.get(name) for name in sources]
+        if any(entry is None for entry in entries[:required]):
+            return None
+        key = tuple((entry['version'], entry['fetched_at']) if entry else None for entry in entries)
+
+        with self._lock:
+            cached = self._cache.get(key_name)
+            if cached and cached[0] == key:
+                return cached[1]
+
+        value = build(*[entry['data'] if entry else None for entry in entries])
+        with self._lock:
+            self._cache[key_name] = (key, value)
+        return value
+
+    def index(self, name, cls):
+        """{id: Datensatz} einer Stammdaten-Quelle (leer ohne Daten)"""
+        return self.get(name, (name,), lambda data: {record.id: record for record in cls.decode_many(data)}) or {}
+
+    def launches(self, name):
+        """Starts einer Quelle als Launch-Tupel, nach Startzeit sortiert, None ohne Daten"""
+        def build(data, _rockets, _launchpads):
+            launches = resolve_names(Launch.decode_many(data), self.index('rockets', Rocket),
+                                     self.index('launchpads', Launchpad))
+            return tuple(sorted(launches, key=lambda launch: (launch.timestamp is None, launch.timestamp or 0)))
+        return self.get(name, (name, 'rockets', 'launchpads'), build)
+
+
+_decoded_cache = None
+_decoded_cache_lock = threading.Lock()
+
+
+def get_decoded_cache():
+    """Prozessweiter Cache der dekodierten Start-, Raketen- und Startplatzdaten (auch Mars-Manifeste)"""
+    global _decoded_cache
+    with _decoded_cache_lock:
+        if _decoded_cache is None:
+            _decoded_cache = DecodedCache()
+        return _decoded_cache
+
+
+def get_launches(name):
+    """Kommende ('launches_upcoming') bzw. vergangene ('launches_past') Starts, None ohne Daten"""
+    return get_decoded_cache().launches(name)
+
+
+def get_rockets():
+    return get_decoded_cache().index('rockets', Rocket)
+
+
+def get_launchpads():
+    return get_decoded_cache().index('launchpads', Launchpad)
@@ -0,0 +1,207 @@
+from datetime import datetime, timezone
+
+import numpy as np
+
+from utils.astro import (
+    AU_KM, EARTH_RADIUS_KM, centuries, crossings, day_grid, ecliptic_to_equatorial, horizontal,
+    jd_to_datetime, local_midnights, local_zone, sun_position, wrap180, wrap360
+)
+from utils.config import HAMBURG_LAT, HAMBURG_LON
+
+SYNODIC_MONTH = 29.530588853
+# Meeus k=0: Neumond am 6. Januar 2000, 18:14 UTC
+REFERENCE_NEW_MOON_JD = 2451550.09766
+
+# Meeus Tab. 47.A (gekürzt): D, M, M', F, Σl [1e-6 Grad], Σr [1e-3 km]
+_LONGITUDE_DISTANCE_TERMS = np.array([
+    [0, 0, 1, 0, 6288774, -20905355],
+    [2, 0, -1, 0, 1274027, -3699111],
+    [2, 0, 0, 0, 658314, -2955968],
+    [0, 0, 2, 0, 213618, -569925],
+    [0, 1, 0, 0, -185116, 48888],
+    [0, 0, 0, 2, -114332, -3149],
+    [2, 0, -2, 0, 58793, 246158],
+    [2, -1, -1, 0, 57066, -152138],
+    [2, 0, 1, 0, 53322, -170733],
+    [2, -1, 0, 0, 45758, -204586],
+    [0, 1, -1, 0, -40923, -129620],
+    [1, 0, 0, 0, -34720, 108743],
+    [0, 1, 1, 0, -30383, 104755],
+    [2, 0, 0, -2, 15327, 10321],
+    [0, 0, 1, 2, -12528, 0],
+    [0, 0, 1, -2, 10980, 79661],
+    [4, 0, -1, 0, 10675, -34782],
+    [0, 0, 3, 0, 10034, -23210],
+    [4, 0, -2, 0, 8548, -21636],
+    [2, 1, -1, 0, -7888, 24208],
+    [2, 1, 0, 0, -6766, 30824],
+    [1, 0, -1, 0, -5163, -8379],
+    [1, 1, 0, 0, 4987, -16675],
+    [2, -1, 1, 0, 4036, -12831],
+    [2, 0, 2, 0, 3994, -10445],
+    [4, 0, 0, 0, 3861, -11650],
+    [2, 0, -3, 0, 3665, 14403],
+    [0, 1, -2, 0, -2689, -7003],
+    [2, 0, -1, 2, -2602, 0],
+    [2, -1, -2, 0, 2390, 10056],
+    [1, 0, 1, 0, -2348, 6322],
+    [2, -2, 0, 0, 2236, -9884],
+], dtype=float)
+
+# Meeus Tab. 47.B (gekürzt): D, M, M', F, Σb [1e-6 Grad]
+_LATITUDE_TERMS = np.array([
+    [0, 0, 0, 1, 5128122],
+    [0, 0, 1, 1, 280602],
+    [0, 0, 1, -1, 277693],
+    [2, 0, 0, -1, 173237],
+    [2, 0, -1, 1, 55413],
+    [2, 0, -1, -1, 46271],
+    [2, 0, 0, 1, 32573],
+    [0, 0, 2, 1, 17198],
+    [2, 0, 1, -1, 9266],
+    [0, 0, 2, -1, 8822],
+    [2, -1, 0, -1, 8216],
+    [2, 0, -2, -1, 4324],
+    [2, 0, 1, 1, 4200],
+    [2, 1, 0, -1, -3359],
+    [2, -1, -1, 1, 2463],
+    [2, -1, 0, 1, 2211],
+    [2, -1, -1, -1, 2065],
+    [0, 1, -1, -1, -1870],
+    [4, 0, -1, -1, 1828],
+    [0, 1, 0, 1, -1794],
+], dtype=float)
+
+# Phasenwinkel (Elongation in Länge) der vier Hauptphasen
+NEW_MOON, FIRST_QUARTER, FULL_MOON, LAST_QUARTER = 0.0, 90.0, 180.0, 270.0
+
+_PHASE_NAMES = [
+    "🌑 Neumond", "🌒 Zunehmende Sichel", "🌓 Erstes Viertel", "🌔 Zunehmender Mond",
+    "🌕 Vollmond", "🌖 Abnehmender Mond", "🌗 Letztes Viertel", "🌘 Abnehmende Sichel"
+]
+
+
+def moon_position(jd):
+    """Geozentrische ekliptikale Länge/Breite (Grad) und Entfernung (km) des Mondes"""
+    T = np.atleast_1d(centuries(jd))
+    Lp = 218.3164477 + 481267.88123421 * T - 0.0015786 * T ** 2 + T ** 3 / 538841 - T ** 4 / 65194000
+    D = 297.8501921 + 445267.1114034 * T - 0.0018819 * T ** 2 + T ** 3 / 545868 - T ** 4 / 113065000
+    M = 357.5291092 + 35999.0502909 * T - 0.0001536 * T ** 2 + T ** 3 / 24490000
+    Mp = 134.9633964 + 477198.8675055 * T + 0.0087414 * T ** 2 + T ** 3 / 69699 - T ** 4 / 14712000
+    F = 93.2720950 + 483202.0175233 * T - 0.0036539 * T ** 2 - T ** 3 / 3526000 + T ** 4 / 863310000
+    E = 1 - 0.002516 * T - 0.0000074 * T ** 2
+
+    # Argumente aller Terme auf einmal: (Zeitpunkte x Terme)
+    fundamentals = np.radians(np.stack([D, M, Mp, F], axis=-1))
+
+    lr = _LONGITUDE_DISTANCE_TERMS
+    args = fundamentals @ lr[:, :4].T
+    e_factor = E[:, None] ** np.abs(lr[:, 1])
+    sum_l = (lr[:, 4] * e_factor * np.sin(args)).sum(axis=-1)
+    sum_r = (lr[:, 5] * e_factor * np.cos(args)).sum(axis=-1)
+
+    b = _LATITUDE_TERMS
+    args_b = fundamentals @ b[:, :4].T
+    sum_b = (b[:, 4] * E[:, None] ** np.abs(b[:, 1]) * np.sin(args_b)).sum(axis=-1)
+
+    # Zusatzterme (Venus, Jupiter, Abplattung der Erde)
+    A1 = np.radians(119.75 + 131.849 * T)
+    A2 = np.radians(53.09 + 479264.290 * T)
+    A3 = np.radians(313.45 + 481266.484 * T)
+    Lp_rad, Mp_rad, F_rad = np.radians(Lp), np.radians(Mp), np.radians(F)
+    sum_l += 3958 * np.sin(A1) + 1962 * np.sin(Lp_rad - F_rad) + 318 * np.sin(A2)
+    sum_b += (-2235 * np.sin(Lp_rad) + 382 * np.sin(A3) + 175 * np.sin(A1 - F_rad)
+              + 175 * np.sin(A1 + F_rad) + 127 * np.sin(Lp_rad - Mp_rad) - 115 * np.sin(Lp_rad + Mp_rad))
+
+    longitude = wrap360(Lp + sum_l / 1e6)
+    latitude = sum_b / 1e6
+    distance = 385000.56 + sum_r / 1000.0
+    return longitude, latitude, distance
+
+
+def moon_elongation(jd):
+    """Phasenwinkel im Zyklus: 0° Neumond, 90° erstes Viertel, 180° Vollmond, 270° letztes Viertel"""
+    moon_lon, _, _ = moon_position(jd)
+    sun_lon, _ = sun_position(np.atleast_1d(jd))
+    return wrap360(moon_lon - sun_lon)
+
+
+def moon_illumination(jd):
+    """Beleuchteter Anteil der Mondscheibe (0-1), Meeus Kap. 48"""
+    moon_lon, moon_lat, moon_dist = moon_position(jd)
+    sun_lon, sun_dist = sun_position(np.atleast_1d(jd))
+
+    psi = np.arccos(np.cos(np.radians(moon_lat)) * np.cos(np.radians(moon_lon - sun_lon)))
+    sun_km = sun_dist * AU_KM
+    phase_angle = np.arctan2(sun_km * np.sin(psi), moon_dist - sun_km * np.cos(psi))
+    return (1 + np.cos(phase_angle)) / 2
+
+
+def phase_name(elongation):
+    """Name der Mondphase (8 Abschnitte à 45°, zentriert auf die Hauptphasen)"""
+    return _PHASE_NAMES[int(((float(elongation) + 22.5) % 360) // 45)]
+
+
+def phase_times(start_jd, end_jd, phase=NEW_MOON):
+    """Exakte Zeitpunkte (JD) einer Hauptphase im Intervall, vektorisiert über alle Lunationen"""
+    k_start = np.floor((start_jd - REFERENCE_NEW_MOON_JD) / SYNODIC_MONTH) - 1
+    k_end = np.ceil((end_jd - REFERENCE_NEW_MOON_JD) / SYNODIC_MONTH) + 1
+    k = np.arange(k_start, k_end + 1)
+
+    jd = REFERENCE_NEW_MOON_JD + (k + phase / 360.0) * SYNODIC_MONTH
+    # Newton-Iteration mit mittlerer Winkelgeschwindigkeit (~12,19°/Tag)
+    rate = 360.0 / SYNODIC_MONTH
+    for _ in range(6):
+        jd = jd - wrap180(moon_elongation(jd) - phase) / rate
+
+    return jd[(jd >= start_jd) & (jd < end_jd)]
+
+
+def next_phase(jd, phase):
+    """Nächster Zeitpunkt (JD) einer Hauptphase nach jd"""
+    return float(phase_times(jd, jd + SYNODIC_MONTH + 1, phase)[0])
+
+
+def moon_altitude(jd, lat=HAMBURG_LAT, lon=HAMBURG_LON):
+    """Geozentrische Höhe des Mondes und Horizonthöhe h0 für Auf-/Untergang (Grad)"""
+    moon_lon, moon_lat, moon_dist = moon_position(np.ravel(jd))
+    ra, dec = ecliptic_to_equatorial(moon_lon, moon_lat, np.ravel(jd))
+    altitude, _ = horizontal(ra, dec, np.ravel(jd), lat, lon)
+
+    # h0 = 0,7275 * Parallaxe - 34' (Meeus Kap. 15)
+    parallax = np.degrees(np.arcsin(EARTH_RADIUS_KM / moon_dist))
+    h0 = 0.7275 * parallax - 0.5667
+    shape = np.shape(jd)
+    return altitude.reshape(shape), h0.reshape(shape)
+
+
+def moon_rise_set(start_date, days=1, lat=HAMBURG_LAT, lon=HAMBURG_LON, step_minutes=10):
+    """Mondauf- und -untergang (JD, NaN wenn keiner) pro lokalem Kalendertag"""
+    grid = day_grid(local_midnights(start_date, days), step_minutes)
+    altitude, h0 = moon_altitude(grid, lat, lon)
+    return crossings(grid, altitude - h0)
+
+
+def lunar_calendar(start_date, days, lat=HAMBURG_LAT, lon=HAMBURG_LON):
+    """Tageswerte (lokale Mitternacht) für Beleuchtung, Phasenwinkel und Mondauf-/untergang"""
+    midnights = local_midnights(start_date, days)
+    rise, set_ = moon_rise_set(start_date, days, lat, lon)
+    return {
+        'jd': midnights,
+        'illumination': moon_illumination(midnights),
+        'elongation': moon_elongation(midnights),
+        'moonrise': rise,
+        'moonset': set_
+    }
+
+
+def to_local_datetime(jd):
+    """JD -> lokale (Europe/Berlin) datetime, None für NaN"""
+    if jd is None or np.isnan(jd):
+        return None
+    return jd_to_datetime(jd).astimezone(local_zone())
+
+
+def today_local():
+    """Heutiges Datum am Beobachterstandort"""
+    return datetime.now(timezone.utc).astimezone(local_zone()).date()
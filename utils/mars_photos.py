@@ -0,0 +1,198 @@
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from utils.instrumentation import get_logger
+from utils.launches import get_decoded_cache
+from utils.space_apis import fetch_latest_mars_photos, fetch_mars_photos
+
+logger = get_logger('mars_photos')
+
+# Reihenfolge = Priorität für "neueste Fotos"
+PHOTO_ROVERS = ('perseverance', 'curiosity')
+NAVCAM = 'NAVCAM'
+# Fotolisten einzelner Sols im Speicher (ein Perseverance-Sol hat oft mehrere hundert Fotos)
+SOL_PHOTO_CACHE_SIZE = 32
+
+
+def manifest_source(rover):
+    """Name der Daten-Kontext-Quelle mit dem Missions-Manifest des Rovers"""
+    return f"mars_manifest_{rover}"
+
+
+def camera_family(name):
+    """Kamera ohne Stereo-/Redundanzzusatz: 'NAVCAM_LEFT' -> 'NAVCAM', 'FRONT_HAZCAM_LEFT_A' -> 'FRONT_HAZCAM'
+
+    Curiosity meldet eine NAVCAM, Perseverance NAVCAM_LEFT/NAVCAM_RIGHT; über die Familie
+    lassen sich beide Rover gleich filtern.
+    """
+    return re.sub(r'(_(LEFT|RIGHT|A|B))+$', '', name or '')
+
+
+def paginate(items, page, size):
+    """(Einträge der Seite page, Seite, Seitenzahl); page wird auf den gültigen Bereich begrenzt"""
+    pages = max(1, -(-len(items) // size))
+    page = min(max(page, 0), pages - 1)
+    return items[page * size:(page + 1) * size], page, pages
+
+
+class ManifestIndex:
+    """Sol-Index aus dem Missions-Manifest: Sols mit Fotos (sortiert), Fotos und Kamerafamilien pro Sol
+
+    Nachbar- und "letzter Sol"-Suchen laufen per Binärsuche auf den Sol-Arrays, die Arrays
+    pro Kamerafamilie werden beim ersten Zugriff gebaut.
+    """
+
+    def __init__(self, rover, manifest):
+        self.rover = rover
+        self.name = manifest.get('name', rover.title())
+        self.status = manifest.get('status')
+        self.max_sol = manifest.get('max_sol')
+        self.max_date = manifest.get('max_date')
+        self.total_photos = manifest.get('total_photos', 0)
+
+        entries = sorted((entry for entry in manifest.get('photos') or () if entry.get('total_photos')),
+                         key=lambda entry: entry['sol'])
+        self.sols = np.array([entry['sol'] for entry in entries], dtype=np.int64)
+        self.photo_counts = np.array([entry['total_photos'] for entry in entries], dtype=np.int64)
+        self.earth_dates = [entry.get('earth_date') for entry in entries]
+        self.cameras = [tuple(dict.fromkeys(camera_family(camera) for camera in entry.get('cameras') or ()))
+                        for entry in entries]
+        self._camera_sols = {None: self.sols}
+
+    def __len__(self):
+        return len(self.sols)
+
+    def _position(self, sol):
+        i = int(np.searchsorted(self.sols, sol))
+        return i if i < len(self.sols) and self.sols[i] == sol else None
+
+    def sol_info(self, sol):
+        """Manifest-Eintrag eines Sols, None wenn an dem Sol keine Fotos vorliegen"""
+        i = self._position(sol)
+        if i is None:
+            return None
+        return {
+            'sol': int(self.sols[i]),
+            'earth_date': self.earth_dates[i],
+            'total_photos': int(self.photo_counts[i]),
+            'cameras': self.cameras[i],
+        }
+
+    def camera_sols(self, camera=None):
+        """Sortierte Sols mit Fotos der Kamerafamilie camera (None = beliebige Kamera)"""
+        sols = self._camera_sols.get(camera)
+        if sols is None:
+            mask = np.fromiter((camera in cameras for cameras in self.cameras), dtype=bool, count=len(self.cameras))
+            sols = self._camera_sols[camera] = self.sols[mask]
+        return sols
+
+    def latest_sol(self, camera=None):
+        """Letzter Sol mit Fotos (der Kamerafamilie), None wenn es keinen gibt"""
+        sols = self.camera_sols(camera)
+        return int(sols[-1]) if len(sols) else None
+
+    def step(self, sol, offset, camera=None):
+        """offset Sols mit Fotos (der Kamerafamilie) vor bzw. zurück ab sol, None am Rand"""
+        sols = self.camera_sols(camera)
+        if offset > 0:
+            i = int(np.searchsorted(sols, sol, side='right')) + offset - 1
+        else:
+            i = int(np.searchsorted(sols, sol, side='left')) + offset
+        return int(sols[i]) if 0 <= i < len(sols) and offset else None
+
+
+class SolPhotoCache:
+    """Fotolisten je (Rover, Sol), alle Kameras mit einem Abruf
+
+    Kamerafilter und Seiten werden lokal aus der Liste geschnitten, Kamera- und Seitenwechsel
+    brauchen also keinen neuen Abruf. Der Schlüssel enthält die Fotoanzahl laut Manifest:
+    kommen zu einem Sol noch Bilder hinzu, wird er beim nächsten Zugriff neu geladen.
+    """
+
+    def __init__(self, max_entries=SOL_PHOTO_CACHE_SIZE, fetch=fetch_mars_photos):
+        self.max_entries = max_entries
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, rover, sol, expected=None, api_key=None):
+        """Alle Fotos des Sols (wirft bei Fehlern des Abrufs)"""
+        key = (rover, sol, expected)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        photos = self._fetch(rover, sol, camera=None, api_key=api_key)
+        with self._lock:
+            self._entries[key] = photos
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return photos
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def photos(self, rover, sol, camera=None, expected=None, api_key=None):
+        """Fotos des Sols, optional nur einer Kamerafamilie"""
+        photos = self.get(rover, sol, expected, api_key)
+        if camera is None:
+            return photos
+        return [photo for photo in photos if camera_family(photo.get('camera', {}).get('name')) == camera]
+
+
+def get_manifest_index(rover):
+    """ManifestIndex des Rovers, neu gebaut nur bei neuem Manifest-Snapshot; None ohne Manifest"""
+    source = manifest_source(rover)
+    return get_decoded_cache().get(source, (source,), lambda manifest: ManifestIndex(rover, manifest))
+
+
+_sol_photo_cache = None
+_sol_photo_cache_lock = threading.Lock()
+
+
+def get_sol_photo_cache():
+    """Prozessweiter Cache der Fotolisten pro Sol"""
+    global _sol_photo_cache
+    with _sol_photo_cache_lock:
+        if _sol_photo_cache is None:
+            _sol_photo_cache = SolPhotoCache()
+        return _sol_photo_cache
+
+
+def get_sol_photos(rover, sol, camera=None, api_key=None):
+    """Fotos eines Sols (Kamerafamilie optional), leer wenn der Sol laut Manifest keine hat"""
+    index = get_manifest_index(rover)
+    info = index.sol_info(sol) if index else None
+    if index is not None and info is None:
+        return []
+    expected = info['total_photos'] if info else None
+    return get_sol_photo_cache().photos(rover, sol, camera, expected, api_key)
+
+
+def latest_photos(camera=NAVCAM, limit=6, api_key=None, rovers=PHOTO_ROVERS):
+    """Fotos vom letzten Sol mit Aufnahmen der Kamerafamilie, erster Rover mit Treffer
+
+    Mit Manifest genügt ein Abruf; ohne Manifest bleibt nur die Suche über feste Sols.
+    """
+    for rover in rovers:
+        index = get_manifest_index(rover)
+        sol = index.latest_sol(camera) if index else None
+        if sol is None:
+            continue
+        try:
+            photos = get_sol_photos(rover, sol, camera, api_key)
+        except Exception:
+            logger.warning("Mars Fotos nicht verfügbar: %s Sol %s", rover, sol, exc_info=True)
+            continue
+        if photos:
+            logger.info("%d Mars Fotos gefunden: %s Sol %s (%s)", len(photos), rover, sol, camera)
+            return photos[:limit]
+    # Die Suche über feste Sols kennt nur NavCam
+    if camera != NAVCAM:
+        return []
+    return fetch_latest_mars_photos(api_key=api_key, limit=limit)
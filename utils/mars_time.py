@@ -0,0 +1,170 @@
+from functools import lru_cache
+
+import numpy as np
+
+from utils.astro import J2000, jd_to_datetime64, julian_day, wrap360
+
+# Marszeit nach Allison & McEwen (2000) bzw. NASA GISS Mars24 ("Mars Sol Date", "Coordinated
+# Mars Time"), vektorisiert mit NumPy. Eingabe ist Erdzeit UTC, alle Größen werden aus dem
+# Mars Sol Date (MSD) abgeleitet, damit ganze Missionen in einem Aufruf berechnet werden.
+
+# Länge eines Sols in Erdtagen
+SOL_RATIO = 1.0274912517
+# TT - UTC: 37 Schaltsekunden (seit 2017) + 32.184 s; ältere Daten weichen um 1-2 s ab
+TT_MINUS_UTC = 69.184
+# MSD 0 = Mittag des 29.12.1873 am Nullmeridian (Airy-0), Mars24-Korrektur inklusive
+_MSD_EPOCH = 44796.0 - 0.0009626
+
+# Landestelle und -zeit (Empfang auf der Erde); Sol 0 ist bei beiden Rovern der Landesol,
+# gezählt in lokaler mittlerer Sonnenzeit
+ROVERS = {
+    'curiosity': {
+        'name': 'Curiosity',
+        'site': 'Gale Crater',
+        'landing': np.datetime64('2012-08-06T05:17:57'),
+        'lat': -4.5895,
+        'lon': 137.4417,
+    },
+    'perseverance': {
+        'name': 'Perseverance',
+        'site': 'Jezero Crater',
+        'landing': np.datetime64('2021-02-18T20:55:00'),
+        'lat': 18.4447,
+        'lon': 77.4508,
+    },
+}
+
+SEASONS = ('Northern Spring', 'Northern Summer', 'Northern Autumn', 'Northern Winter')
+
+# Mars24 Tab. 5: Störungen durch die Planeten, A [Grad], τ [Julianische Jahre], φ [Grad]
+_PERTURBATIONS = np.array([
+    (0.0071, 2.2353, 49.409),
+    (0.0057, 2.7543, 168.173),
+    (0.0039, 1.1177, 191.837),
+    (0.0037, 15.7866, 21.736),
+    (0.0021, 2.1354, 15.704),
+    (0.0020, 2.4694, 95.528),
+    (0.0018, 32.8493, 49.095),
+])
+
+
+def _rover(rover):
+    try:
+        return ROVERS[rover]
+    except KeyError:
+        raise ValueError(f"Unbekannter Rover: {rover}") from None
+
+
+def msd_from_jd(jd):
+    """Julianisches Datum (UTC) -> Mars Sol Date"""
+    tt_days = np.asarray(jd, dtype=float) + TT_MINUS_UTC / 86400.0 - J2000
+    return (tt_days - 4.5) / SOL_RATIO + _MSD_EPOCH
+
+
+def msd_to_jd(msd):
+    """Mars Sol Date -> Julianisches Datum (UTC)"""
+    tt_days = (np.asarray(msd, dtype=float) - _MSD_EPOCH) * SOL_RATIO + 4.5
+    return tt_days + J2000 - TT_MINUS_UTC / 86400.0
+
+
+def mars_sol_date(times):
+    """Mars Sol Date für datetime(s) oder datetime64-Arrays"""
+    return msd_from_jd(julian_day(times))
+
+
+def coordinated_mars_time(msd):
+    """Coordinated Mars Time (mittlere Sonnenzeit am Nullmeridian) in Stunden"""
+    return (np.asarray(msd, dtype=float) % 1.0) * 24.0
+
+
+def local_mean_solar_time(msd, lon):
+    """Lokale mittlere Sonnenzeit (LMST) in Stunden für die östliche Länge lon (Grad)"""
+    return (coordinated_mars_time(msd) + np.asarray(lon, dtype=float) / 15.0) % 24.0
+
+
+def solar_longitude(msd):
+    """Areozentrische Sonnenlänge Ls in Grad (0 = Frühlingsanfang Nordhalbkugel)"""
+    dt = (np.asarray(msd, dtype=float) - _MSD_EPOCH) * SOL_RATIO + 4.5
+    mean_anomaly = np.radians(19.3871 + 0.52402073 * dt)
+    fictitious_sun = 270.3871 + 0.524038496 * dt
+
+    amplitude, tau, phase = _PERTURBATIONS.T
+    pbs = (amplitude * np.cos(np.radians(0.985626 * dt[..., None] / tau + phase))).sum(axis=-1)
+    center = ((10.691 + 3.0e-7 * dt) * np.sin(mean_anomaly) + 0.623 * np.sin(2 * mean_anomaly)
+              + 0.050 * np.sin(3 * mean_anomaly) + 0.005 * np.sin(4 * mean_anomaly)
+              + 0.0005 * np.sin(5 * mean_anomaly) + pbs)
+    return wrap360(fictitious_sun + center)
+
+
+def season_name(ls):
+    """Jahreszeit (Nordhalbkugel) zu einer Sonnenlänge Ls"""
+    return SEASONS[int(float(ls) % 360.0 // 90)]
+
+
+def format_hours(hours):
+    """Stunden (z.B. LMST) als 'HH:MM:SS'"""
+    seconds = int(float(hours) * 3600.0) % 86400
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def _landing_sol_date(info):
+    # Lokales MSD (Sol-Zählung am Landeort) des Landesols
+    landing_msd = mars_sol_date(np.array([info['landing']]))[0]
+    return np.floor(landing_msd + info['lon'] / 360.0)
+
+
+def mission_sol(rover, msd):
+    """Missions-Sol des Rovers zum Mars Sol Date msd (Sol 0 = Landesol)"""
+    info = _rover(rover)
+    local = np.asarray(msd, dtype=float) + info['lon'] / 360.0
+    return (np.floor(local) - _landing_sol_date(info)).astype(np.int64)
+
+
+def sol_start_msd(rover, sols):
+    """Mars Sol Date der lokalen Mitternacht zu Beginn der Missions-Sols sols"""
+    info = _rover(rover)
+    return _landing_sol_date(info) + np.asarray(sols, dtype=float) - info['lon'] / 360.0
+
+
+def sol_to_datetime64(rover, sols):
+    """Beginn der Missions-Sols als datetime64[s] (UTC)"""
+    return jd_to_datetime64(msd_to_jd(sol_start_msd(rover, sols)))
+
+
+def rover_clock(rover, when):
+    """Sol, Ortszeit und Jahreszeit am Rover zum Zeitpunkt when (datetime, UTC)"""
+    info = _rover(rover)
+    msd = mars_sol_date(when)[0]
+    lmst = float(local_mean_solar_time(msd, info['lon']))
+    ls = float(solar_longitude(np.array([msd]))[0])
+    return {
+        'rover': info['name'],
+        'site': info['site'],
+        'msd': float(msd),
+        'sol': int(mission_sol(rover, msd)),
+        'mtc': format_hours(coordinated_mars_time(msd)),
+        'lmst': format_hours(lmst),
+        'lmst_hours': lmst,
+        'ls': ls,
+        'season': season_name(ls),
+    }
+
+
+@lru_cache(maxsize=8)
+def sol_calendar(rover, first_sol, last_sol):
+    """Kalender der Missions-Sols first_sol..last_sol (Arrays, gecacht pro Rover und Bereich)
+
+    Pro Sol: Beginn in UTC (datetime64[s]), Mars Sol Date und Ls zur lokalen Mittagszeit.
+    Die Arrays sind schreibgeschützt, weil sie zwischen allen Sessions geteilt werden.
+    """
+    sols = np.arange(first_sol, last_sol + 1, dtype=np.int64)
+    start = sol_start_msd(rover, sols)
+    calendar = {
+        'sol': sols,
+        'start': jd_to_datetime64(msd_to_jd(start)),
+        'msd': start,
+        'ls': solar_longitude(start + 0.5),
+    }
+    for values in calendar.values():
+        values.flags.writeable = False
+    return calendar
@@ -0,0 +1,169 @@
+import numpy as np
+
+from utils.astro import centuries, ecliptic_to_equatorial, wrap180, wrap360
+
+# Mittlere Bahnelemente (J2000-Ekliptik) nach Standish, "Keplerian Elements for
+# Approximate Positions of the Major Planets" (gültig 1800-2050).
+# Je Planet: a [AE], e, I, L, ϖ (long. peri.), Ω [Grad] und deren Raten pro Jahrhundert
+_ELEMENTS = {
+    'Mercury': [(0.38709927, 0.00000037), (0.20563593, 0.00001906), (7.00497902, -0.00594749),
+                (252.25032350, 149472.67411175), (77.45779628, 0.16047689), (48.33076593, -0.12534081)],
+    'Venus': [(0.72333566, 0.00000390), (0.00677672, -0.00004107), (3.39467605, -0.00078890),
+              (181.97909950, 58517.81538729), (131.60246718, 0.00268329), (76.67984255, -0.27769418)],
+    'Earth': [(1.00000261, 0.00000562), (0.01671123, -0.00004392), (-0.00001531, -0.01294668),
+              (100.46457166, 35999.37244981), (102.93768193, 0.32327364), (0.0, 0.0)],
+    'Mars': [(1.52371034, 0.00001847), (0.09339410, 0.00007882), (1.84969142, -0.00813131),
+             (-4.55343205, 19140.30268499), (-23.94362959, 0.44441088), (49.55953891, -0.29257343)],
+    'Jupiter': [(5.20288700, -0.00011607), (0.04838624, -0.00013253), (1.30439695, -0.00183714),
+                (34.39644051, 3034.74612775), (14.72847983, 0.21252668), (100.47390909, 0.20469106)],
+    'Saturn': [(9.53667594, -0.00125060), (0.05386179, -0.00050991), (2.48599187, 0.00193609),
+               (49.95424423, 1222.49362201), (92.59887831, -0.41897216), (113.66242448, -0.28867794)],
+    'Uranus': [(19.18916464, -0.00196176), (0.04725744, -0.00004397), (0.77263783, -0.00242939),
+               (313.23810451, 428.48202785), (170.95427630, 0.40805281), (74.01692503, 0.04240589)],
+    'Neptune': [(30.06992276, 0.00026291), (0.00859048, 0.00005105), (1.77004347, 0.00035372),
+                (-55.12002969, 218.45945325), (44.96476227, -0.32241464), (131.78422574, -0.00508664)],
+}
+
+PLANETS = tuple(_ELEMENTS)
+OBSERVABLE_PLANETS = tuple(name for name in PLANETS if name != 'Earth')
+
+PLANET_INFO = {
+    'Mercury': {'color': '#8C7853', 'description': 'Sonnennächster Planet'},
+    'Venus': {'color': '#FFC649', 'description': 'Morgen-/Abendstern'},
+    'Earth': {'color': '#4169E1', 'description': 'Unser Heimatplanet'},
+    'Mars': {'color': '#CD5C5C', 'description': 'Der Rote Planet'},
+    'Jupiter': {'color': '#D2691E', 'description': 'Größter Planet'},
+    'Saturn': {'color': '#FAD5A5', 'description': 'Planet mit Ringen'},
+    'Uranus': {'color': '#7FDBFF', 'description': 'Eisriese auf der Seite liegend'},
+    'Neptune': {'color': '#4169B0', 'description': 'Äußerster Planet'},
+}
+
+# Allgemeine Präzession in Länge (Grad pro Jahrhundert), J2000 -> Äquinoktium des Datums
+PRECESSION_RATE = 1.3969713
+
+
+def _element_table(planets):
+    table = np.array([_ELEMENTS[name] for name in planets], dtype=float)
+    return table[:, :, 0], table[:, :, 1]
+
+
+def solve_kepler(mean_anomaly, eccentricity, tolerance=1e-10, max_iter=30):
+    """Löst M = E - e sin E vektorisiert per Newton-Verfahren (Radiant)"""
+    M = wrap180(np.degrees(mean_anomaly))
+    M = np.radians(M)
+    E = M + eccentricity * np.sin(M)
+    for _ in range(max_iter):
+        delta = (E - eccentricity * np.sin(E) - M) / (1 - eccentricity * np.cos(E))
+        E = E - delta
+        if np.all(np.abs(delta) < tolerance):
+            break
+    return E
+
+
+def orbital_elements(jd, planets=PLANETS):
+    """Bahnelemente (Planeten x Zeitpunkte) zum Zeitpunkt jd"""
+    T = np.atleast_1d(centuries(jd))
+    base, rate = _element_table(planets)
+    values = base[:, :, None] + rate[:, :, None] * T[None, None, :]
+    a, e, inclination, mean_longitude, perihelion, node = values.transpose(1, 0, 2)
+    return {
+        'a': a, 'e': e, 'I': inclination, 'L': mean_longitude,
+        'perihelion': perihelion, 'node': node
+    }
+
+
+def _to_ecliptic(x_orb, y_orb, elements):
+    omega = np.radians(elements['perihelion'] - elements['node'])
+    node = np.radians(elements['node'])
+    incl = np.radians(elements['I'])
+
+    cos_w, sin_w = np.cos(omega), np.sin(omega)
+    cos_n, sin_n = np.cos(node), np.sin(node)
+    cos_i, sin_i = np.cos(incl), np.sin(incl)
+
+    x = (cos_w * cos_n - sin_w * sin_n * cos_i) * x_orb + (-sin_w * cos_n - cos_w * sin_n * cos_i) * y_orb
+    y = (cos_w * sin_n + sin_w * cos_n * cos_i) * x_orb + (-sin_w * sin_n + cos_w * cos_n * cos_i) * y_orb
+    z = (sin_w * sin_i) * x_orb + (cos_w * sin_i) * y_orb
+    return np.stack([x, y, z], axis=-1)
+
+
+def heliocentric_positions(jd, planets=PLANETS):
+    """Heliozentrische Rechteckkoordinaten (AE, J2000-Ekliptik), Shape (Planeten, Zeitpunkte, 3)"""
+    elements = orbital_elements(jd, planets)
+    e = elements['e']
+    mean_anomaly = np.radians(elements['L'] - elements['perihelion'])
+
+    E = solve_kepler(mean_anomaly, e)
+    x_orb = elements['a'] * (np.cos(E) - e)
+    y_orb = elements['a'] * np.sqrt(1 - e ** 2) * np.sin(E)
+    return _to_ecliptic(x_orb, y_orb, elements)
+
+
+def _spherical(xyz, jd):
+    x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+    distance = np.sqrt(x ** 2 + y ** 2 + z ** 2)
+    # Länge auf das Äquinoktium des Datums beziehen (passend zu astro.sun_position)
+    longitude = wrap360(np.degrees(np.arctan2(y, x)) + PRECESSION_RATE * np.atleast_1d(centuries(jd)))
+    # Die geozentrische Zeile der Erde ist der Nullvektor: Breite 0 statt 0/0
+    latitude = np.degrees(np.arcsin(np.divide(z, distance, out=np.zeros_like(z), where=distance > 0)))
+    return longitude, latitude, distance
+
+
+def planet_positions(jd, planets=OBSERVABLE_PLANETS):
+    """Helio- und geozentrische Positionen aller Planeten für ein JD-Array in einem Aufruf
+
+    Alle Arrays haben die Shape (Planeten, Zeitpunkte); Winkel in Grad, Entfernungen in AE.
+    """
+    jd = np.atleast_1d(np.asarray(jd, dtype=float))
+    names = tuple(planets)
+    all_names = names if 'Earth' in names else names + ('Earth',)
+
+    helio = heliocentric_positions(jd, all_names)
+    earth = helio[all_names.index('Earth')]
+    helio = helio[:len(names)]
+    geo = helio - earth[None, :, :]
+
+    helio_lon, helio_lat, helio_dist = _spherical(helio, jd)
+    geo_lon, geo_lat, geo_dist = _spherical(geo, jd)
+    ra, dec = ecliptic_to_equatorial(geo_lon, geo_lat, jd)
+
+    # Elongation: Winkel Sonne-Erde-Planet, positiv = östlich der Sonne (Abendhimmel)
+    sun_lon, sun_lat, _ = _spherical(-earth[None, :, :], jd)
+    cos_elong = (np.cos(np.radians(geo_lat)) * np.cos(np.radians(sun_lat))
+                 * np.cos(np.radians(geo_lon - sun_lon))
+                 + np.sin(np.radians(geo_lat)) * np.sin(np.radians(sun_lat)))
+    elongation = np.degrees(np.arccos(np.clip(cos_elong, -1, 1))) * np.sign(wrap180(geo_lon - sun_lon))
+
+    return {
+        'names': names,
+        'jd': jd,
+        'helio_xyz': helio,
+        'helio_longitude': helio_lon,
+        'helio_latitude': helio_lat,
+        'helio_distance': helio_dist,
+        'geo_xyz': geo,
+        'geo_longitude': geo_lon,
+        'geo_latitude': geo_lat,
+        'geo_distance': geo_dist,
+        'ra': ra,
+        'dec': dec,
+        'elongation': elongation,
+        'sun_longitude': sun_lon[0],
+    }
+
+
+def orbit_path(planet, jd, samples=100):
+    """Bahnellipse (x, y) eines Planeten in der Ekliptik zum Zeitpunkt jd"""
+    elements = orbital_elements(jd, (planet,))
+    E = np.linspace(0, 2 * np.pi, samples + 1)
+    e = elements['e'][0, 0]
+    x_orb = elements['a'][0, 0] * (np.cos(E) - e)
+    y_orb = elements['a'][0, 0] * np.sqrt(1 - e ** 2) * np.sin(E)
+    single = {key: value[0, 0] for key, value in elements.items()}
+    xyz = _to_ecliptic(x_orb, y_orb, single)
+    return xyz[:, 0], xyz[:, 1]
+
+
+def orbital_period_days(planet):
+    """Siderische Umlaufzeit aus der großen Halbachse (3. Keplersches Gesetz)"""
+    return 365.25 * _ELEMENTS[planet][0][0] ** 1.5
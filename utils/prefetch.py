@@ -0,0 +1,168 @@
+import threading
+
+import schedule
+
+from utils.alerts import get_alert_engine
+from utils.data_context import collector_alive, get_data_context
+from utils.image_cache import get_image_cache
+from utils.instrumentation import get_logger, set_page
+from utils.mars_photos import latest_photos
+from utils.snapshots import get_snapshot_store
+from utils.space_apis import apod_today, fetch_apod
+from utils.space_weather import SpaceWeatherIngestor
+
+logger = get_logger('prefetch')
+
+
+class Prefetcher:
+    """Lädt APOD, Mars-Fotos und Space-Weather-Feeds im Hintergrund vor, bevor der erste Besucher sie braucht
+
+    Wertet außerdem die Alarm-Regeln aus, damit Flares, Stürme, Überflüge und Starts
+    auch ohne geöffnete Seite gemeldet werden.
+    """
+
+    # Seite für die Timing-Spans der Jobs
+    page = 'prefetcher'
+    # Jobs pausieren, solange ein externer Collector die Snapshots schreibt
+    defer_to_collector = True
+
+    def __init__(self, store=None, image_cache=None, apod_check_minutes=10, mars_refresh_hours=6,
+                 space_weather_minutes=5, events_minutes=30, alert_minutes=1):
+        self.store = store or get_snapshot_store()
+        self.image_cache = image_cache or get_image_cache()
+        self.space_weather = SpaceWeatherIngestor()
+        self.alerts = get_alert_engine()
+
+        self.scheduler = schedule.Scheduler()
+        # APOD erscheint kurz nach Mitternacht US-Eastern: häufig prüfen, nur bei neuem Datum laden
+        self.scheduler.every(apod_check_minutes).minutes.do(self.run_job, self.refresh_apod)
+        self.scheduler.every(mars_refresh_hours).hours.do(self.run_job, self.refresh_mars_photos)
+        # SWPC aktualisiert Sonnenwind minütlich, Kp alle 3 Stunden
+        self.scheduler.every(space_weather_minutes).minutes.do(self.run_job, self.refresh_space_weather)
+        # Überflug- und Startzeiten ändern sich selten; Vorlauf-Alarme brauchen aber minütliche Prüfung
+        self.scheduler.every(events_minutes).minutes.do(self.run_job, self.refresh_events)
+        self.scheduler.every(alert_minutes).minutes.do(self.run_job, self.evaluate_alerts)
+
+        self._thread = None
+        self._stop = threading.Event()
+
+    def run_job(self, job):
+        """Job ausführen; Fehler werden nur geloggt
+
+        schedule reicht Ausnahmen an run_pending weiter: ein einziger fehlerhafter Job
+        (kaputtes Manifest, volle Platte) würde sonst den Hintergrund-Thread beenden.
+        """
+        try:
+            return job()
+        except Exception:
+            logger.exception("Prefetch-Job %s fehlgeschlagen", getattr(job, '__name__', job))
+            return False
+
+    def apod_is_stale(self):
+        """True wenn der APOD-Snapshot nicht vom aktuellen US-Eastern-Tag ist"""
+        apod = self.store.get_data('apod')
+        return not apod or apod.get('date') != apod_today()
+
+    def refresh_apod(self, force=False):
+        """Holt neues APOD inkl. Bild, tauscht den Snapshot erst danach aus"""
+        if not force and not self.apod_is_stale():
+            return False
+        try:
+            apod = fetch_apod()
+        except Exception:
+            logger.warning("APOD konnte nicht geladen werden", exc_info=True)
+            return False
+
+        # Bild zuerst in den Cache, damit der neue Snapshot sofort ohne Download angezeigt wird
+        if apod.get('media_type') == 'image':
+            self.image_cache.warm(apod.get('url'))
+
+        self.store.put('apod', apod)
+        return True
+
+    def refresh_mars_photos(self):
+        """Holt NavCam-Fotos vom letzten Sol laut Manifest und wärmt die Thumbnails vor"""
+        photos = latest_photos()
+        if not photos:
+            return False
+
+        for photo in photos:
+            self.image_cache.get_thumbnail(photo.get('img_src'))
+
+        self.store.put('mars_photos', photos)
+        return True
+
+    def refresh_space_weather(self):
+        """Lädt alle Space-Weather-Feeds in den Zeitreihen-Store"""
+        results = self.space_weather.ingest_all()
+        updated = any(count is not None for count in results.values())
+        # Neue Flares/Kp-Werte direkt prüfen statt bis zum nächsten Alarm-Takt zu warten
+        if updated:
+            self.evaluate_alerts()
+        return updated
+
+    def refresh_events(self):
+        """ISS-Überflüge über Hamburg und kommende Starts (alle Provider) für die Vorlauf-Alarme"""
+        context = get_data_context()
+        results = [context.refresh(name) for name in ('iss_passes', 'launches_upcoming', 'll2_upcoming')]
+        return any(results)
+
+    def evaluate_alerts(self):
+        """Alarm-Regeln auf den neuen Daten auswerten"""
+        try:
+            return self.alerts.evaluate()
+        except Exception:
+            logger.exception("Alarm-Auswertung fehlgeschlagen")
+            return []
+
+    def run_all(self):
+        """Einmaliger Durchlauf aller Jobs (z.B. beim Start)"""
+        self.run_job(self.refresh_events)
+        self.run_job(self.refresh_space_weather)
+        self.run_job(self.refresh_apod)
+        if self.store.get('mars_photos') is None:
+            self.run_job(self.refresh_mars_photos)
+
+    def start(self, poll_seconds=30):
+        """Startet den Hintergrund-Thread (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, args=(poll_seconds,),
+                                        name='cosmic-prefetcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self, poll_seconds):
+        """Blockierende Schleife bis stop() (Hintergrund-Thread oder eigener Prozess)"""
+        set_page(self.page)
+        self.run_all()
+        while not self._stop.is_set():
+            try:
+                if not (self.defer_to_collector and collector_alive(self.store)):
+                    self.scheduler.run_pending()
+            except Exception:
+                logger.exception("Prefetch-Durchlauf fehlgeschlagen")
+            self._stop.wait(poll_seconds)
+
+
+_prefetcher = None
+_prefetcher_lock = threading.Lock()
+
+
+def start_prefetcher():
+    """Startet den prozessweiten Prefetcher einmalig
+
+    Läuft ein externer Collector, lesen die Dashboard-Prozesse nur dessen Snapshots und
+    pollen nicht selbst; fällt er aus, übernimmt beim nächsten Seitenaufruf wieder der Thread.
+    """
+    global _prefetcher
+    if collector_alive():
+        return None
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = Prefetcher()
+            _prefetcher.start()
+        return _prefetcher
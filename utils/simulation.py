@@ -0,0 +1,37 @@
+import hashlib
+import os
+import random
+import time
+
+# Basis-Seed für alle simulierten Daten; gleicher Seed + gleicher Zeit-Bucket = gleiche Daten
+SIMULATION_SEED = int(os.getenv("SIMULATION_SEED", "0"))
+
+# Typische Bucket-Längen (Sekunden)
+MINUTE = 60
+HOUR = 3600
+DAY = 86400
+
+
+def time_bucket(bucket_seconds, now=None):
+    """Index und Startzeit (Unix-Sekunden) des Zeit-Buckets, in dem now liegt"""
+    now = time.time() if now is None else now
+    index = int(now // bucket_seconds)
+    return index, index * bucket_seconds
+
+
+def derive_seed(source, bucket_seconds, now=None, seed=None):
+    """Stabiler 64-bit Seed aus (Basis-Seed, Quelle, Zeit-Bucket), unabhängig von PYTHONHASHSEED"""
+    index, _ = time_bucket(bucket_seconds, now)
+    base = SIMULATION_SEED if seed is None else seed
+    digest = hashlib.blake2b(f"{base}:{source}:{bucket_seconds}:{index}".encode('utf-8'), digest_size=8)
+    return int.from_bytes(digest.digest(), 'big')
+
+
+def simulation_rng(source, bucket_seconds=HOUR, now=None, seed=None):
+    """Eigener Zufallsgenerator pro (Quelle, Zeit-Bucket) statt des globalen random-Moduls"""
+    return random.Random(derive_seed(source, bucket_seconds, now, seed))
+
+
+def daily_sample(source, items, k, now=None):
+    """k Einträge aus items, über den Tag stabil (z.B. 'Fakten des Tages')"""
+    return simulation_rng(source, DAY, now).sample(items, k)
@@ -0,0 +1,366 @@
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+
+from utils.astro import (
+    AU_KM, EARTH_RADIUS_KM, ecliptic_to_equatorial, jd_to_datetime, julian_day, sidereal_time,
+    sun_position, wrap180, wrap360
+)
+from utils.config import DATA_DIR, HAMBURG_LAT, HAMBURG_LON
+from utils.lunar import FULL_MOON, NEW_MOON, moon_altitude, moon_position, phase_times
+from utils.planets import OBSERVABLE_PLANETS, planet_positions
+
+EVENTS_DIR = os.path.join(DATA_DIR, 'sky_events')
+# Bei Änderungen an der Suche erhöhen, damit alte Jahres-Caches neu berechnet werden
+CACHE_VERSION = 1
+
+OUTER_PLANETS = ('Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune')
+MOON_RADIUS_KM = 1737.4
+
+# Grobe Regionen nach geographischer Länge (Zentrum) für Sichtbarkeitsangaben
+_REGIONS = [
+    ('Europa', 10), ('Afrika', 20), ('Asien', 100), ('Australien', 135),
+    ('Pazifik', -160), ('Nordamerika', -100), ('Südamerika', -60)
+]
+
+
+def angular_separation(lon1, lat1, lon2, lat2):
+    """Winkelabstand zweier Punkte auf der Sphäre (Grad)"""
+    lon1, lat1, lon2, lat2 = map(np.radians, (lon1, lat1, lon2, lat2))
+    cos_sep = np.sin(lat1) * np.sin(lat2) + np.cos(lat1) * np.cos(lat2) * np.cos(lon1 - lon2)
+    return np.degrees(np.arccos(np.clip(cos_sep, -1.0, 1.0)))
+
+
+def bisect_roots(func, lo, hi, iterations=40):
+    """Vektorisierte Bisektion: verfeinert alle Vorzeichenwechsel-Intervalle [lo, hi] gleichzeitig"""
+    lo = np.asarray(lo, dtype=float).copy()
+    hi = np.asarray(hi, dtype=float).copy()
+    f_lo = func(lo)
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        f_mid = func(mid)
+        same = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(same, mid, lo)
+        f_lo = np.where(same, f_mid, f_lo)
+        hi = np.where(same, hi, mid)
+    return (lo + hi) / 2
+
+
+def _sign_changes(values, limit=90.0):
+    """Indizes mit Vorzeichenwechsel zwischen Sample i und i+1 (ohne ±180°-Sprünge)"""
+    a, b = values[..., :-1], values[..., 1:]
+    return np.nonzero((np.sign(a) != np.sign(b)) & (np.abs(a) < limit) & (np.abs(b) < limit))
+
+
+def find_conjunctions(start_jd, end_jd, planets=OBSERVABLE_PLANETS, max_separation=5.0, step_days=1.0):
+    """Planetenkonjunktionen (gleiche geozentrische Länge) mit Abstand < max_separation"""
+    jd = np.arange(start_jd, end_jd + step_days, step_days)
+    ephemeris = planet_positions(jd, planets)
+    lon = ephemeris['geo_longitude']
+
+    pairs = [(i, j) for i in range(len(planets)) for j in range(i + 1, len(planets))]
+    pi = np.array([p[0] for p in pairs])
+    pj = np.array([p[1] for p in pairs])
+
+    # Grobes Sampling: Längendifferenz aller Paare (Paare x Zeitpunkte)
+    diff = wrap180(lon[pi] - lon[pj])
+    pair_idx, time_idx = _sign_changes(diff)
+    if len(pair_idx) == 0:
+        return []
+
+    bi, bj = pi[pair_idx], pj[pair_idx]
+    columns = np.arange(len(pair_idx))
+
+    def longitude_difference(t):
+        eph = planet_positions(t, planets)
+        return wrap180(eph['geo_longitude'][bi, columns] - eph['geo_longitude'][bj, columns])
+
+    roots = bisect_roots(longitude_difference, jd[time_idx], jd[time_idx + 1])
+    eph = planet_positions(roots, planets)
+    separation = angular_separation(
+        eph['geo_longitude'][bi, columns], eph['geo_latitude'][bi, columns],
+        eph['geo_longitude'][bj, columns], eph['geo_latitude'][bj, columns]
+    )
+
+    events = []
+    for k in np.argsort(roots):
+        if separation[k] > max_separation:
+            continue
+        elongation = float(eph['elongation'][bi[k], k])
+        events.append({
+            'kind': 'conjunction',
+            'jd': float(roots[k]),
+            'bodies': [planets[bi[k]], planets[bj[k]]],
+            'separation': float(separation[k]),
+            'elongation': elongation
+        })
+    return events
+
+
+def find_oppositions(start_jd, end_jd, planets=OUTER_PLANETS, step_days=1.0):
+    """Oppositionen der äußeren Planeten (Elongation 180°)"""
+    jd = np.arange(start_jd, end_jd + step_days, step_days)
+    ephemeris = planet_positions(jd, planets)
+    diff = wrap180(ephemeris['geo_longitude'] - ephemeris['sun_longitude'] - 180.0)
+
+    planet_idx, time_idx = _sign_changes(diff)
+    if len(planet_idx) == 0:
+        return []
+    columns = np.arange(len(planet_idx))
+
+    def opposition_offset(t):
+        eph = planet_positions(t, planets)
+        return wrap180(eph['geo_longitude'][planet_idx, columns] - eph['sun_longitude'] - 180.0)
+
+    roots = bisect_roots(opposition_offset, jd[time_idx], jd[time_idx + 1])
+    eph = planet_positions(roots, planets)
+
+    return [{
+        'kind': 'opposition',
+        'jd': float(roots[k]),
+        'bodies': [planets[planet_idx[k]]],
+        'distance_au': float(eph['geo_distance'][planet_idx[k], k])
+    } for k in np.argsort(roots)]
+
+
+def _shadow_geometry(jd, solar):
+    """Abstand Mond-Sonne (solar) bzw. Mond-Schattenachse (lunar) und Scheibenradien in Grad"""
+    moon_lon, moon_lat, moon_dist = moon_position(jd)
+    sun_lon, sun_dist = sun_position(np.atleast_1d(jd))
+    target_lon = sun_lon if solar else wrap360(sun_lon + 180.0)
+
+    gamma = angular_separation(moon_lon, moon_lat, target_lon, 0.0)
+    sun_km = sun_dist * AU_KM
+    return {
+        'gamma': gamma,
+        'moon_lon': moon_lon,
+        'moon_lat': moon_lat,
+        'moon_parallax': np.degrees(np.arcsin(EARTH_RADIUS_KM / moon_dist)),
+        'sun_parallax': 8.794 / 3600.0 / sun_dist,
+        'moon_radius': np.degrees(np.arcsin(MOON_RADIUS_KM / moon_dist)),
+        'sun_radius': np.degrees(np.arcsin(696000.0 / sun_km)),
+    }
+
+
+def _refine_minimum(jd, solar, window=0.3):
+    """Zeitpunkt minimalen Abstands per Bisektion auf der Ableitung"""
+    dt = 1.0 / 1440.0
+
+    def slope(t):
+        return _shadow_geometry(t + dt, solar)['gamma'] - _shadow_geometry(t - dt, solar)['gamma']
+
+    return bisect_roots(slope, jd - window, jd + window, iterations=25)
+
+
+def _relative_speed(jd, solar):
+    """Relative Winkelgeschwindigkeit Mond gegenüber Sonne/Schatten (Grad pro Stunde)"""
+    dt = 1.0 / 24.0
+    before, after = _shadow_geometry(jd - dt / 2, solar), _shadow_geometry(jd + dt / 2, solar)
+    sun_before, _ = sun_position(np.atleast_1d(jd - dt / 2))
+    sun_after, _ = sun_position(np.atleast_1d(jd + dt / 2))
+    d_lon = wrap180((after['moon_lon'] - sun_after) - (before['moon_lon'] - sun_before))
+    d_lat = after['moon_lat'] - before['moon_lat']
+    return np.sqrt((d_lon * np.cos(np.radians(after['moon_lat']))) ** 2 + d_lat ** 2)
+
+
+def _format_duration(hours):
+    minutes = int(round(hours * 60))
+    return f"{minutes // 60}h {minutes % 60:02d}m"
+
+
+def _regions_around(longitude, width=75.0):
+    names = [name for name, center in _REGIONS if abs(wrap180(center - longitude)) <= width]
+    return ', '.join(names) if names else 'Ozeane'
+
+
+def find_lunar_eclipses(start_jd, end_jd, lat=HAMBURG_LAT, lon=HAMBURG_LON):
+    """Mondfinsternisse: Vollmonde, bei denen der Mond den Erdschatten berührt"""
+    full_moons = phase_times(start_jd, end_jd, FULL_MOON)
+    if len(full_moons) == 0:
+        return []
+
+    # Vorauswahl: nur Vollmonde nahe eines Knotens (|β| < 1,6°)
+    _, moon_lat, _ = moon_position(full_moons)
+    candidates = full_moons[np.abs(moon_lat) < 1.6]
+    if len(candidates) == 0:
+        return []
+
+    maxima = _refine_minimum(candidates, solar=False)
+    geo = _shadow_geometry(maxima, solar=False)
+    speed = _relative_speed(maxima, solar=False)
+
+    # Schattenradien mit 2 % atmosphärischer Vergrößerung (Danjon)
+    umbra = 1.02 * (geo['moon_parallax'] + geo['sun_parallax'] - geo['sun_radius'])
+    penumbra = 1.02 * (geo['moon_parallax'] + geo['sun_parallax'] + geo['sun_radius'])
+
+    moon_lon, moon_lat, _ = moon_position(maxima)
+    ra, _ = ecliptic_to_equatorial(moon_lon, moon_lat, maxima)
+    sublunar_lon = wrap180(ra - sidereal_time(maxima))
+    hamburg_alt, _ = moon_altitude(maxima, lat, lon)
+
+    events = []
+    for k, jd in enumerate(maxima):
+        gamma, radius = geo['gamma'][k], geo['moon_radius'][k]
+        if gamma + radius < umbra[k]:
+            eclipse_type, outer = 'Totale Mondfinsternis', umbra[k]
+        elif gamma - radius < umbra[k]:
+            eclipse_type, outer = 'Partielle Mondfinsternis', umbra[k]
+        elif gamma - radius < penumbra[k]:
+            eclipse_type, outer = 'Halbschatten-Mondfinsternis', penumbra[k]
+        else:
+            continue
+
+        duration = 2 * np.sqrt(max((outer + radius) ** 2 - gamma ** 2, 0.0)) / speed[k]
+        magnitude = (outer + radius - gamma) / (2 * radius)
+        visibility = _regions_around(sublunar_lon[k])
+        if hamburg_alt[k] > 0:
+            visibility = f"Hamburg, {visibility}"
+
+        events.append({
+            'kind': 'lunar_eclipse',
+            'jd': float(jd),
+            'type': eclipse_type,
+            'magnitude': float(magnitude),
+            'duration': _format_duration(duration),
+            'visibility': visibility,
+            'visible_hamburg': bool(hamburg_alt[k] > 0)
+        })
+    return events
+
+
+def find_solar_eclipses(start_jd, end_jd):
+    """Sonnenfinsternisse: Neumonde, bei denen der Mondschatten die Erde trifft (geozentrisch)"""
+    new_moons = phase_times(start_jd, end_jd, NEW_MOON)
+    if len(new_moons) == 0:
+        return []
+
+    _, moon_lat, _ = moon_position(new_moons)
+    candidates = new_moons[np.abs(moon_lat) < 1.6]
+    if len(candidates) == 0:
+        return []
+
+    maxima = _refine_minimum(candidates, solar=True)
+    geo = _shadow_geometry(maxima, solar=True)
+    speed = _relative_speed(maxima, solar=True)
+
+    sun_lon, _ = sun_position(maxima)
+    sun_ra, _ = ecliptic_to_equatorial(sun_lon, 0.0, maxima)
+    subsolar_lon = wrap180(sun_ra - sidereal_time(maxima))
+
+    events = []
+    for k, jd in enumerate(maxima):
+        gamma = geo['gamma'][k]
+        parallax = geo['moon_parallax'][k] - geo['sun_parallax'][k]
+        contact = parallax + geo['moon_radius'][k] + geo['sun_radius'][k]
+        if gamma >= contact:
+            continue
+
+        # Zentral, wenn die Schattenachse die Erde trifft
+        if gamma < parallax:
+            if geo['moon_radius'][k] > geo['sun_radius'][k]:
+                eclipse_type = 'Totale Sonnenfinsternis'
+            else:
+                eclipse_type = 'Ringförmige Sonnenfinsternis'
+        else:
+            eclipse_type = 'Partielle Sonnenfinsternis'
+
+        hemisphere = 'Nordhalbkugel' if geo['moon_lat'][k] > 0 else 'Südhalbkugel'
+        duration = 2 * np.sqrt(contact ** 2 - gamma ** 2) / speed[k]
+        events.append({
+            'kind': 'solar_eclipse',
+            'jd': float(jd),
+            'type': eclipse_type,
+            'gamma': float(gamma / parallax),
+            'duration': _format_duration(duration),
+            'visibility': f"{_regions_around(subsolar_lon[k])} ({hemisphere})"
+        })
+    return events
+
+
+def search_year(year):
+    """Alle Ereignisse eines Kalenderjahres (UTC)"""
+    start_jd = float(julian_day(datetime(year, 1, 1))[0])
+    end_jd = float(julian_day(datetime(year + 1, 1, 1))[0])
+
+    events = (find_conjunctions(start_jd, end_jd) + find_oppositions(start_jd, end_jd)
+              + find_lunar_eclipses(start_jd, end_jd) + find_solar_eclipses(start_jd, end_jd))
+    events = [e for e in events if start_jd <= e['jd'] < end_jd]
+    return sorted(events, key=lambda e: e['jd'])
+
+
+class SkyEventCatalog:
+    """Ereignis-Suche mit Jahres-Cache in data/sky_events"""
+
+    def __init__(self, directory=EVENTS_DIR):
+        self.directory = directory
+        self._memory = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, year):
+        return os.path.join(self.directory, f"events_{year}.json")
+
+    def year(self, year):
+        """Ereignisse eines Jahres (Speicher -> Datei -> Berechnung)"""
+        with self._lock:
+            if year in self._memory:
+                return self._memory[year]
+
+        events = self._load(year)
+        if events is None:
+            events = search_year(year)
+            self._save(year, events)
+
+        with self._lock:
+            self._memory[year] = events
+        return events
+
+    def _load(self, year):
+        try:
+            with open(self._path(year), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('version') != CACHE_VERSION:
+            return None
+        return cached['events']
+
+    def _save(self, year, events):
+        path = self._path(year)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'year': year, 'events': events}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def upcoming(self, kinds=None, horizon_years=3, now=None, limit=None):
+        """Kommende Ereignisse (optional gefiltert nach kind) innerhalb des Horizonts"""
+        now = now or datetime.now(timezone.utc)
+        now_jd = float(julian_day(now)[0])
+
+        events = []
+        for year in range(now.year, now.year + horizon_years + 1):
+            events.extend(e for e in self.year(year)
+                          if e['jd'] >= now_jd and (kinds is None or e['kind'] in kinds))
+        events = [e for e in events if e['jd'] <= now_jd + horizon_years * 365.25]
+        return events[:limit] if limit else events
+
+
+def event_datetime(event):
+    """UTC-Zeitpunkt eines Ereignisses"""
+    return jd_to_datetime(event['jd'])
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_event_catalog():
+    """Prozessweiter Ereignis-Katalog"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = SkyEventCatalog()
+        return _catalog
@@ -0,0 +1,93 @@
+import json
+import os
+import threading
+import time
+
+from utils.config import DATA_DIR
+
+SNAPSHOT_DIR = os.path.join(DATA_DIR, 'snapshots')
+
+
+class SnapshotStore:
+    """Atomar ersetzte JSON-Snapshots pro Datenquelle in data/snapshots"""
+
+    def __init__(self, directory=SNAPSHOT_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        # name -> (mtime_ns, entry)
+        self._memory = {}
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.json")
+
+    def get(self, name):
+        """Aktueller Snapshot als {'data', 'fetched_at', 'version'} oder None"""
+        path = self._path(name)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._memory.get(name)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+        # Datei wurde (evtl. von einem anderen Prozess) ersetzt -> neu laden
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        with self._lock:
+            self._memory[name] = (mtime, entry)
+        return entry
+
+    def get_data(self, name, default=None):
+        """Nur die Nutzdaten eines Snapshots"""
+        entry = self.get(name)
+        return entry['data'] if entry else default
+
+    def put(self, name, data):
+        """Schreibt neuen Snapshot und tauscht ihn atomar aus"""
+        previous = self.get(name)
+        entry = {
+            'data': data,
+            'fetched_at': time.time(),
+            'version': (previous['version'] + 1) if previous else 1
+        }
+
+        path = self._path(name)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._memory[name] = (os.stat(path).st_mtime_ns, entry)
+        return entry
+
+    def delete(self, name):
+        """Snapshot verwerfen (nächster Zugriff lädt neu)"""
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self._memory.pop(name, None)
+
+
+_snapshot_store = None
+_snapshot_store_lock = threading.Lock()
+
+
+def get_snapshot_store():
+    """Prozessweiter Snapshot-Store"""
+    global _snapshot_store
+    with _snapshot_store_lock:
+        if _snapshot_store is None:
+            _snapshot_store = SnapshotStore()
+        return _snapshot_store
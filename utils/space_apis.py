@@ -0,0 +1,187 @@
+import os
+from datetime import datetime, timezone, timedelta
+
+import requests
+
+from utils.instrumentation import FETCH, get_logger, timed
+
+try:
+    from zoneinfo import ZoneInfo
+    US_EASTERN = ZoneInfo("America/New_York")
+except Exception:
+    # Fallback ohne tz-Datenbank (ignoriert Sommerzeit)
+    US_EASTERN = timezone(timedelta(hours=-5))
+
+# Basis-URLs der APIs (überschreibbar, z.B. für den Offline-Benchmark mit Stub-Server)
+NASA_API_URL = os.getenv("NASA_API_URL", "https://api.nasa.gov").rstrip('/')
+OPEN_NOTIFY_URL = os.getenv("OPEN_NOTIFY_URL", "http://api.open-notify.org").rstrip('/')
+SPACEX_API_URL = os.getenv("SPACEX_API_URL", "https://api.spacexdata.com/v4").rstrip('/')
+# Launch Library 2 (The Space Devs): Starts aller Anbieter, ohne Key max. 15 Abrufe pro Stunde
+LL2_API_URL = os.getenv("LL2_API_URL", "https://ll.thespacedevs.com/2.2.0").rstrip('/')
+
+NASA_APOD_URL = f"{NASA_API_URL}/planetary/apod"
+NASA_MARS_PHOTOS_URL = f"{NASA_API_URL}/mars-photos/api/v1/rovers/{{rover}}/photos"
+NASA_MARS_MANIFEST_URL = f"{NASA_API_URL}/mars-photos/api/v1/manifests/{{rover}}"
+NASA_NEO_FEED_URL = f"{NASA_API_URL}/neo/rest/v1/feed"
+OPEN_NOTIFY_ISS_URL = f"{OPEN_NOTIFY_URL}/iss-now.json"
+OPEN_NOTIFY_ASTROS_URL = f"{OPEN_NOTIFY_URL}/astros.json"
+OPEN_NOTIFY_PASS_URL = f"{OPEN_NOTIFY_URL}/iss-pass.json"
+SPACEX_UPCOMING_URL = f"{SPACEX_API_URL}/launches/upcoming"
+SPACEX_PAST_URL = f"{SPACEX_API_URL}/launches/past"
+SPACEX_ROCKETS_URL = f"{SPACEX_API_URL}/rockets"
+SPACEX_LAUNCHPADS_URL = f"{SPACEX_API_URL}/launchpads"
+LL2_UPCOMING_URL = f"{LL2_API_URL}/launch/upcoming/"
+LL2_PREVIOUS_URL = f"{LL2_API_URL}/launch/previous/"
+
+logger = get_logger('space_apis')
+
+# Sols, die bisher zuverlässig NavCam-Fotos geliefert haben (nur ohne Missions-Manifest, siehe utils/mars_photos.py)
+MARS_PHOTO_SOLS = [3000, 2500, 2000, 1500, 1000]
+
+
+def get_nasa_api_key():
+    """NASA API Key aus Environment Variable (Fallback DEMO_KEY)"""
+    return os.getenv("NASA_API_KEY", "DEMO_KEY")
+
+
+def apod_today():
+    """Aktuelles APOD-Datum (APOD wechselt um Mitternacht US-Eastern)"""
+    return datetime.now(US_EASTERN).strftime('%Y-%m-%d')
+
+
+@timed('nasa_apod', FETCH)
+def fetch_apod(api_key=None, date=None, timeout=10):
+    """Holt NASA Picture of the Day (wirft bei Fehlern)"""
+    params = {'api_key': api_key or get_nasa_api_key()}
+    if date:
+        params['date'] = date
+
+    response = requests.get(NASA_APOD_URL, params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+@timed('nasa_neo', FETCH)
+def fetch_neo_feed(date=None, api_key=None, timeout=10):
+    """Erdnahe Objekte eines Tages (Liste der NEO-Objekte, wirft bei Fehlern)"""
+    date = date or datetime.now().strftime('%Y-%m-%d')
+    params = {'api_key': api_key or get_nasa_api_key(), 'start_date': date, 'end_date': date}
+    response = requests.get(NASA_NEO_FEED_URL, params=params, timeout=timeout)
+    response.raise_for_status()
+    return [obj for objects in response.json()['near_earth_objects'].values() for obj in objects]
+
+
+@timed('nasa_mars_photos', FETCH)
+def fetch_mars_photos(rover, sol, camera='navcam', api_key=None, timeout=10):
+    """Holt Mars Rover Fotos für einen Sol und eine Kamera"""
+    params = {'api_key': api_key or get_nasa_api_key(), 'sol': sol}
+    if camera:
+        params['camera'] = camera
+
+    response = requests.get(NASA_MARS_PHOTOS_URL.format(rover=rover), params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json().get('photos', [])
+
+
+@timed('nasa_mars_manifest', FETCH)
+def fetch_mars_manifest(rover, api_key=None, timeout=15):
+    """Missions-Manifest eines Rovers: Fotos und Kameras pro Sol (wirft bei Fehlern)"""
+    params = {'api_key': api_key or get_nasa_api_key()}
+    response = requests.get(NASA_MARS_MANIFEST_URL.format(rover=rover), params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json()['photo_manifest']
+
+
+def fetch_latest_mars_photos(api_key=None, sols=MARS_PHOTO_SOLS, limit=6):
+    """Sucht Perseverance/Curiosity NavCam Fotos über mehrere Sols (leere Liste wenn nichts gefunden)"""
+    for sol in sols:
+        for rover in ('perseverance', 'curiosity'):
+            try:
+                photos = fetch_mars_photos(rover, sol, api_key=api_key)
+            except Exception:
+                logger.warning("Mars Fotos nicht verfügbar: %s Sol %s", rover, sol, exc_info=True)
+                continue
+            if photos:
+                logger.info("%d Mars Fotos gefunden: %s Sol %s", len(photos), rover, sol)
+                return photos[:limit]
+    logger.warning("Keine Mars Fotos für Sols %s gefunden", sols)
+    return []
+
+
+@timed('open_notify_passes', FETCH)
+def fetch_iss_passes(lat, lon, n=5, timeout=15):
+    """ISS Überflüge ({'risetime', 'duration'}, Unix-Sekunden) für einen Standort (wirft bei Fehlern)"""
+    params = {'lat': lat, 'lon': lon, 'alt': 6, 'n': n}
+    response = requests.get(OPEN_NOTIFY_PASS_URL, params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json().get('response', [])
+
+
+@timed('spacex_upcoming', FETCH)
+def fetch_upcoming_launches(timeout=15):
+    """Kommende SpaceX Starts (wirft bei Fehlern)"""
+    response = requests.get(SPACEX_UPCOMING_URL, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+@timed('spacex_past', FETCH)
+def fetch_past_launches(timeout=15):
+    """Vergangene SpaceX Starts (wirft bei Fehlern)"""
+    response = requests.get(SPACEX_PAST_URL, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+@timed('spacex_rockets', FETCH)
+def fetch_rockets(timeout=15):
+    """Alle SpaceX Raketen (wirft bei Fehlern)"""
+    response = requests.get(SPACEX_ROCKETS_URL, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+@timed('spacex_launchpads', FETCH)
+def fetch_launchpads(timeout=15):
+    """Alle SpaceX Startplätze (wirft bei Fehlern)"""
+    response = requests.get(SPACEX_LAUNCHPADS_URL, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+@timed('ll2_upcoming', FETCH)
+def fetch_ll2_upcoming(limit=30, timeout=15):
+    """Kommende Starts aller Anbieter aus Launch Library 2 (wirft bei Fehlern)"""
+    response = requests.get(LL2_UPCOMING_URL, params={'limit': limit, 'mode': 'normal'}, timeout=timeout)
+    response.raise_for_status()
+    return response.json().get('results', [])
+
+
+@timed('ll2_previous', FETCH)
+def fetch_ll2_previous(limit=30, timeout=15):
+    """Letzte Starts aller Anbieter aus Launch Library 2, neueste zuerst (wirft bei Fehlern)"""
+    response = requests.get(LL2_PREVIOUS_URL, params={'limit': limit, 'mode': 'normal'}, timeout=timeout)
+    response.raise_for_status()
+    return response.json().get('results', [])
+
+
+@timed('open_notify_iss', FETCH)
+def fetch_iss_position(timeout=10):
+    """Aktuelle ISS Position {'latitude', 'longitude', 'timestamp'} (wirft bei Fehlern)"""
+    response = requests.get(OPEN_NOTIFY_ISS_URL, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()
+    return {
+        'latitude': float(data['iss_position']['latitude']),
+        'longitude': float(data['iss_position']['longitude']),
+        'timestamp': data['timestamp']
+    }
+
+
+@timed('open_notify_astros', FETCH)
+def fetch_astronauts(timeout=10):
+    """Menschen im All {'people', 'number'} (wirft bei Fehlern)"""
+    response = requests.get(OPEN_NOTIFY_ASTROS_URL, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()
+    return {'people': data['people'], 'number': data['number']}
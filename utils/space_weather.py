@@ -0,0 +1,338 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import requests
+
+from utils.archive import get_archive
+from utils.config import BASE_DIR
+from utils.instrumentation import FETCH, PARSE, get_logger, span
+from utils.snapshots import get_snapshot_store
+from utils.timeseries import get_timeseries_store
+
+# NOAA Space Weather Prediction Center (SWPC) JSON-Feeds
+SWPC_BASE_URL = os.getenv("SWPC_BASE_URL", "https://services.swpc.noaa.gov")
+# Verzeichnis mit aufgezeichneten Feeds; wenn gesetzt, wird statt SWPC von dort gelesen
+SPACE_WEATHER_FIXTURES = os.getenv("SPACE_WEATHER_FIXTURES", "")
+FIXTURE_DIR = os.path.join(BASE_DIR, 'fixtures', 'swpc')
+
+# Wie lange Rohdatensätze im Snapshot-Store gehalten werden
+RETENTION_DAYS = 7
+
+# Minütliche Feeds: Kanäle für den Ringpuffer (1 min / 5 min / 1 h, bis 30 Tage) und das
+# Rohdaten-Archiv in data/archive. Im Snapshot-Store werden sie nur für einen Tag gehalten.
+SERIES_CHANNELS = {
+    'plasma': ('speed', 'density', 'temperature'),
+    'mag': ('bt', 'bz'),
+}
+SERIES_RETENTION_DAYS = 1
+
+logger = get_logger('space_weather')
+
+
+def parse_time_tag(value):
+    """SWPC time_tag ('2025-06-01 12:00:00.000' oder ISO mit 'Z') -> Unix-Sekunden (UTC)"""
+    text = str(value).strip().replace('T', ' ').rstrip('Z')
+    for fmt in ('%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M'):
+        try:
+            moment = datetime.strptime(text, fmt)
+            return int(moment.replace(tzinfo=timezone.utc).timestamp())
+        except ValueError:
+            continue
+    raise ValueError(f"Unbekanntes time_tag Format: {value}")
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _table_rows(raw):
+    """Tabellen-Feeds (erste Zeile = Header) als Liste von Dicts"""
+    if not raw:
+        return []
+    if isinstance(raw[0], dict):
+        return raw
+    header = raw[0]
+    return [dict(zip(header, row)) for row in raw[1:]]
+
+
+def parse_plasma(raw):
+    """Sonnenwind-Plasma (DSCOVR/ACE): Dichte, Geschwindigkeit, Temperatur"""
+    records = []
+    for row in _table_rows(raw):
+        speed = _float(row.get('speed'))
+        if speed is None:
+            continue
+        records.append({
+            'time': parse_time_tag(row['time_tag']),
+            'density': _float(row.get('density')),
+            'speed': speed,
+            'temperature': _float(row.get('temperature'))
+        })
+    return records
+
+
+def parse_mag(raw):
+    """Interplanetares Magnetfeld: Bt und Bz (GSM) in nT"""
+    records = []
+    for row in _table_rows(raw):
+        bt = _float(row.get('bt'))
+        if bt is None:
+            continue
+        records.append({
+            'time': parse_time_tag(row['time_tag']),
+            'bt': bt,
+            'bz': _float(row.get('bz_gsm'))
+        })
+    return records
+
+
+def parse_kp(raw):
+    """Planetarer Kp-Index (3-Stunden-Werte)"""
+    records = []
+    for row in _table_rows(raw):
+        kp = _float(row.get('Kp', row.get('kp_index', row.get('kp'))))
+        if kp is None:
+            continue
+        records.append({'time': parse_time_tag(row['time_tag']), 'kp': kp})
+    return records
+
+
+def parse_kp_forecast(raw):
+    """3-Tage Kp-Vorhersage inkl. beobachteter/geschätzter Werte"""
+    records = []
+    for row in _table_rows(raw):
+        kp = _float(row.get('kp'))
+        if kp is None:
+            continue
+        records.append({
+            'time': parse_time_tag(row['time_tag']),
+            'kp': kp,
+            'observed': row.get('observed', 'predicted')
+        })
+    return records
+
+
+def parse_xray_flares(raw):
+    """GOES Röntgen-Flares der letzten 7 Tage"""
+    records = []
+    for row in _table_rows(raw):
+        klasse = row.get('max_class')
+        if not klasse or not row.get('max_time'):
+            continue
+        records.append({
+            'time': parse_time_tag(row['max_time']),
+            'begin': parse_time_tag(row['begin_time']) if row.get('begin_time') else None,
+            'end': parse_time_tag(row['end_time']) if row.get('end_time') else None,
+            'klasse': klasse,
+            'flux': _float(row.get('max_xrlong')),
+            'satellite': row.get('satellite')
+        })
+    return records
+
+
+def parse_protons(raw):
+    """GOES integraler Protonenfluss >=10 MeV (pfu)"""
+    records = []
+    for row in _table_rows(raw):
+        if row.get('energy') != '>=10 MeV':
+            continue
+        flux = _float(row.get('flux'))
+        if flux is None:
+            continue
+        records.append({'time': parse_time_tag(row['time_tag']), 'flux': flux})
+    return records
+
+
+# Feed-Name -> (Pfad relativ zu SWPC_BASE_URL, Parser)
+FEEDS = {
+    'plasma': ('products/solar-wind/plasma-1-day.json', parse_plasma),
+    'mag': ('products/solar-wind/mag-1-day.json', parse_mag),
+    'kp': ('products/noaa-planetary-k-index.json', parse_kp),
+    'kp_forecast': ('products/noaa-planetary-k-index-forecast.json', parse_kp_forecast),
+    'xray_flares': ('json/goes/primary/xray-flares-7-day.json', parse_xray_flares),
+    'protons': ('json/goes/primary/integral-protons-1-day.json', parse_protons),
+}
+
+
+class FeedSource:
+    """Schnittstelle für Space-Weather-Quellen: load(path) liefert das rohe JSON eines Feeds"""
+
+    name = 'base'
+
+    def load(self, path):
+        raise NotImplementedError
+
+
+class SWPCSource(FeedSource):
+    """Live-Feeds von services.swpc.noaa.gov"""
+
+    name = 'swpc'
+
+    def __init__(self, base_url=SWPC_BASE_URL, timeout=10):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def load(self, path):
+        with span(f"swpc_{os.path.basename(path)}", FETCH):
+            response = requests.get(f"{self.base_url}/{path}", timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+
+
+class FixtureSource(FeedSource):
+    """Aufgezeichnete Feeds aus einem lokalen Verzeichnis (Dateiname = letzter Pfadteil)"""
+
+    name = 'fixture'
+
+    def __init__(self, directory=FIXTURE_DIR):
+        self.directory = directory
+
+    def load(self, path):
+        with open(os.path.join(self.directory, os.path.basename(path)), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+def default_source():
+    """Fixture-Quelle wenn SPACE_WEATHER_FIXTURES gesetzt ist, sonst SWPC"""
+    if SPACE_WEATHER_FIXTURES:
+        return FixtureSource(SPACE_WEATHER_FIXTURES)
+    return SWPCSource()
+
+
+class SpaceWeatherStore:
+    """Datensätze pro Feed im Snapshot-Store, minütliche Feeds zusätzlich als Ringpuffer und Rohdaten-Archiv"""
+
+    def __init__(self, snapshots=None, timeseries=None, retention_days=RETENTION_DAYS):
+        self.snapshots = snapshots or get_snapshot_store()
+        self.timeseries = timeseries or get_timeseries_store()
+        self.retention = retention_days * 86400
+        self._lock = threading.Lock()
+
+    def _key(self, feed):
+        return f"space_weather_{feed}"
+
+    def archive(self, feed):
+        """Memory-mapped Rohdaten-Archiv eines minütlichen Feeds"""
+        return get_archive(self._key(feed), SERIES_CHANNELS[feed])
+
+    def merge(self, feed, records):
+        """Neue Datensätze einfügen (gleicher Zeitstempel -> neuerer Wert gewinnt)"""
+        with self._lock:
+            merged = {r['time']: r for r in self.series(feed)}
+            merged.update((r['time'], r) for r in records)
+            if not merged:
+                return 0
+            newest = max(merged)
+            retention = SERIES_RETENTION_DAYS * 86400 if feed in SERIES_CHANNELS else self.retention
+            rows = [merged[t] for t in sorted(merged) if t >= newest - retention]
+            self.snapshots.put(self._key(feed), rows)
+
+            if feed in SERIES_CHANNELS:
+                channels = SERIES_CHANNELS[feed]
+                self.timeseries.append_records(self._key(feed), channels, records)
+                self.archive(feed).append([
+                    (r['time'],) + tuple(np.nan if r.get(c) is None else r[c] for c in channels)
+                    for r in records
+                ])
+            return len(rows)
+
+    def replace(self, feed, records):
+        """Feed komplett ersetzen (z.B. Vorhersagen)"""
+        with self._lock:
+            self.snapshots.put(self._key(feed), sorted(records, key=lambda r: r['time']))
+
+    def series(self, feed, since=None):
+        """Alle Datensätze eines Feeds (optional ab Unix-Zeit since), zeitlich sortiert"""
+        rows = self.snapshots.get_data(self._key(feed), default=[])
+        if since is not None:
+            rows = [r for r in rows if r['time'] >= since]
+        return rows
+
+    def history(self, feed, channel, seconds, max_points=600):
+        """Verlauf eines Kanals über seconds (bis zum jüngsten Wert), auf max_points reduziert
+
+        Deckt das Rohdaten-Archiv das ganze Fenster ab, wird es in voller Auflösung gelesen
+        (memmap + Binärsuche); sonst aus den vorab aggregierten Ringpuffer-Stufen.
+        """
+        extent = self.archive(feed).extent()
+        if extent and extent[1] - extent[0] >= seconds:
+            return self.archive(feed).query(seconds, channel, max_points=max_points)
+
+        series = self.timeseries.get(self._key(feed))
+        if series is None:
+            return None
+        return series.query(seconds, channel, max_points=max_points)
+
+    def latest(self, feed):
+        """Jüngster Datensatz eines Feeds oder None"""
+        rows = self.series(feed)
+        return rows[-1] if rows else None
+
+    def fetched_at(self, feed):
+        entry = self.snapshots.get(self._key(feed))
+        return entry['fetched_at'] if entry else None
+
+
+class SpaceWeatherIngestor:
+    """Lädt Feeds über eine FeedSource, parst sie und schreibt sie in den SpaceWeatherStore"""
+
+    # Vorhersagen werden ersetzt statt zusammengeführt
+    REPLACE_FEEDS = ('kp_forecast',)
+
+    def __init__(self, source=None, store=None):
+        self.source = source or default_source()
+        self.store = store or get_space_weather_store()
+
+    def ingest(self, feed):
+        """Einen Feed laden und speichern, gibt die Zahl neuer Datensätze zurück"""
+        path, parser = FEEDS[feed]
+        raw = self.source.load(path)
+        with span(f"swpc_{feed}", PARSE):
+            records = parser(raw)
+        if feed in self.REPLACE_FEEDS:
+            self.store.replace(feed, records)
+        else:
+            self.store.merge(feed, records)
+        return len(records)
+
+    def ingest_all(self):
+        """Alle Feeds laden; Fehler einzelner Feeds brechen den Durchlauf nicht ab"""
+        results = {}
+        for feed in FEEDS:
+            try:
+                results[feed] = self.ingest(feed)
+            except Exception:
+                logger.warning("Space-Weather-Feed %s fehlgeschlagen", feed, exc_info=True)
+                results[feed] = None
+        return results
+
+
+def to_datetime(unix_seconds):
+    """Unix-Sekunden -> timezone-aware datetime (UTC)"""
+    return datetime.fromtimestamp(unix_seconds, tz=timezone.utc)
+
+
+def data_age_minutes(store, feed):
+    """Alter des jüngsten Datensatzes in Minuten (None ohne Daten)"""
+    latest = store.latest(feed)
+    return None if latest is None else (time.time() - latest['time']) / 60.0
+
+
+_space_weather_store = None
+_space_weather_store_lock = threading.Lock()
+
+
+def get_space_weather_store():
+    """Prozessweiter Space-Weather-Store"""
+    global _space_weather_store
+    with _space_weather_store_lock:
+        if _space_weather_store is None:
+            _space_weather_store = SpaceWeatherStore()
+        return _space_weather_store
@@ -0,0 +1,238 @@
+import os
+import threading
+
+import numpy as np
+
+from utils.config import DATA_DIR
+
+TIMESERIES_DIR = os.path.join(DATA_DIR, 'timeseries')
+
+# Auflösungsstufen (Sekunden pro Bucket, Anzahl Buckets im Ringpuffer):
+# 1 min für 2 Tage, 5 min für 8 Tage, 1 h für 32 Tage
+DEFAULT_TIERS = ((60, 2 * 1440), (300, 8 * 288), (3600, 32 * 24))
+
+
+class RingTier:
+    """Ringpuffer fester Auflösung mit Mittelwert/Min/Max pro Bucket und Kanal"""
+
+    def __init__(self, step, capacity, channels):
+        self.step = step
+        self.capacity = capacity
+        # Startzeit des Buckets je Slot (-1 = leer), damit alte Slots beim Überschreiben erkannt werden
+        self.bucket = np.full(capacity, -1, dtype=np.int64)
+        self.count = np.zeros((capacity, channels), dtype=np.int32)
+        self.total = np.zeros((capacity, channels), dtype=np.float64)
+        self.low = np.full((capacity, channels), np.nan, dtype=np.float32)
+        self.high = np.full((capacity, channels), np.nan, dtype=np.float32)
+
+    def add(self, times, values):
+        """Messwerte (Unix-Sekunden, Shape (N, Kanäle)) in die Buckets einsortieren"""
+        buckets = (times // self.step) * self.step
+        slots = (buckets // self.step) % self.capacity
+
+        # Pro Slot gewinnt der jüngste Bucket (Batch länger als der Puffer, oder verspätete Altdaten)
+        newest = self.bucket.copy()
+        np.maximum.at(newest, slots, buckets)
+        keep = buckets == newest[slots]
+        times, values, buckets, slots = times[keep], values[keep], buckets[keep], slots[keep]
+
+        # Slots, die noch einen älteren Bucket enthalten, zurücksetzen
+        reset = np.unique(slots[self.bucket[slots] != buckets])
+        self.bucket[reset] = newest[reset]
+        self.count[reset] = 0
+        self.total[reset] = 0.0
+        self.low[reset] = np.nan
+        self.high[reset] = np.nan
+
+        valid = ~np.isnan(values)
+        filled = np.where(valid, values, 0.0)
+        np.add.at(self.count, slots, valid.astype(np.int32))
+        np.add.at(self.total, slots, filled)
+        np.fmin.at(self.low, slots, np.where(valid, values, np.nan).astype(np.float32))
+        np.fmax.at(self.high, slots, np.where(valid, values, np.nan).astype(np.float32))
+
+    def window(self, start, end):
+        """Buckets im Zeitraum [start, end] zeitlich sortiert: (Zeiten, Mittel, Min, Max)"""
+        mask = (self.bucket >= start - self.step) & (self.bucket <= end)
+        order = np.argsort(self.bucket[mask])
+        count = self.count[mask][order]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, self.total[mask][order] / np.maximum(count, 1), np.nan)
+        return self.bucket[mask][order], mean, self.low[mask][order], self.high[mask][order]
+
+    def state(self, prefix):
+        return {
+            f"{prefix}_bucket": self.bucket, f"{prefix}_count": self.count,
+            f"{prefix}_total": self.total, f"{prefix}_low": self.low, f"{prefix}_high": self.high
+        }
+
+    def restore(self, data, prefix):
+        self.bucket = data[f"{prefix}_bucket"]
+        self.count = data[f"{prefix}_count"]
+        self.total = data[f"{prefix}_total"]
+        self.low = data[f"{prefix}_low"]
+        self.high = data[f"{prefix}_high"]
+
+
+class RingSeries:
+    """Mehrkanalige Zeitreihe mit vorab aggregierten Stufen (1 min -> 5 min -> 1 h)"""
+
+    def __init__(self, channels, tiers=DEFAULT_TIERS):
+        self.channels = tuple(channels)
+        self.tiers = [RingTier(step, capacity, len(self.channels)) for step, capacity in tiers]
+        self.last_time = None
+
+    def append(self, times, values):
+        """Neue Messwerte anhängen; bereits enthaltene Zeitpunkte (<= last_time) werden ignoriert"""
+        times = np.asarray(times, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64).reshape(len(times), len(self.channels))
+        if self.last_time is not None:
+            newer = times > self.last_time
+            times, values = times[newer], values[newer]
+        if not len(times):
+            return 0
+
+        for tier in self.tiers:
+            tier.add(times, values)
+        self.last_time = int(times.max())
+        return len(times)
+
+    def append_records(self, records):
+        """Datensätze (Dicts mit 'time' und den Kanalnamen) anhängen"""
+        if not records:
+            return 0
+        times = [r['time'] for r in records]
+        values = [[np.nan if r.get(c) is None else r[c] for c in self.channels] for r in records]
+        return self.append(times, values)
+
+    def query(self, seconds, channel, end=None, max_points=600):
+        """Zeitfenster der Länge seconds (bis end bzw. zum jüngsten Wert) mit begrenzter Punktzahl
+
+        Wählt die feinste Stufe, die das Fenster abdeckt, und reduziert danach per Min/Max-Downsampling.
+        Gibt {'time', 'mean', 'min', 'max', 'step'} zurück.
+        """
+        end = self.last_time if end is None else end
+        if end is None:
+            return {'time': np.array([], dtype=np.int64), 'mean': np.array([]),
+                    'min': np.array([]), 'max': np.array([]), 'step': self.tiers[0].step}
+
+        tier = next((t for t in self.tiers if t.step * t.capacity >= seconds), self.tiers[-1])
+        index = self.channels.index(channel)
+        times, mean, low, high = tier.window(end - seconds, end)
+        times, mean, low, high = downsample_minmax(
+            times, mean[:, index], low[:, index], high[:, index], max_points
+        )
+        return {'time': times, 'mean': mean, 'min': low, 'max': high, 'step': tier.step}
+
+    def state(self):
+        state = {
+            'channels': np.array(self.channels),
+            'steps': np.array([t.step for t in self.tiers]),
+            'capacities': np.array([t.capacity for t in self.tiers]),
+            'last_time': np.array(-1 if self.last_time is None else self.last_time),
+        }
+        for i, tier in enumerate(self.tiers):
+            state.update(tier.state(f"tier{i}"))
+        return state
+
+    @classmethod
+    def from_state(cls, data):
+        tiers = tuple(zip(data['steps'].tolist(), data['capacities'].tolist()))
+        series = cls([str(c) for c in data['channels']], tiers)
+        for i, tier in enumerate(series.tiers):
+            tier.restore(data, f"tier{i}")
+        last_time = int(data['last_time'])
+        series.last_time = None if last_time < 0 else last_time
+        return series
+
+
+def downsample_minmax(times, mean, low, high, max_points):
+    """Reduziert auf höchstens max_points Punkte, Extremwerte jedes Abschnitts bleiben erhalten
+
+    Jeder Abschnitt liefert seinen Mittelwert sowie Minimum und Maximum, so dass Spitzen
+    (z.B. Sonnenwind-Schocks) auch in der 30-Tage-Ansicht sichtbar bleiben.
+    """
+    n = len(times)
+    if n <= max_points:
+        return times, mean, low, high
+
+    edges = np.linspace(0, n, max_points + 1).astype(np.int64)
+    starts = edges[:-1]
+    counts = np.diff(edges)
+    with np.errstate(invalid='ignore'):
+        weights = ~np.isnan(mean)
+        sums = np.add.reduceat(np.where(weights, mean, 0.0), starts)
+        valid = np.add.reduceat(weights.astype(np.int64), starts)
+        mean_out = np.where(valid > 0, sums / np.maximum(valid, 1), np.nan)
+    low_out = np.fmin.reduceat(low, starts)
+    high_out = np.fmax.reduceat(high, starts)
+    # Zeitstempel = Mitte des Abschnitts
+    time_out = times[starts + counts // 2]
+    return time_out, mean_out, low_out, high_out
+
+
+class TimeSeriesStore:
+    """RingSeries pro Name, persistiert als .npz in data/timeseries (neu geladen wenn die Datei wechselt)"""
+
+    def __init__(self, directory=TIMESERIES_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        # name -> (mtime_ns, RingSeries)
+        self._memory = {}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.npz")
+
+    def get(self, name):
+        """Gespeicherte Zeitreihe oder None"""
+        path = self._path(name)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._memory.get(name)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+        try:
+            with np.load(path) as data:
+                series = RingSeries.from_state(data)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        with self._lock:
+            self._memory[name] = (mtime, series)
+        return series
+
+    def append_records(self, name, channels, records):
+        """Datensätze an die Zeitreihe name anhängen (legt sie bei Bedarf an) und speichern"""
+        series = self.get(name) or RingSeries(channels)
+        added = series.append_records(records)
+        if added:
+            self._save(name, series)
+        return added
+
+    def _save(self, name, series):
+        path = self._path(name)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+        np.savez(tmp_path, **series.state())
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._memory[name] = (os.stat(path).st_mtime_ns, series)
+
+
+_timeseries_store = None
+_timeseries_store_lock = threading.Lock()
+
+
+def get_timeseries_store():
+    """Prozessweiter Zeitreihen-Store"""
+    global _timeseries_store
+    with _timeseries_store_lock:
+        if _timeseries_store is None:
+            _timeseries_store = TimeSeriesStore()
+        return _timeseries_store
@@ -0,0 +1,131 @@
+from datetime import datetime, time as dt_time
+from functools import lru_cache
+
+import numpy as np
+
+from utils.astro import (
+    ASTRONOMICAL_TWILIGHT, CIVIL_TWILIGHT, SUN_H0, crossings, culminations, ecliptic_to_equatorial,
+    horizontal, julian_day, local_zone, sun_position
+)
+from utils.config import HAMBURG_LAT, HAMBURG_LON
+from utils.lunar import to_local_datetime, today_local
+from utils.planets import OBSERVABLE_PLANETS, planet_positions
+
+# Horizonthöhe für Planeten-Auf-/Untergang (Refraktion)
+PLANET_H0 = -0.5667
+NAKED_EYE_PLANETS = ('Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn')
+
+_COMPASS = ['N', 'NO', 'O', 'SO', 'S', 'SW', 'W', 'NW']
+
+
+def compass_direction(azimuth):
+    """Azimut (Grad) -> Himmelsrichtung"""
+    return _COMPASS[int(((float(azimuth) + 22.5) % 360) // 45)]
+
+
+def _window(grid, mask):
+    """Erstes zusammenhängendes Zeitfenster, in dem mask True ist (JD-Paar oder None)"""
+    if not mask.any():
+        return None
+    start = int(np.argmax(mask))
+    end = start + int(np.argmin(mask[start:])) if not mask[start:].all() else len(mask)
+    return float(grid[start]), float(grid[end - 1])
+
+
+@lru_cache(maxsize=16)
+def _night_visibility(night_date, lat, lon, planets, step_minutes, min_altitude, sun_limit):
+    # Lokaler Mittag bis Mittag des Folgetages, damit die Nacht vollständig im Gitter liegt
+    noon = datetime.combine(night_date, dt_time(12, 0), tzinfo=local_zone())
+    start_jd = float(julian_day(noon)[0])
+    samples = int(24 * 60 / step_minutes) + 1
+    grid = start_jd + np.arange(samples) * (step_minutes / 1440.0)
+
+    # Alle Planeten und Zeitpunkte in einer Auswertung
+    ephemeris = planet_positions(grid, planets)
+    altitude, azimuth = horizontal(ephemeris['ra'], ephemeris['dec'], grid, lat, lon)
+
+    sun_lon, _ = sun_position(grid)
+    sun_ra, sun_dec = ecliptic_to_equatorial(sun_lon, 0.0, grid)
+    sun_alt, _ = horizontal(sun_ra, sun_dec, grid, lat, lon)
+
+    sun_rows = np.vstack([sun_alt - SUN_H0, sun_alt - CIVIL_TWILIGHT, sun_alt - ASTRONOMICAL_TWILIGHT])
+    sun_rise, sun_set = crossings(np.tile(grid, (3, 1)), sun_rows)
+
+    planet_grid = np.tile(grid, (len(planets), 1))
+    rise, set_ = crossings(planet_grid, altitude - PLANET_H0)
+    transit_jd, transit_alt = culminations(planet_grid, altitude)
+
+    # Beobachtbar: Planet über min_altitude, Sonne unter sun_limit
+    dark = sun_alt < sun_limit
+    observable = (altitude > min_altitude) & dark[None, :]
+    midnight = start_jd + 0.5
+
+    result = {}
+    for i, name in enumerate(planets):
+        window = _window(grid, observable[i])
+        if window is None:
+            sky = None
+        else:
+            dark_hours = dark.sum() * step_minutes / 60.0
+            hours = (window[1] - window[0]) * 24
+            if dark_hours and hours >= 0.75 * dark_hours:
+                sky = 'Ganze Nacht'
+            elif (window[0] + window[1]) / 2 < midnight:
+                sky = 'Abendhimmel'
+            else:
+                sky = 'Morgenhimmel'
+
+        peak = int(np.argmax(np.where(observable[i], altitude[i], -90)))
+        result[name] = {
+            'altitude': altitude[i],
+            'azimuth': azimuth[i],
+            'rise': float(rise[i]),
+            'set': float(set_[i]),
+            'transit': float(transit_jd[i]),
+            'transit_altitude': float(transit_alt[i]),
+            'elongation': float(ephemeris['elongation'][i, 0]),
+            'window': window,
+            'visible_hours': 0.0 if window is None else (window[1] - window[0]) * 24,
+            'best_altitude': float(altitude[i, peak]) if window else None,
+            'best_azimuth': float(azimuth[i, peak]) if window else None,
+            'sky': sky,
+            'naked_eye': name in NAKED_EYE_PLANETS
+        }
+
+    return {
+        'date': night_date,
+        'times': grid,
+        'sun_altitude': sun_alt,
+        'sunset': float(sun_set[0]),
+        'sunrise': float(sun_rise[0]),
+        'civil_dusk': float(sun_set[1]),
+        'civil_dawn': float(sun_rise[1]),
+        'astronomical_dusk': float(sun_set[2]),
+        'astronomical_dawn': float(sun_rise[2]),
+        'planets': result
+    }
+
+
+def night_visibility(night_date=None, lat=HAMBURG_LAT, lon=HAMBURG_LON, planets=OBSERVABLE_PLANETS,
+                     step_minutes=10, min_altitude=5.0, sun_limit=CIVIL_TWILIGHT):
+    """Topozentrische Sichtbarkeit aller Planeten für eine Nacht (lokaler Mittag bis Mittag)
+
+    Liefert Höhe/Azimut-Tabellen, Auf-/Untergang, Kulmination, Elongation und das
+    Beobachtungsfenster (Planet > min_altitude, Sonne < sun_limit) pro Planet; alle Zeiten als JD.
+    """
+    night_date = night_date or today_local()
+    return _night_visibility(night_date, float(lat), float(lon), tuple(planets),
+                             step_minutes, float(min_altitude), float(sun_limit))
+
+
+def format_time(jd, fmt='%H:%M'):
+    """JD -> lokale Uhrzeit als Text ('—' wenn kein Ereignis)"""
+    moment = to_local_datetime(jd)
+    return moment.strftime(fmt) if moment else '—'
+
+
+def format_window(window):
+    """Beobachtungsfenster als 'HH:MM - HH:MM Uhr'"""
+    if window is None:
+        return 'Nicht sichtbar'
+    return f"{format_time(window[0])} - {format_time(window[1])} Uhr"